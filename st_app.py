@@ -3,14 +3,21 @@
 
 Creates a Streamlit app for visualizing the data generated from the Frequency Response simulations.
 """
+import os
 import re
+import queue
 import zipfile
+import tempfile
+import threading
 import numpy as np
 import pandas as pd
 import streamlit as st
 from io import BytesIO
+from typing import Iterable
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import matplotlib as mpl
-import matplotlib.pyplot as plt
+mpl.use("Agg", force=True)      # Figures are only ever rendered to PNG, so skip any interactive backend
 
 from util import *
 from st_plotting import *
@@ -27,126 +34,242 @@ st.markdown(body=\
     </style> """, unsafe_allow_html=True
 )
 
-def descriptions_as_dict(data_type_axis_description: NamedTuple) -> dict:
+def descriptions_as_dict(dimm_descriptions: Iterable[pd.DataFrame]) -> dict:
     """
+    Returns the description of each DIMM keyed by its name, with the statistic labels as the index.
+
+    ## Parameters
+    - `dimm_descriptions`: The 8 description DataFrames, in DIMM order (e.g. a description NamedTuple).
+    """
+    labels = pd.Index(["mean", "std", "min", "25%", "50%", "75%", "max"], name="")
+    descriptions = {}
+    for i, df in enumerate(dimm_descriptions, start=1):
+        df = df.copy()
+        df.index = labels
+        descriptions[f"DIMM{i}"] = df
+    return descriptions
+
+@st.cache_resource(show_spinner=False)
+def _load_sim(sim_folder: str) -> tuple:
+    """
+    Loads the velocity, acceleration and deformation data, and the modal frequencies, for a simulation folder.
+    Cached per `sim_folder`, so widget interactions don't re-read the data files on every rerun.
+
+    `st.cache_resource` is used rather than `st.cache_data`, since `st.cache_data` would pickle the result and hand
+    every rerun its own unpickled copy of the (large) data arrays. The app never modifies the data, so one shared copy is enough.
+
+    ## Parameters
+    - `sim_folder`: The name of the simulation folder to load the data from, e.g. `"sim12"`.
+    """
+    return (
+        get_velocity_data(sim_folder),
+        get_acceleration_data(sim_folder),
+        get_deformation_data(sim_folder),
+        get_modal_frequencies(sim_folder),
+    )
+
+def build_chart(sim_folder: str, plot_type: str, chart_type: str, data_type: str, axis: str, dimm_number: int, plot_parameters: tuple):
+    """
+    Builds the chart for the current sidebar selections.
+
+    ## Parameters
+    - `sim_folder`: The name of the simulation folder to plot the data from.
+    - `plot_type`: Either `"all"` (all DIMMs) or `"single"` (a single DIMM).
+    - `chart_type`: Either `"line"` or `"bar"`.
+    - `data_type`: Either `"velocity"`, `"acceleration"` or `"deformation"`.
+    - `axis`: Either `"x"`, `"y"`, `"z"` or `"all"`.
+    - `dimm_number`: The DIMM number to plot, if `plot_type` is `"single"`.
+    - `plot_parameters`: The plot parameters as a tuple of `(key, value)` pairs, with any lists converted to tuples so it can be hashed.
+    """
+    velocity_data, acceleration_data, deformation_data, _ = _load_sim(sim_folder)
+    data = {'velocity': velocity_data, 'deformation': deformation_data, 'acceleration': acceleration_data}[data_type]
+    plot_parameters = {k: list(v) if isinstance(v, tuple) else v for k, v in plot_parameters}
+
+    if plot_type == "all":
+        if chart_type == "line":
+            if axis == "all":
+                return subplot_amplitudes_xyz_linear(data, data_type, **plot_parameters)
+            return subplot_amplitudes_linear(getattr(data, axis), data_type, axis, **plot_parameters)
+        elif chart_type == "bar":
+            return plot_peak_amplitudes(getattr(data, axis), data_type, axis)
+
+    elif plot_type == "single":
+        if chart_type == "line":
+            if axis == "all":
+                return plot_amplitude_xyz_linear(data, data_type, dimm_number, **plot_parameters)
+            return plot_amplitude_linear(getattr(getattr(data, axis), f"DIMM{dimm_number}"), data_type, axis, dimm_number, locate_peaks=True, **plot_parameters)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def render_chart(*chart_key) -> bytes | None:
     """
-    return {
-        "DIMM1": pd.concat([pd.DataFrame({"": ["mean", "std", "min", "25%", "50%", "75%", "max"]}), data_type_axis_description.DIMM1], axis=1).set_index(""),
-        "DIMM2": pd.concat([pd.DataFrame({"": ["mean", "std", "min", "25%", "50%", "75%", "max"]}), data_type_axis_description.DIMM2], axis=1).set_index(""),
-        "DIMM3": pd.concat([pd.DataFrame({"": ["mean", "std", "min", "25%", "50%", "75%", "max"]}), data_type_axis_description.DIMM3], axis=1).set_index(""),
-        "DIMM4": pd.concat([pd.DataFrame({"": ["mean", "std", "min", "25%", "50%", "75%", "max"]}), data_type_axis_description.DIMM4], axis=1).set_index(""),
-        "DIMM5": pd.concat([pd.DataFrame({"": ["mean", "std", "min", "25%", "50%", "75%", "max"]}), data_type_axis_description.DIMM5], axis=1).set_index(""),
-        "DIMM6": pd.concat([pd.DataFrame({"": ["mean", "std", "min", "25%", "50%", "75%", "max"]}), data_type_axis_description.DIMM6], axis=1).set_index(""),
-        "DIMM7": pd.concat([pd.DataFrame({"": ["mean", "std", "min", "25%", "50%", "75%", "max"]}), data_type_axis_description.DIMM7], axis=1).set_index(""),
-        "DIMM8": pd.concat([pd.DataFrame({"": ["mean", "std", "min", "25%", "50%", "75%", "max"]}), data_type_axis_description.DIMM8], axis=1).set_index(""),
-    }
+    Builds the chart for the current sidebar selections and renders it to a PNG, the same way `st.pyplot` would.
+    Cached, so reruns with unchanged selections (or going back to earlier ones) just resend the image, rather than redrawing the whole figure.
+
+    ## Parameters
+    - `chart_key`: The arguments to `build_chart`.
+    """
+    fig = build_chart(*chart_key)
+    if fig is None:
+        return None
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=200, bbox_inches='tight')
+    return_figure(fig)      # Only the image is kept, so the figure can be reused for the next chart with the same layout
+    return buffer.getvalue()
+
+def _zip_writer(rendered: queue.Queue, plots_zf: zipfile.ZipFile) -> None:
+    """
+    Writes rendered `(filename, contents)` pairs from a queue into a zip archive, until it receives `None`.
+    The PNGs are rendered uncompressed, so the archive's own (fastest level) deflate is the only compression pass over them,
+    and it runs here rather than in the workers rendering the plots.
+
+    ## Parameters
+    - `rendered`: The queue of rendered files.
+    - `plots_zf`: The open zip archive to write them to.
+    """
+    while (item := rendered.get()) is not None:
+        filename, contents = item
+        plots_zf.writestr(filename, contents)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def build_zip(velocity_data: NamedTuple, deformation_data: NamedTuple, acceleration_data: NamedTuple, plot_parameters: dict, dpi: int = 72, log_plots_as: str = 'png') -> bytes:
+    """
+    Renders all of the plots for an uploaded dataset and returns them as a zip archive.
+    Cached, so reruns with the same uploaded data don't re-render every plot.
+
+    ## Parameters
+    - `velocity_data`: The uploaded velocity data.
+    - `deformation_data`: The uploaded deformation data.
+    - `acceleration_data`: The uploaded acceleration data.
+    - `plot_parameters`: The plot parameters to use for the line plots.
+    - `dpi` (Optional): The resolution to render the plots at.
+    - `log_plots_as` (Optional): The format to save the log-scale subplots as ('png' or 'svg').
+    """
+    # generate plots from the uploaded data, rendering them in parallel worker processes
+    uploaded_data = {"velocity": velocity_data, "deformation": deformation_data, "acceleration": acceleration_data}
+    specs = [
+        (
+            filename, plot_function,
+            (uploaded_data[data_type], data_type) if axis is None else (getattr(uploaded_data[data_type], axis), data_type, axis),
+            {'dpi': dpi} if plot_function is render_peak_bars else plot_parameters, dpi,
+        )
+        for filename, (plot_function, data_type, axis) in zip(_PLOT_FILENAMES, _PLOT_SPECS)
+    ]
+    if log_plots_as == 'svg':
+        specs = [(filename.replace('.png', '.svg') if '/log/' in filename else filename, *spec) for filename, *spec in specs]
+
+    # Each PNG is written into the archive as soon as it's rendered, rather than holding them all in memory first.
+    # The archive itself stays in memory while it's small, and spills over to disk once it grows past 8 MB
+    zip_buffer = tempfile.SpooledTemporaryFile(max_size=8 << 20)
+    # Writing to the archive happens on its own thread, so it overlaps with the workers still rendering plots
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor, zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as plots_zf:
+        rendered = queue.Queue(maxsize=8)
+        writer = threading.Thread(target=_zip_writer, args=(rendered, plots_zf))
+        writer.start()
+        try:
+            # `_PLOT_SPECS` runs in groups of three of the same plot (x, y and z, or one per data type), so each worker task
+            # draws all three on the same pooled figure, only building its axes for the first
+            for result in executor.map(partial(render_file, paletted=True, compress_level=0), specs, chunksize=3):
+                rendered.put(result)
+        finally:
+            rendered.put(None)
+            writer.join()
+    with zip_buffer:
+        zip_buffer.seek(0)
+        return zip_buffer.read()
+
+def read_zip_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> pd.DataFrame:
+    """
+    Reads a single frequency response data file from an uploaded zip archive into a DataFrame.
+
+    ## Parameters
+    - `zf`: The open zip archive.
+    - `info`: The archive member to read.
+    """
+    # `sep=r'\s+'` is special-cased by pandas to the C tokenizer's whitespace fast path
+    # (`delim_whitespace=True` is its removed alias), so no regex splitting happens here.
+    with zf.open(info) as fh:
+        return pd.read_csv(
+            fh, sep=r'\s+', skiprows=1, engine='c',
+            names=['Frequency', 'Amplitude', 'Phase Angle'],
+            dtype={'Frequency': np.float32, 'Amplitude': np.float32, 'Phase Angle': np.float32},
+        )
 
 if 'chart' not in st.session_state:
     st.session_state.chart = None
 if 'data' not in st.session_state:
     st.session_state.data = None
 
-if 'charts' not in st.session_state:
-    st.session_state.charts = {
-        "sim6": {
-            "all": {
-                "line": {
-                    "velocity": {"x": None,"y": None,"z": None,"all": None,},
-                    "deformation": {"x": None,"y": None,"z": None,"all": None,},
-                    "acceleration": {"x": None,"y": None,"z": None,"all": None,},
-                },
-                "bar": {
-                    "velocity": {"x": None,"y": None,"z": None,"all": None,},
-                    "deformation": {"x": None,"y": None,"z": None,"all": None,},
-                    "acceleration": {"x": None,"y": None,"z": None,"all": None,},
-                },
-            },
-        },
-        "sim7": {
-            "all": {
-                "line": {
-                    "velocity": {"x": None,"y": None,"z": None,"all": None,},
-                    "deformation": {"x": None,"y": None,"z": None,"all": None,},
-                    "acceleration": {"x": None,"y": None,"z": None,"all": None,},
-                },
-                "bar": {
-                    "velocity": {"x": None,"y": None,"z": None,"all": None,},
-                    "deformation": {"x": None,"y": None,"z": None,"all": None,},
-                    "acceleration": {"x": None,"y": None,"z": None,"all": None,},
-                },
-            },
-        },
-        "sim8": {
-            "all": {
-                "line": {
-                    "velocity": {"x": None,"y": None,"z": None,"all": None,},
-                    "deformation": {"x": None,"y": None,"z": None,"all": None,},
-                    "acceleration": {"x": None,"y": None,"z": None,"all": None,},
-                },
-                "bar": {
-                    "velocity": {"x": None,"y": None,"z": None,"all": None,},
-                    "deformation": {"x": None,"y": None,"z": None,"all": None,},
-                    "acceleration": {"x": None,"y": None,"z": None,"all": None,},
-                },
-            },
-        },
-        "sim9": {
-            "all": {
-                "line": {
-                    "velocity": {"x": None,"y": None,"z": None,"all": None,},
-                    "deformation": {"x": None,"y": None,"z": None,"all": None,},
-                    "acceleration": {"x": None,"y": None,"z": None,"all": None,},
-                },
-                "bar": {
-                    "velocity": {"x": None,"y": None,"z": None,"all": None,},
-                    "deformation": {"x": None,"y": None,"z": None,"all": None,},
-                    "acceleration": {"x": None,"y": None,"z": None,"all": None,},
-                },
-            },
-        },
-        "sim10": {
-            "all": {
-                "line": {
-                    "velocity": {"x": None,"y": None,"z": None,"all": None,},
-                    "deformation": {"x": None,"y": None,"z": None,"all": None,},
-                    "acceleration": {"x": None,"y": None,"z": None,"all": None,},
-                },
-                "bar": {
-                    "velocity": {"x": None,"y": None,"z": None,"all": None,},
-                    "deformation": {"x": None,"y": None,"z": None,"all": None,},
-                    "acceleration": {"x": None,"y": None,"z": None,"all": None,},
-                },
-            },
-        },
-        "sim11": {
-            "all": {
-                "line": {
-                    "velocity": {"x": None,"y": None,"z": None,"all": None,},
-                    "deformation": {"x": None,"y": None,"z": None,"all": None,},
-                    "acceleration": {"x": None,"y": None,"z": None,"all": None,},
-                },
-                "bar": {
-                    "velocity": {"x": None,"y": None,"z": None,"all": None,},
-                    "deformation": {"x": None,"y": None,"z": None,"all": None,},
-                    "acceleration": {"x": None,"y": None,"z": None,"all": None,},
-                },
-            },
-        },
-        "sim12": {
-            "all": {
-                "line": {
-                    "velocity": {"x": None,"y": None,"z": None,"all": None,},
-                    "deformation": {"x": None,"y": None,"z": None,"all": None,},
-                    "acceleration": {"x": None,"y": None,"z": None,"all": None,},
-                },
-                "bar": {
-                    "velocity": {"x": None,"y": None,"z": None,"all": None,},
-                    "deformation": {"x": None,"y": None,"z": None,"all": None,},
-                    "acceleration": {"x": None,"y": None,"z": None,"all": None,},
-                },
-            },
-        },
-    }
+SIMS = [f"sim{i}" for i in range(6, 19)]
+DATA_TYPES = ("velocity", "deformation", "acceleration")
+AXES = ("x", "y", "z", "all")
+DATA_FILE_PATTERN = re.compile(r'data/(acceleration|deformation|velocity)/.*([xyz])\.txt$')
+MODE_NUMBER_PATTERN = re.compile(r'^\d+\s+')
+# Every plot included in the exported zip, by archive path, and the `(plot_function, data_type, axis)` it's drawn with
+# (an `axis` of None plots all three axes together)
+_PLOT_FILENAMES: tuple[str, ...] = (
+    "plots/velocity/bar/velocity_x_peaks.png",
+    "plots/velocity/bar/velocity_y_peaks.png",
+    "plots/velocity/bar/velocity_z_peaks.png",
+    "plots/deformation/bar/deformation_x_peaks.png",
+    "plots/deformation/bar/deformation_y_peaks.png",
+    "plots/deformation/bar/deformation_z_peaks.png",
+    "plots/acceleration/bar/acceleration_x_peaks.png",
+    "plots/acceleration/bar/acceleration_y_peaks.png",
+    "plots/acceleration/bar/acceleration_z_peaks.png",
+    "plots/velocity/subplots/linear/velocity_x.png",
+    "plots/velocity/subplots/linear/velocity_y.png",
+    "plots/velocity/subplots/linear/velocity_z.png",
+    "plots/deformation/subplots/linear/deformation_x.png",
+    "plots/deformation/subplots/linear/deformation_y.png",
+    "plots/deformation/subplots/linear/deformation_z.png",
+    "plots/acceleration/subplots/linear/acceleration_x.png",
+    "plots/acceleration/subplots/linear/acceleration_y.png",
+    "plots/acceleration/subplots/linear/acceleration_z.png",
+    "plots/velocity/subplots/linear/velocityXYZ.png",
+    "plots/deformation/subplots/linear/deformationXYZ.png",
+    "plots/acceleration/subplots/linear/accelerationXYZ.png",
+    "plots/velocity/subplots/log/velocity_x.png",
+    "plots/velocity/subplots/log/velocity_y.png",
+    "plots/velocity/subplots/log/velocity_z.png",
+    "plots/deformation/subplots/log/deformation_x.png",
+    "plots/deformation/subplots/log/deformation_y.png",
+    "plots/deformation/subplots/log/deformation_z.png",
+    "plots/acceleration/subplots/log/acceleration_x.png",
+    "plots/acceleration/subplots/log/acceleration_y.png",
+    "plots/acceleration/subplots/log/acceleration_z.png",
+)
+_PLOT_SPECS: tuple[tuple, ...] = (
+    (render_peak_bars, "velocity", "x"),
+    (render_peak_bars, "velocity", "y"),
+    (render_peak_bars, "velocity", "z"),
+    (render_peak_bars, "deformation", "x"),
+    (render_peak_bars, "deformation", "y"),
+    (render_peak_bars, "deformation", "z"),
+    (render_peak_bars, "acceleration", "x"),
+    (render_peak_bars, "acceleration", "y"),
+    (render_peak_bars, "acceleration", "z"),
+    (subplot_amplitudes_linear, "velocity", "x"),
+    (subplot_amplitudes_linear, "velocity", "y"),
+    (subplot_amplitudes_linear, "velocity", "z"),
+    (subplot_amplitudes_linear, "deformation", "x"),
+    (subplot_amplitudes_linear, "deformation", "y"),
+    (subplot_amplitudes_linear, "deformation", "z"),
+    (subplot_amplitudes_linear, "acceleration", "x"),
+    (subplot_amplitudes_linear, "acceleration", "y"),
+    (subplot_amplitudes_linear, "acceleration", "z"),
+    (subplot_amplitudes_xyz_linear, "velocity", None),
+    (subplot_amplitudes_xyz_linear, "deformation", None),
+    (subplot_amplitudes_xyz_linear, "acceleration", None),
+    (subplot_amplitudes, "velocity", "x"),
+    (subplot_amplitudes, "velocity", "y"),
+    (subplot_amplitudes, "velocity", "z"),
+    (subplot_amplitudes, "deformation", "x"),
+    (subplot_amplitudes, "deformation", "y"),
+    (subplot_amplitudes, "deformation", "z"),
+    (subplot_amplitudes, "acceleration", "x"),
+    (subplot_amplitudes, "acceleration", "y"),
+    (subplot_amplitudes, "acceleration", "z"),
+)
 
 
 
@@ -161,7 +284,7 @@ st.sidebar.title("Options")
 st.sidebar.markdown("---")
 st.sidebar.markdown("# Simulation Data")
 st.sidebar.write(" ")
-sim_folder = st.sidebar.selectbox("Dataset", options=["sim6", "sim7", "sim8", "sim9", "sim10", "sim11", "sim12", "sim13", "sim14", "sim15", "sim16", "sim17", "sim18"], index=6, key="sim_folder", help="Select the dataset to use for plotting")
+sim_folder = st.sidebar.selectbox("Dataset", options=SIMS, index=6, key="sim_folder", help="Select the dataset to use for plotting")
 st.sidebar.markdown("---")
 
 st.sidebar.markdown("# Plotting")
@@ -216,152 +339,18 @@ st.sidebar.info(body=\
 
 
 
-# Load the data from the selected simulation folder
-velocity_data = get_velocity_data(sim_folder)
-acceleration_data = get_acceleration_data(sim_folder)
-deformation_data = get_deformation_data(sim_folder)
-
-modal_freq = get_modal_frequencies(sim_folder)
+# Load the data from the selected simulation folder (cached across reruns)
+velocity_data, acceleration_data, deformation_data, modal_freq = _load_sim(sim_folder)
 plot_parameters['modal_freq'] = modal_freq
 plot_parameters['locate_modal_freq_with'] = plot_parameters['locate_modal_freq_with'].lower()
 
-all_data = {
-    "velocity": {
-        "x": velocity_data.x,
-        "y": velocity_data.y,
-        "z": velocity_data.z,
-        "1": {
-            "x": velocity_data.x.DIMM1,
-            "y": velocity_data.y.DIMM1,
-            "z": velocity_data.z.DIMM1,
-        },
-        "2": {
-            "x": velocity_data.x.DIMM2,
-            "y": velocity_data.y.DIMM2,
-            "z": velocity_data.z.DIMM2,
-        },
-        "3": {
-            "x": velocity_data.x.DIMM3,
-            "y": velocity_data.y.DIMM3,
-            "z": velocity_data.z.DIMM3,
-        },
-        "4": {
-            "x": velocity_data.x.DIMM4,
-            "y": velocity_data.y.DIMM4,
-            "z": velocity_data.z.DIMM4,
-        },
-        "5": {
-            "x": velocity_data.x.DIMM5,
-            "y": velocity_data.y.DIMM5,
-            "z": velocity_data.z.DIMM5,
-        },
-        "6": {
-            "x": velocity_data.x.DIMM6,
-            "y": velocity_data.y.DIMM6,
-            "z": velocity_data.z.DIMM6,
-        },
-        "7": {
-            "x": velocity_data.x.DIMM7,
-            "y": velocity_data.y.DIMM7,
-            "z": velocity_data.z.DIMM7,
-        },
-        "8": {
-            "x": velocity_data.x.DIMM8,
-            "y": velocity_data.y.DIMM8,
-            "z": velocity_data.z.DIMM8,
-        },
-    },
-    "deformation": {
-        "x": deformation_data.x,
-        "y": deformation_data.y,
-        "z": deformation_data.z,
-        "1": {
-            "x": deformation_data.x.DIMM1,
-            "y": deformation_data.y.DIMM1,
-            "z": deformation_data.z.DIMM1,
-        },
-        "2": {
-            "x": deformation_data.x.DIMM2,
-            "y": deformation_data.y.DIMM2,
-            "z": deformation_data.z.DIMM2,
-        },
-        "3": {
-            "x": deformation_data.x.DIMM3,
-            "y": deformation_data.y.DIMM3,
-            "z": deformation_data.z.DIMM3,
-        },
-        "4": {
-            "x": deformation_data.x.DIMM4,
-            "y": deformation_data.y.DIMM4,
-            "z": deformation_data.z.DIMM4,
-        },
-        "5": {
-            "x": deformation_data.x.DIMM5,
-            "y": deformation_data.y.DIMM5,
-            "z": deformation_data.z.DIMM5,
-        },
-        "6": {
-            "x": deformation_data.x.DIMM6,
-            "y": deformation_data.y.DIMM6,
-            "z": deformation_data.z.DIMM6,
-        },
-        "7": {
-            "x": deformation_data.x.DIMM7,
-            "y": deformation_data.y.DIMM7,
-            "z": deformation_data.z.DIMM7,
-        },
-        "8": {
-            "x": deformation_data.x.DIMM8,
-            "y": deformation_data.y.DIMM8,
-            "z": deformation_data.z.DIMM8,
-        },
-    },
-    "acceleration": {
-        "x": acceleration_data.x,
-        "y": acceleration_data.y,
-        "z": acceleration_data.z,
-        "1": {
-            "x": acceleration_data.x.DIMM1,
-            "y": acceleration_data.y.DIMM1,
-            "z": acceleration_data.z.DIMM1,
-        },
-        "2": {
-            "x": acceleration_data.x.DIMM2,
-            "y": acceleration_data.y.DIMM2,
-            "z": acceleration_data.z.DIMM2,
-        },
-        "3": {
-            "x": acceleration_data.x.DIMM3,
-            "y": acceleration_data.y.DIMM3,
-            "z": acceleration_data.z.DIMM3,
-        },
-        "4": {
-            "x": acceleration_data.x.DIMM4,
-            "y": acceleration_data.y.DIMM4,
-            "z": acceleration_data.z.DIMM4,
-        },
-        "5": {
-            "x": acceleration_data.x.DIMM5,
-            "y": acceleration_data.y.DIMM5,
-            "z": acceleration_data.z.DIMM5,
-        },
-        "6": {
-            "x": acceleration_data.x.DIMM6,
-            "y": acceleration_data.y.DIMM6,
-            "z": acceleration_data.z.DIMM6,
-        },
-        "7": {
-            "x": acceleration_data.x.DIMM7,
-            "y": acceleration_data.y.DIMM7,
-            "z": acceleration_data.z.DIMM7,
-        },
-        "8": {
-            "x": acceleration_data.x.DIMM8,
-            "y": acceleration_data.y.DIMM8,
-            "z": acceleration_data.z.DIMM8,
-        },
-    },
-}
+DATASETS = {"velocity": velocity_data, "deformation": deformation_data, "acceleration": acceleration_data}
+
+def get_axis_df(data_type: str, axis: str) -> NamedTuple:
+    """
+    Returns the data for all DIMMs along a single axis, e.g. `velocity_data.x`.
+    """
+    return getattr(DATASETS[data_type], axis)
 
 
 chart_tab, data_tab, file_upload_tab = st.tabs(["Chart", "Data", "File Upload"])
@@ -369,28 +358,21 @@ chart_tab, data_tab, file_upload_tab = st.tabs(["Chart", "Data", "File Upload"])
 
 
 with chart_tab:
-    # Plot the data
-    if plot_type == "all":
-        if chart_type == "line":
-            if axis == "all":
-                # if st.session_state.charts[sim_folder]["all"]["line"][data_type][axis] is None:
-                #     st.session_state.charts[sim_folder]["all"]["line"][data_type][axis] = subplot_amplitudes_xyz_linear({'velocity': velocity_data, 'deformation': deformation_data, 'acceleration': acceleration_data}[data_type], data_type, **plot_parameters)
-                # st.session_state.chart = st.session_state.charts[sim_folder]["all"]["line"][data_type][axis]
-                st.session_state.chart = subplot_amplitudes_xyz_linear({'velocity': velocity_data, 'deformation': deformation_data, 'acceleration': acceleration_data}[data_type], data_type, **plot_parameters)
-            else:
-                st.session_state.chart = subplot_amplitudes_linear(all_data[data_type][axis], data_type, axis, **plot_parameters)
-        elif chart_type == "bar":
-            st.session_state.chart = plot_peak_amplitudes(all_data[data_type][axis], data_type, axis)
-
-    elif plot_type == "single":
-        if chart_type == "line":
-            if axis == "all":
-                st.session_state.chart = plot_amplitude_xyz_linear({'velocity': velocity_data, 'deformation': deformation_data, 'acceleration': acceleration_data}[data_type], data_type, dimm_number, **plot_parameters)
-            else:
-                st.session_state.chart = plot_amplitude_linear(all_data[data_type][str(dimm_number)][axis], data_type, axis, dimm_number, locate_peaks=True, **plot_parameters)
+    # Only the parameters the selected chart actually uses go into its key, so changing
+    # an unrelated widget (e.g. markers on a bar chart) doesn't rebuild or re-fetch it
+    chart_parameters = {} if chart_type == "bar" else dict(plot_parameters)
+    if not chart_parameters.get('markers') and chart_parameters.get('locate_modal_freq_with') != 'markers':
+        chart_parameters.pop('marker_size', None)
+    chart_key = (
+        sim_folder, plot_type, chart_type, data_type, axis, dimm_number if plot_type == "single" else None,
+        tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in sorted(chart_parameters.items()))
+    )
+    if st.session_state.get("last_chart_key") != chart_key:
+        st.session_state.chart = render_chart(*chart_key)
+        st.session_state.last_chart_key = chart_key
 
     if st.session_state.chart is not None:
-        st.pyplot(st.session_state.chart)
+        st.image(st.session_state.chart, width="stretch")
         st.markdown("---")
 
 
@@ -402,45 +384,20 @@ with data_tab:
     if axis != "all":
         try:
             # Show the data
-            st.session_state.data = all_data[data_type][axis]
-            if data_type in ['velocity', 'deformation']:
-                description = load_dfs_from_description__velocity_deformation(f"{sim_folder}/data/{data_type}_{axis}_description.txt")
-            elif data_type == 'acceleration':
-                description = load_dfs_from_description__acceleration(f"{sim_folder}/data/{data_type}_{axis}_description.txt")
+            st.session_state.data = get_axis_df(data_type, axis)
+            load_description = {
+                'velocity': load_dfs_from_description__velocity_deformation,
+                'deformation': load_dfs_from_description__velocity_deformation,
+                'acceleration': load_dfs_from_description__acceleration,
+            }[data_type]
+            description = load_description(f"{sim_folder}/data/{data_type}_{axis}_description.txt")
 
             with st.expander("Raw Data"):
-                col1, col2 = st.columns(2, gap="large")
-                with col1:
-                    # create a label for the data (DIMM1, DIMM2, etc.) that is centered in the column
-                    st.markdown("<p style='text-align: center; font-size: 1.7rem; font-weight: bold;'>DIMM1</p>", unsafe_allow_html=True)
-                    st.dataframe(st.session_state.data.DIMM1, use_container_width=True)
-                    st.markdown("<p style='text-align: center; font-size: 1.7rem; font-weight: bold;'>DIMM3</p>", unsafe_allow_html=True)
-                    st.dataframe(st.session_state.data.DIMM3, use_container_width=True)
-                    st.markdown("<p style='text-align: center; font-size: 1.7rem; font-weight: bold;'>DIMM5</p>", unsafe_allow_html=True)
-                    st.dataframe(st.session_state.data.DIMM5, use_container_width=True)
-                    st.markdown("<p style='text-align: center; font-size: 1.7rem; font-weight: bold;'>DIMM7</p>", unsafe_allow_html=True)
-                    st.dataframe(st.session_state.data.DIMM7, use_container_width=True)
-                with col2:
-                    st.markdown("<p style='text-align: center; font-size: 1.7rem; font-weight: bold;'>DIMM2</p>", unsafe_allow_html=True)
-                    st.dataframe(st.session_state.data.DIMM2, use_container_width=True)
-                    st.markdown("<p style='text-align: center; font-size: 1.7rem; font-weight: bold;'>DIMM4</p>", unsafe_allow_html=True)
-                    st.dataframe(st.session_state.data.DIMM4, use_container_width=True)
-                    st.markdown("<p style='text-align: center; font-size: 1.7rem; font-weight: bold;'>DIMM6</p>", unsafe_allow_html=True)
-                    st.dataframe(st.session_state.data.DIMM6, use_container_width=True)
-                    st.markdown("<p style='text-align: center; font-size: 1.7rem; font-weight: bold;'>DIMM8</p>", unsafe_allow_html=True)
-                    st.dataframe(st.session_state.data.DIMM8, use_container_width=True)
-            
+                # One wide table (DIMM -> columns) instead of a separate widget per DIMM
+                st.dataframe(pd.concat(dict(zip(st.session_state.data._fields, st.session_state.data)), axis=1), width="stretch")
+
             with st.expander("Data Description"):
-                col1, col2 = st.columns(2, gap="large")
-                descriptions = descriptions_as_dict(description)
-                with col1:
-                    for i in range(1, 8, 2):
-                        st.markdown(f"<p style='text-align: center; font-size: 1.7rem; font-weight: bold;'>DIMM{i}</p>", unsafe_allow_html=True)
-                        st.dataframe(descriptions[f"DIMM{i}"], use_container_width=True)
-                with col2:
-                    for i in range(2, 9, 2):
-                        st.markdown(f"<p style='text-align: center; font-size: 1.7rem; font-weight: bold;'>DIMM{i}</p>", unsafe_allow_html=True)
-                        st.dataframe(descriptions[f"DIMM{i}"], use_container_width=True)
+                st.dataframe(pd.concat(descriptions_as_dict(description), axis=1), width="stretch")
         except:
             pass
 
@@ -449,16 +406,10 @@ with data_tab:
 
 with file_upload_tab:
     # modes_ = []
-    velocity_files_x = []
-    velocity_files_y = []
-    velocity_files_z = []
-    deformation_files_x = []
-    deformation_files_y = []
-    deformation_files_z = []
-    acceleration_files_x = []
-    acceleration_files_y = []
-    acceleration_files_z = []
+    data_files = {(data_type_, axis_): [] for data_type_ in DATA_TYPES for axis_ in "xyz"}
     file = st.file_uploader("Upload a file", type=["zip"])
+    export_resolution = st.radio("Plot Resolution", options=["Preview (72 dpi)", "High (150 dpi)"], index=0, horizontal=True, key="export_resolution", help="Resolution of the plots in the downloaded zip file")
+    log_plots_as = st.radio("Log-Scale Plot Format", options=["PNG", "SVG"], index=0, horizontal=True, key="log_plots_as", help="SVGs are vector images, which are smaller and much faster to create")
     if file is not None:
         with st.spinner("Loading..."):
             with zipfile.ZipFile(file) as zf:
@@ -472,194 +423,47 @@ with file_upload_tab:
                                 else:
                                     modes_.append(line.decode('utf-8').strip())
                             
-                    if 'data/acceleration' in file_info.filename and file_info.filename.endswith('.txt'):
-                        base_folder = file_info.filename.split('/')[0]
-                        if 'x.txt' in file_info.filename:
-                            acceleration_files_x.append(file_info.filename)
-                        elif 'y.txt' in file_info.filename:
-                            acceleration_files_y.append(file_info.filename)
-                        elif 'z.txt' in file_info.filename:
-                            acceleration_files_z.append(file_info.filename)
-                    elif 'data/deformation' in file_info.filename and file_info.filename.endswith('.txt'):
-                        if 'x.txt' in file_info.filename:
-                            deformation_files_x.append(file_info.filename)
-                        elif 'y.txt' in file_info.filename:
-                            deformation_files_y.append(file_info.filename)
-                        elif 'z.txt' in file_info.filename:
-                            deformation_files_z.append(file_info.filename)
-                    elif 'data/velocity' in file_info.filename and file_info.filename.endswith('.txt'):
-                        if 'x.txt' in file_info.filename:
-                            velocity_files_x.append(file_info.filename)
-                        elif 'y.txt' in file_info.filename:
-                            velocity_files_y.append(file_info.filename)
-                        elif 'z.txt' in file_info.filename:
-                            velocity_files_z.append(file_info.filename)
-
-                velocity_dataframes_x = []
-                velocity_dataframes_y = []
-                velocity_dataframes_z = []
-                deformation_dataframes_x = []
-                deformation_dataframes_y = []
-                deformation_dataframes_z = []
-                acceleration_dataframes_x = []
-                acceleration_dataframes_y = []
-                acceleration_dataframes_z = []
-
-                for f in velocity_files_x:
-                    df = pd.read_csv(f, sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-                    velocity_dataframes_x.append(df)
-                for f in velocity_files_y:
-                    df = pd.read_csv(f, sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-                    velocity_dataframes_y.append(df)
-                for f in velocity_files_z:
-                    df = pd.read_csv(f, sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-                    velocity_dataframes_z.append(df)
-
-                Velocity_Data = namedtuple("Velocity_Data", ["x", "y", "z"])
-                Velocity_Data_x = namedtuple("Velocity_Data_x", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-                Velocity_Data_y = namedtuple("Velocity_Data_y", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-                Velocity_Data_z = namedtuple("Velocity_Data_z", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-                vel_data = Velocity_Data(Velocity_Data_x(*velocity_dataframes_x), Velocity_Data_y(*velocity_dataframes_y), Velocity_Data_z(*velocity_dataframes_z))
-
-                for f in deformation_files_x:
-                    df = pd.read_csv(f, sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-                    df['Amplitude'] *= 1e3
-                    deformation_dataframes_x.append(df)
-                for f in deformation_files_y:
-                    df = pd.read_csv(f, sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-                    df['Amplitude'] *= 1e3
-                    deformation_dataframes_y.append(df)
-                for f in deformation_files_z:
-                    df = pd.read_csv(f, sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-                    df['Amplitude'] *= 1e3
-                    deformation_dataframes_z.append(df)
-
-                Deformation_Data = namedtuple("Deformation_Data", ["x", "y", "z"])
-                Deformation_Data_x = namedtuple("Deformation_Data_x", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-                Deformation_Data_y = namedtuple("Deformation_Data_y", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-                Deformation_Data_z = namedtuple("Deformation_Data_z", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-                defo_data = Deformation_Data(Deformation_Data_x(*deformation_dataframes_x), Deformation_Data_y(*deformation_dataframes_y), Deformation_Data_z(*deformation_dataframes_z))
-                
-
-                for f in acceleration_files_x:
-                    df = pd.read_csv(f, sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-                    df.insert(1, 'Amplitude_g', df['Amplitude'] / 9.81)
-                    acceleration_dataframes_x.append(df)
-                for f in acceleration_files_y:
-                    df = pd.read_csv(f, sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-                    df.insert(1, 'Amplitude_g', df['Amplitude'] / 9.81)
-                    acceleration_dataframes_y.append(df)
-                for f in acceleration_files_z:
-                    df = pd.read_csv(f, sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-                    df.insert(1, 'Amplitude_g', df['Amplitude'] / 9.81)
-                    acceleration_dataframes_z.append(df)
-                    
-                Acceleration_Data = namedtuple("Acceleration_Data", ["x", "y", "z"])
-                Acceleration_Data_x = namedtuple("Acceleration_Data_x", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-                Acceleration_Data_y = namedtuple("Acceleration_Data_y", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-                Acceleration_Data_z = namedtuple("Acceleration_Data_z", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-                accel_data = Acceleration_Data(Acceleration_Data_x(*acceleration_dataframes_x), Acceleration_Data_y(*acceleration_dataframes_y), Acceleration_Data_z(*acceleration_dataframes_z))
-                
-
-                new_modes = []
-                for i in range(len(modes_)):
-                    if i > 0:
-                        if i < 10:
-                            new_modes.append(float(modes_[i][2:]))
-                        else:
-                            new_modes.append(float(modes_[i][3:]))
+                    match = DATA_FILE_PATTERN.search(file_info.filename)
+                    if match:
+                        data_files[match.group(1), match.group(2)].append(file_info)
+
+                # Keep the files in DIMM order, regardless of their order in the archive
+                for files in data_files.values():
+                    files.sort(key=lambda info: info.filename)
+
+                # Read all of the data files concurrently, since the C parser releases the GIL
+                with ThreadPoolExecutor() as executor:
+                    pending = {key: executor.map(lambda info: read_zip_member(zf, info), files) for key, files in data_files.items()}
+                    data_frames = {key: list(results) for key, results in pending.items()}
+                # The DataFrames of each data type, as a list of the X, Y and Z DIMM lists
+                axes = {data_type_: [data_frames[data_type_, axis_] for axis_ in "xyz"] for data_type_ in DATA_TYPES}
+
+                # Scale all of the deformation amplitudes (m -> mm) with one numpy op per axis
+                for dataframes in axes['deformation']:
+                    if dataframes:
+                        amplitudes = np.stack([df['Amplitude'].to_numpy() for df in dataframes]) * np.float32(1e3)
+                        for df, amplitude in zip(dataframes, amplitudes):
+                            df['Amplitude'] = amplitude
+
+                # Compute all of the acceleration amplitudes in g with one numpy op per axis
+                for dataframes in axes['acceleration']:
+                    if dataframes:
+                        amplitudes_g = np.stack([df['Amplitude'].to_numpy() for df in dataframes]) / np.float32(9.81)
+                        for df, amplitude_g in zip(dataframes, amplitudes_g):
+                            df.insert(1, 'Amplitude_g', amplitude_g)
+
+                vel_data, defo_data, accel_data = (XYZ_Data._make(map(DIMM_Data._make, axes[data_type_])) for data_type_ in DATA_TYPES)
+
+                # Skip the header line and strip the leading mode number from each row
+                new_modes = np.asarray([MODE_NUMBER_PATTERN.sub('', mode) for mode in modes_[1:]], dtype=float).tolist()
 
                 plot_parameters['modal_freq'] = new_modes
 
-                def get_image(fig_):
-                    savefig = BytesIO()
-                    fig_.savefig(savefig, format='png', dpi=420)
-                    savefig.seek(0)
-                    return savefig
-
-                # generate plot from the uploaded data
-                figs = [
-                    plot_peak_amplitudes(velocity_data.x, 'velocity', 'x'),
-                    plot_peak_amplitudes(velocity_data.y, 'velocity', 'y'),
-                    plot_peak_amplitudes(velocity_data.z, 'velocity', 'z'),
-                    plot_peak_amplitudes(deformation_data.x, 'deformation', 'x'),
-                    plot_peak_amplitudes(deformation_data.y, 'deformation', 'y'),
-                    plot_peak_amplitudes(deformation_data.z, 'deformation', 'z'),
-                    plot_peak_amplitudes(acceleration_data.x, 'acceleration', 'x'),
-                    plot_peak_amplitudes(acceleration_data.y, 'acceleration', 'y'),
-                    plot_peak_amplitudes(acceleration_data.z, 'acceleration', 'z'),
-                    subplot_amplitudes_linear(velocity_data.x, 'velocity', 'x', **plot_parameters),
-                    subplot_amplitudes_linear(velocity_data.y, 'velocity', 'y', **plot_parameters),
-                    subplot_amplitudes_linear(velocity_data.z, 'velocity', 'z', **plot_parameters),
-                    subplot_amplitudes_linear(deformation_data.x, 'deformation', 'x', **plot_parameters),
-                    subplot_amplitudes_linear(deformation_data.y, 'deformation', 'y', **plot_parameters),
-                    subplot_amplitudes_linear(deformation_data.z, 'deformation', 'z', **plot_parameters),
-                    subplot_amplitudes_linear(acceleration_data.x, 'acceleration', 'x', **plot_parameters),
-                    subplot_amplitudes_linear(acceleration_data.y, 'acceleration', 'y', **plot_parameters),
-                    subplot_amplitudes_linear(acceleration_data.z, 'acceleration', 'z', **plot_parameters),
-                    subplot_amplitudes_xyz_linear(velocity_data, 'velocity', **plot_parameters),
-                    subplot_amplitudes_xyz_linear(deformation_data, 'deformation', **plot_parameters),
-                    subplot_amplitudes_xyz_linear(acceleration_data, 'acceleration', **plot_parameters),
-                    subplot_amplitudes(velocity_data.x, 'velocity', 'x', **plot_parameters),
-                    subplot_amplitudes(velocity_data.y, 'velocity', 'y', **plot_parameters),
-                    subplot_amplitudes(velocity_data.z, 'velocity', 'z', **plot_parameters),
-                    subplot_amplitudes(deformation_data.x, 'deformation', 'x', **plot_parameters),
-                    subplot_amplitudes(deformation_data.y, 'deformation', 'y', **plot_parameters),
-                    subplot_amplitudes(deformation_data.z, 'deformation', 'z', **plot_parameters),
-                    subplot_amplitudes(acceleration_data.x, 'acceleration', 'x', **plot_parameters),
-                    subplot_amplitudes(acceleration_data.y, 'acceleration', 'y', **plot_parameters),
-                    subplot_amplitudes(acceleration_data.z, 'acceleration', 'z', **plot_parameters),
-                ]
-                filenames = [
-                    "plots/velocity/bar/velocity_x_peaks.png",
-                    "plots/velocity/bar/velocity_y_peaks.png",
-                    "plots/velocity/bar/velocity_z_peaks.png",
-                    "plots/deformation/bar/deformation_x_peaks.png",
-                    "plots/deformation/bar/deformation_y_peaks.png",
-                    "plots/deformation/bar/deformation_z_peaks.png",
-                    "plots/acceleration/bar/acceleration_x_peaks.png",
-                    "plots/acceleration/bar/acceleration_y_peaks.png",
-                    "plots/acceleration/bar/acceleration_z_peaks.png",
-                    "plots/velocity/subplots/linear/velocity_x.png",
-                    "plots/velocity/subplots/linear/velocity_y.png",
-                    "plots/velocity/subplots/linear/velocity_z.png",
-                    "plots/deformation/subplots/linear/deformation_x.png",
-                    "plots/deformation/subplots/linear/deformation_y.png",
-                    "plots/deformation/subplots/linear/deformation_z.png",
-                    "plots/acceleration/subplots/linear/acceleration_x.png",
-                    "plots/acceleration/subplots/linear/acceleration_y.png",
-                    "plots/acceleration/subplots/linear/acceleration_z.png",
-                    "plots/velocity/subplots/linear/velocityXYZ.png",
-                    "plots/deformation/subplots/linear/deformationXYZ.png",
-                    "plots/acceleration/subplots/linear/accelerationXYZ.png",
-                    "plots/velocity/subplots/log/velocity_x.png",
-                    "plots/velocity/subplots/log/velocity_y.png",
-                    "plots/velocity/subplots/log/velocity_z.png",
-                    "plots/deformation/subplots/log/deformation_x.png",
-                    "plots/deformation/subplots/log/deformation_y.png",
-                    "plots/deformation/subplots/log/deformation_z.png",
-                    "plots/acceleration/subplots/log/acceleration_x.png",
-                    "plots/acceleration/subplots/log/acceleration_y.png",
-                    "plots/acceleration/subplots/log/acceleration_z.png",
-                    "plots/velocity/subplots/log/velocityXYZ.png",
-                    "plots/deformation/subplots/log/deformationXYZ.png",
-                    "plots/acceleration/subplots/log/accelerationXYZ.png",
-                ]
-
-                buffers = []
-                for fig, filename in zip(figs, filenames):
-                    buffers.append({'filename': filename, 'buffer': get_image(fig)})
-
-                zip_buffer = BytesIO()
-                with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-                    for entry in buffers:
-                        entry['buffer'].seek(0)
-                        zf.writestr(entry['filename'], entry['buffer'].read())
-                zip_buffer.seek(0)
+                zip_bytes = build_zip(vel_data, defo_data, accel_data, plot_parameters, dpi={"Preview (72 dpi)": 72, "High (150 dpi)": 150}[export_resolution], log_plots_as=log_plots_as.lower())
 
         st.download_button(
             label="Download Plots",
-            data=zip_buffer,
+            data=zip_bytes,
             file_name=f"plots.zip",
             mime="application/zip",
         )
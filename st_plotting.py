@@ -6,10 +6,24 @@ Plotting functions for Frequency Response simulation data.
 
 import numpy as np
 import pandas as pd
+from functools import lru_cache, partial
 import matplotlib as mpl
-from typing import NamedTuple
+from io import BytesIO
+import os
+from PIL import Image, ImageDraw, ImageFont
+from typing import NamedTuple, Iterable
 import matplotlib.pyplot as plt
-from collections import namedtuple
+from collections import namedtuple, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.lines import Line2D
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# Set here rather than in the app, so they also apply in the process pool workers that render the exported plots
+mpl.rcParams['path.simplify'] = True
+mpl.rcParams['path.simplify_threshold'] = 1.0
+mpl.rcParams['agg.path.chunksize'] = 10000
 
 
 BLUE = "#1f77b4"
@@ -17,6 +31,411 @@ ORANGE = "#ff7f0e"
 GREEN = "#2ca02c"
 RED = "#d62728"
 
+# Lookups shared by all of the plotting functions
+_AMP_KEY = {'velocity': 'Amplitude', 'deformation': 'Amplitude', 'acceleration': 'Amplitude_g'}     # Amplitude column for each data type
+_AMP_UNIT = {'velocity': 'm/s', 'deformation': 'mm', 'acceleration': 'g'}                           # Unit of that amplitude column
+_AMP_LABEL = {data_type: f'Amplitude  ( {unit} )' for data_type, unit in _AMP_UNIT.items()}         # Y-axis label of each data type (plain text, so no mathtext parsing)
+_FREQ_LABEL = 'Frequency  ( Hz )'                                                                   # X-axis label of the frequency response plots
+_AXIS_COLOR = {'x': BLUE, 'y': ORANGE, 'z': GREEN}
+_RASTERIZE_ABOVE = 5000                                                                             # Traces longer than this are rasterized in vector (SVG) output
+_DIMM_GRID_ADJUST = dict(hspace=0.185, wspace=0.155, top=0.910, bottom=0.090, left=0.055, right=0.980)    # Subplot parameters of the 2x4 DIMM grids
+
+# Module-level (so picklable) containers for data passed to `render_png`
+DIMM_Data = namedtuple("DIMM_Data", [f"DIMM{i}" for i in range(1, 9)])
+XYZ_Data = namedtuple("XYZ_Data", ["x", "y", "z"])
+
+
+
+
+
+# Figures that have been rendered and handed back by `render_png`, keyed by their (rows, cols, figsize, adjust), ready to be reused
+_FIGURE_POOL: dict[tuple, list[Figure]] = defaultdict(list)
+
+
+def get_figure(rows: int, cols: int, figsize: tuple, sharex: bool = False, sharey: bool = False, **adjust) -> tuple:
+    """
+    Returns a `(fig, axes)` pair laid out like `Figure.subplots(rows, cols)`, reusing a pooled figure (with its axes cleared) if one is available.
+    Clearing axes is much cheaper than building a new figure, since building the ticks dominates the cost of creating axes.
+
+    ## Parameters
+    - `rows`: Number of rows of subplots.
+    - `cols`: Number of columns of subplots.
+    - `figsize`: Size of the figure in inches.
+    - `sharex` (Optional): If `True`, the subplots share their x-axis, and only the bottom row gets tick labels.
+    - `sharey` (Optional): If `True`, the subplots share their y-axis, and only the left column gets tick labels.
+    - `adjust` (Optional): Subplot parameters, as for `Figure.subplots_adjust`. Only applied when the figure is built,
+        since clearing the axes of a pooled figure leaves them as they were.
+    """
+    key = (rows, cols, figsize, sharex, sharey, tuple(sorted(adjust.items())))
+    if _FIGURE_POOL[key]:
+        fig = _FIGURE_POOL[key].pop()
+        fig.set_dpi(mpl.rcParams['figure.dpi'])
+        for ax in fig.axes:
+            ax.cla()
+        return fig, fig._pool_axes
+    fig = Figure(figsize=figsize, layout='none')     # Fixed subplot parameters, so no layout engine pass on every draw
+    FigureCanvasAgg(fig)
+    fig._pool_axes = fig.subplots(rows, cols, sharex=sharex, sharey=sharey)     # Sharing (and the hidden inner tick labels) survives `cla`
+    fig._pool_key = key
+    if adjust:
+        fig.subplots_adjust(**adjust)
+    return fig, fig._pool_axes
+
+
+
+
+
+def return_figure(fig: Figure) -> None:
+    """
+    Hands a figure created by `get_figure` back to the pool once it's no longer needed, so it can be reused.
+    """
+    if hasattr(fig, '_pool_key'):
+        _FIGURE_POOL[fig._pool_key].append(fig)
+
+
+
+
+
+def _script_figure(rows: int, cols: int, figsize: tuple, show: bool, sharex: bool = False, sharey: bool = False, **adjust) -> tuple:
+    """
+    Returns a `(fig, axes)` pair for the plot functions that save to a file and/or show the plot in a window.
+    Only figures that will be shown go through pyplot (and its interactive backend); save-only figures come from the figure pool,
+    so saving a batch of plots reuses the same figure (and axes) rather than building a new one for each. Pass these to `_release_script_figure` when done.
+
+    ## Parameters
+    - `rows`: Number of rows of subplots.
+    - `cols`: Number of columns of subplots.
+    - `figsize`: Size of the figure in inches.
+    - `show`: Whether the figure will be shown with `plt.show()`.
+    - `sharex` (Optional): If `True`, the subplots share their x-axis.
+    - `sharey` (Optional): If `True`, the subplots share their y-axis.
+    - `adjust` (Optional): Subplot parameters, as for `Figure.subplots_adjust`.
+    """
+    if show:
+        fig, axes = plt.subplots(rows, cols, figsize=figsize, sharex=sharex, sharey=sharey)
+        fig.subplots_adjust(**adjust)
+        return fig, axes
+    return get_figure(rows, cols, figsize, sharex=sharex, sharey=sharey, **adjust)
+
+
+
+
+
+def _release_script_figure(fig: Figure, show: bool) -> None:
+    """
+    Shows and closes a figure from `_script_figure`, or hands it back to the pool if it was only saved.
+    """
+    if show:
+        plt.show()
+        plt.close(fig)
+    else:
+        return_figure(fig)
+
+
+
+
+
+def _plot_columns(df: pd.DataFrame, *columns: str) -> list[np.ndarray]:
+    """
+    Returns the given columns of a DataFrame as float32 arrays, for plotting. float32 is plenty of precision for a plot,
+    and halves the data moved around compared to float64. The DataFrame itself is left as it is.
+
+    ## Parameters
+    - `df`: The DataFrame to take the columns from.
+    - `columns`: Names of the columns (e.g. 'Frequency', 'Amplitude')
+    """
+    return [df[column].to_numpy(dtype=np.float32) for column in columns]
+
+
+
+
+
+def _prepare_amplitude_arrays(data: NamedTuple, amplitude_key: str, minima: bool = True) -> tuple:
+    """
+    Returns the amplitudes of all eight DIMMs as an (8, N) float32 array, followed by the peak index, minimum and maximum amplitude of each DIMM.
+
+    ## Parameters
+    - `data`: NamedTuple containing data for all eight DIMMs.
+    - `amplitude_key`: Name of the amplitude column (e.g. 'Amplitude', 'Amplitude_g')
+    - `minima` (Optional): If `False`, the minimum amplitudes aren't computed (and are returned as `None`), for plots whose axes start at zero.
+    """
+    amplitudes = np.stack([_plot_columns(df, amplitude_key)[0] for df in data])
+    peak_indices = amplitudes.argmax(axis=1)
+    # The maxima are just the values at the peaks, so picking them out saves a second pass over the data
+    return amplitudes, peak_indices, amplitudes.min(axis=1) if minima else None, amplitudes[np.arange(len(amplitudes)), peak_indices]
+
+
+
+
+
+def _peak_amplitudes(data: NamedTuple, amplitude_key: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the index of the (first) peak amplitude of each DIMM, and those peak amplitudes, from the full-precision columns.
+    The float32 arrays of `_prepare_amplitude_arrays` are only precise enough to draw; numbers printed on a plot come from here.
+
+    ## Parameters
+    - `data`: NamedTuple containing data for all eight DIMMs.
+    - `amplitude_key`: Name of the amplitude column (e.g. 'Amplitude', 'Amplitude_g')
+    """
+    columns = [df[amplitude_key].to_numpy() for df in data]
+    peak_indices = np.array([column.argmax() for column in columns])
+    return peak_indices, np.array([column[peak_index] for column, peak_index in zip(columns, peak_indices)])
+
+
+
+
+
+def _closest_indices(frequencies: np.ndarray, modal_freq: np.ndarray) -> np.ndarray:
+    """
+    Returns the index of the closest frequency to each of the modal frequencies.
+    Uses a binary search over the frequencies, rather than scanning all of them once per modal frequency,
+    which relies on frequency columns always being a sweep in ascending order.
+
+    ## Parameters
+    - `frequencies`: The frequencies of the data, in ascending order.
+    - `modal_freq`: The modal frequencies, as a float array.
+    """
+    indices = np.clip(np.searchsorted(frequencies, modal_freq), 1, len(frequencies) - 1)
+    # Step back to the lower neighbour wherever that's at least as close (ties go to the lower frequency, like idxmin did)
+    indices -= np.abs(frequencies[indices - 1] - modal_freq) <= np.abs(frequencies[indices] - modal_freq)
+    return indices
+
+
+def _closest_points(frequencies: np.ndarray, amplitudes: np.ndarray, modal_freq: list) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the modal frequencies, and the amplitude at the closest frequency to each of them, for marking them on a plot.
+
+    ## Parameters
+    - `frequencies`: The frequencies of the data, in ascending order.
+    - `amplitudes`: The amplitudes at each frequency.
+    - `modal_freq`: The modal frequencies.
+    """
+    modal_freq = np.asarray(modal_freq, dtype=float)
+    return modal_freq, amplitudes[_closest_indices(frequencies, modal_freq)]
+
+
+def _modal_amplitudes(data: NamedTuple, amplitudes: np.ndarray, modal_freq: list) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the modal frequencies, and a (D, M) array of each DataFrame's amplitude at the closest frequency to each of them,
+    or `None` and a `None` per DataFrame if there are no modal frequencies.
+    The DIMMs (and axes) of a simulation share one frequency sweep, in which case the search is only done once and the amplitudes picked out with one fancy index.
+
+    ## Parameters
+    - `data`: The D DataFrames (e.g. NamedTuple containing data for all eight DIMMs).
+    - `amplitudes`: Their amplitudes, as a (D, N) array (see `_prepare_amplitude_arrays`).
+    - `modal_freq`: The modal frequencies, or `None`.
+    """
+    if modal_freq is None:
+        return None, (None,) * len(data)
+    modal_freq = np.asarray(modal_freq, dtype=float)
+    frequencies = [df['Frequency'].to_numpy() for df in data]
+    if all(np.array_equal(frequencies[0], f) for f in frequencies[1:]):
+        return modal_freq, amplitudes[:, _closest_indices(frequencies[0], modal_freq)]
+    return modal_freq, np.stack([a[_closest_indices(f, modal_freq)] for f, a in zip(frequencies, amplitudes)])
+
+
+
+
+
+def _decimate(x: np.ndarray, y: np.ndarray, max_points: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduces a line to at most ~`max_points` points by keeping the minimum and maximum of each bucket of points (a min/max envelope),
+    so peaks are preserved. Lines that are already short enough are returned unchanged.
+
+    ## Parameters
+    - `x`: The x values of the line.
+    - `y`: The y values of the line.
+    - `max_points`: The maximum number of points to keep, e.g. twice the width of the plot in pixels.
+    """
+    n = len(y)
+    if n <= max_points:
+        return x, y
+    n_buckets = max(max_points // 2, 1)
+    bucket_size = -(-n // n_buckets)
+    buckets = np.pad(np.asarray(y), (0, bucket_size * n_buckets - n), mode='edge').reshape(n_buckets, bucket_size)
+    offsets = np.arange(n_buckets) * bucket_size
+    keep = np.unique(np.minimum(np.concatenate([offsets + buckets.argmin(axis=1), offsets + buckets.argmax(axis=1), [0, n - 1]]), n - 1))
+    return np.asarray(x)[keep], np.asarray(y)[keep]
+
+
+
+
+
+# Per-call drawing options shared by all eight DIMM subplots, built once per figure and handed to `_draw_dimm`
+_DimmStyle = namedtuple("_DimmStyle", [
+    "color", "markers", "marker_size", "linewidth", "fill", "fill_alpha", "ylim", "log_scale", "max_points",
+    "locate_peaks", "modal_freq", "locate_modal_freq_with", "modal_linewidth",
+])
+
+
+
+
+
+def _draw_dimm(ax: plt.Axes, freqs: np.ndarray, amps: np.ndarray, peak_index: int, modal_amps: np.ndarray, cfg: _DimmStyle) -> None:
+    """
+    Draws one DIMM's amplitude curve, with its peak lines, fill and modal frequency markers, onto a subplot.
+
+    ## Parameters
+    - `ax`: The axes to draw on.
+    - `freqs`: Frequencies of the DIMM's data, in ascending order.
+    - `amps`: Amplitudes of the DIMM's data.
+    - `peak_index`: Index of the largest amplitude in `amps`.
+    - `modal_amps`: The DIMM's amplitude at each of `cfg.modal_freq` (see `_modal_amplitudes`), or `None` if there are none.
+    - `cfg`: Drawing options shared by every DIMM in the figure.
+    """
+    min_amplitude, max_amplitude = cfg.ylim
+    if cfg.log_scale:
+        ax.set_yscale('log')
+    if cfg.markers or cfg.max_points is None:     # Every point gets a marker, so the line can't be decimated, and is drawn by the same Line2D as the markers
+        frequencies, amplitudes = freqs, amps
+    else:
+        frequencies, amplitudes = _decimate(freqs, amps, cfg.max_points)
+    ax.plot(frequencies, amplitudes, '-o' if cfg.markers else '-', color=cfg.color, linewidth=cfg.linewidth, markersize=cfg.marker_size, markeredgewidth=0.5, rasterized=len(frequencies) > _RASTERIZE_ABOVE)
+    ax.set_ylim(min_amplitude, max_amplitude)
+    ax.set_xlim(freqs[0], freqs[-1])     # Frequency sweeps are ascending, so their ends are their bounds
+    if cfg.locate_peaks:
+        max_amplitude_frequency = freqs[peak_index]
+        max_amplitude_value = amps[peak_index]
+        ax.hlines(max_amplitude_value, freqs[0], max_amplitude_frequency, linestyles='dotted', colors='black', linewidth=0.5)
+        ax.vlines(max_amplitude_frequency, min_amplitude, max_amplitude_value, linestyles='dotted', colors='black', linewidth=0.5)
+    if cfg.fill:
+        _fill_under(ax, frequencies, amplitudes, cfg.color, cfg.fill_alpha)
+    if cfg.modal_freq is not None:
+        if cfg.locate_modal_freq_with == 'lines':
+            _modal_lines(ax, cfg.modal_freq, cfg.modal_linewidth)
+        if not cfg.markers and cfg.locate_modal_freq_with == 'markers':
+            ax.plot(cfg.modal_freq, modal_amps, 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=cfg.color)
+
+
+
+
+
+def _label_dimm_axes(axes: np.ndarray, data_type: str, shared: bool = False) -> None:
+    """
+    Titles each of the eight DIMM subplots and labels the outer axes of the 2x4 grid.
+
+    ## Parameters
+    - `axes`: 2x4 array of the DIMM subplots.
+    - `data_type`: Type of data being plotted (e.g. 'velocity', 'deformation', 'acceleration')
+    - `shared` (Optional): If `True` (the subplots share their axes), the grid gets one figure-level label per axis instead of one per outer subplot.
+    """
+    for i, ax in enumerate(axes.flat):
+        ax.set_title(f"DIMM{i+1}", fontsize=10)
+    if shared:
+        fig = axes.flat[0].figure
+        fig.supxlabel(_FREQ_LABEL, fontsize=11, fontweight='bold')
+        fig.supylabel(_AMP_LABEL[data_type], fontsize=11, fontweight='bold')
+        return
+    for ax in axes[1]:
+        ax.set_xlabel(_FREQ_LABEL, fontsize=11, labelpad=15, fontweight='bold')
+    for ax in axes[:, 0]:
+        ax.set_ylabel(_AMP_LABEL[data_type], fontsize=11, labelpad=10, fontweight='bold')
+
+
+
+
+
+def _draw_xyz_dimms(
+        axes: np.ndarray, data: NamedTuple, amplitude_key: str, markers: bool, modal_freq: list, locate_modal_freq_with: str, marker_size: float, log_scale: bool,
+        rasterize_lines: bool = True) -> None:
+    """
+    Draws the X, Y and Z responses of all eight DIMMs onto a 2x4 grid of subplots, with their modal frequency markers or lines.
+    The amplitudes of all 24 lines are stacked into one (3, 8, N) array, so the limits and modal markers come from a few array operations rather than one per DataFrame.
+
+    ## Parameters
+    - `axes`: 2x4 array of the DIMM subplots, sharing their x and y axes.
+    - `data`: NamedTuple containing the X, Y and Z data for all eight DIMMs.
+    - `amplitude_key`: Name of the amplitude column (e.g. 'Amplitude', 'Amplitude_g')
+    - `markers`: If `True`, markers will be added to the lines.
+    - `modal_freq`: The modal frequencies, or `None`.
+    - `locate_modal_freq_with`: How the modal frequencies are marked ('markers' or 'lines').
+    - `marker_size`: Size of the markers.
+    - `log_scale`: If `True`, the amplitude axes are log-scaled.
+    - `rasterize_lines` (Optional): If `True`, lines longer than `_RASTERIZE_ABOVE` points are rasterized in vector output.
+    """
+    xyz_amplitudes = np.stack([[_plot_columns(df, amplitude_key)[0] for df in dimms] for dimms in data])
+    min_amplitude, max_amplitude = xyz_amplitudes.min() * 0.8, xyz_amplitudes.max() * 1.2     # One reduction each over the whole buffer
+    xyz_frequencies = [[_plot_columns(df, 'Frequency')[0] for df in dimms] for dimms in data]
+    colors = (BLUE, ORANGE, GREEN)
+    rasterized = rasterize_lines and len(xyz_frequencies[0][0]) > _RASTERIZE_ABOVE
+    for i, ax in enumerate(axes.flat):
+        if log_scale:
+            ax.set_yscale('log')
+        lines = [(frequencies[i], amplitudes[i]) for frequencies, amplitudes in zip(xyz_frequencies, xyz_amplitudes)]
+        # Draw the X, Y and Z responses as one collection, rather than as three separate lines (unless they have markers)
+        if markers:     # Markers have to be drawn by a Line2D, which can draw the line along with them
+            for (freqs, amps), color in zip(lines, colors):
+                ax.plot(
+                    freqs, amps, '-o', color=color, alpha=0.8,
+                    markersize=marker_size, markerfacecolor=color, markeredgewidth=0.5, markeredgecolor=color, rasterized=rasterized)
+        else:
+            ax.add_collection(LineCollection([np.column_stack(line) for line in lines], colors=list(colors), alpha=0.8, rasterized=rasterized))
+        if modal_freq is not None and locate_modal_freq_with == 'lines':
+            _modal_lines(ax, modal_freq, 0.5)
+    # The subplots share their axes, so the limits are set once for the whole grid (the sweep is ascending, so its ends are the x limits)
+    frequencies = xyz_frequencies[0][0]
+    axes.flat[0].set_xlim(frequencies[0], frequencies[-1])
+    axes.flat[0].set_ylim(min_amplitude, max_amplitude)
+    if modal_freq is not None and not markers and locate_modal_freq_with == 'markers':
+        # One search for all 24 lines, which share a frequency sweep, then (24, M) -> one (3, M) array of the X, Y and Z marker amplitudes per DIMM
+        modal_freqs, modal_amplitudes = _modal_amplitudes([*data.x, *data.y, *data.z], xyz_amplitudes.reshape(-1, xyz_amplitudes.shape[-1]), modal_freq)
+        for ax, modal_amps in zip(axes.flat, modal_amplitudes.reshape(3, len(axes.flat), -1).swapaxes(0, 1)):
+            _modal_rings(ax, modal_freqs, modal_amps, colors)
+
+
+
+
+
+def _modal_rings(ax: plt.Axes, modal_freqs: np.ndarray, modal_amplitudes: np.ndarray, colors: tuple) -> None:
+    """
+    Marks the modal frequencies on several lines with hollow rings, drawn as one scatter collection rather than a `Line2D` per line.
+
+    ## Parameters
+    - `ax`: The axes to draw on.
+    - `modal_freqs`: The M modal frequencies.
+    - `modal_amplitudes`: Each line's amplitude at the modal frequencies, as a (len(colors), M) array.
+    - `colors`: Colour of each line, used for the edges of its rings.
+    """
+    ax.scatter(
+        np.tile(modal_freqs, len(colors)), np.ravel(modal_amplitudes), s=25,
+        facecolors='none', edgecolors=np.repeat(colors, len(modal_freqs)), linewidths=1, zorder=2)    # Drawn over the lines, like the markers of a Line2D would be
+
+
+
+
+
+def _modal_lines(ax: plt.Axes, modal_freq: list, linewidth: float) -> None:
+    """
+    Marks the modal frequencies with dotted vertical lines spanning the whole height of the axes, like `ax.axvline` would,
+    but drawn as one `LineCollection` rather than a `Line2D` per modal frequency.
+
+    ## Parameters
+    - `ax`: The axes to draw on.
+    - `modal_freq`: The modal frequencies.
+    - `linewidth`: Width of the lines.
+    """
+    ax.vlines(modal_freq, 0, 1, transform=ax.get_xaxis_transform(), colors='black', linestyles='dotted', linewidth=linewidth)
+
+
+
+
+
+def _fill_under(ax: plt.Axes, x: np.ndarray, y: np.ndarray, color: str, alpha: float) -> None:
+    """
+    Fills the area between a line and zero, like `ax.fill_between(x, y)`, but adds the polygon directly as a `PolyCollection`,
+    skipping the interpolation, `where` and NaN handling that `fill_between` does and isn't needed here.
+
+    ## Parameters
+    - `ax`: The axes to fill on.
+    - `x`: The x values of the line.
+    - `y`: The y values of the line.
+    - `color`: Colour of the fill.
+    - `alpha`: Opacity of the fill.
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    vertices = np.column_stack([np.concatenate([x, x[::-1]]), np.concatenate([y, np.zeros_like(y)])])
+    ax.add_collection(PolyCollection([vertices], facecolors=color, edgecolors='none', alpha=alpha), autolim=False)
+
 
 
 
@@ -39,39 +458,34 @@ def plot_amplitude_linear(data: pd.DataFrame, data_type: str, axis: str, dimm_nu
         with markers. If `lines`, the modal frequencies will be marked with vertical lines.
     - `marker_size` (Optional): Size of the markers used to mark data points.
     """
-    color = {'x': BLUE, 'y': ORANGE, 'z': GREEN}[axis]
+    color = _AXIS_COLOR[axis]
     locate_modal_freq_with = locate_modal_freq_with.lower()
-    amplitude_key = {'velocity': 'Amplitude', 'deformation': 'Amplitude', 'acceleration': 'Amplitude_g'}[data_type]
-    min_amplitude = min(data[amplitude_key]) * 0.8
-    max_amplitude = max(data[amplitude_key]) * 1.1
-    fig, ax = plt.subplots(figsize=(12, 8))
+    amplitude_key = _AMP_KEY[data_type]
+    freqs, amps = _plot_columns(data, 'Frequency', amplitude_key)
+    min_amplitude, max_amplitude = amps.min(), amps.max()
+    min_amplitude, max_amplitude = min_amplitude * 0.8, max_amplitude * 1.1
+    fig, ax = get_figure(1, 1, figsize=(12, 8))
     fig.suptitle(f"DIMM {dimm_number} - {data_type.title()} Frequency Response ({axis.title()})", fontweight='bold')
     # ax.set_yscale('log')    # Not needed, this is linear
-    ax.plot(data['Frequency'], data[amplitude_key], color=color)
-    if markers:
-        # color = ax.get_lines()[0].get_color()
-        ax.plot(data['Frequency'], data[amplitude_key], 'o', color=color, markersize=marker_size, markerfacecolor=color, markeredgewidth=0.5, markeredgecolor=color)
+    # Markers (if any) are drawn by the same Line2D as the line itself
+    ax.plot(freqs, amps, '-o' if markers else '-', color=color, markersize=marker_size, markeredgewidth=0.5, rasterized=len(freqs) > _RASTERIZE_ABOVE)
     ax.set_ylim(min_amplitude, max_amplitude)
-    ax.set_xlim(min(data['Frequency']), max(data['Frequency']))
+    ax.set_xlim(freqs[0], freqs[-1])     # Frequency sweeps are ascending, so their ends are their bounds
     if locate_peaks:
-        max_amplitude_index = data[amplitude_key].idxmax()
-        max_amplitude_frequency = data['Frequency'][max_amplitude_index]
-        max_amplitude_value = data[amplitude_key][max_amplitude_index]
-        ax.hlines(max_amplitude_value, min(data['Frequency']), max_amplitude_frequency, linestyles='dotted', colors='black', linewidth=1.5)
+        max_amplitude_index = amps.argmax()
+        max_amplitude_frequency = freqs[max_amplitude_index]
+        max_amplitude_value = amps[max_amplitude_index]
+        ax.hlines(max_amplitude_value, freqs[0], max_amplitude_frequency, linestyles='dotted', colors='black', linewidth=1.5)
     if fill:
         # color = ax.get_lines()[0].get_color()
-        ax.fill_between(data['Frequency'], data[amplitude_key], color=color, alpha=0.1)
+        _fill_under(ax, freqs, amps, color, 0.1)
     if modal_freq is not None:
-        for freq in modal_freq:
-            if locate_modal_freq_with == 'lines':
-                ax.axvline(freq, color='black', linestyle='dotted', linewidth=1.3)
-            if not markers and locate_modal_freq_with == 'markers':
-                closest_index = (np.abs(data['Frequency'] - freq)).idxmin()
-                closest_amplitude = data[amplitude_key][closest_index]
-                ax.plot(freq, closest_amplitude, 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=color)
-    ax.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    amplitude_unit = {'velocity': 'm/s', 'deformation': 'mm', 'acceleration': 'g'}[data_type]
-    ax.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=11, labelpad=10, fontweight='bold')
+        if locate_modal_freq_with == 'lines':
+            _modal_lines(ax, modal_freq, 1.3)
+        if not markers and locate_modal_freq_with == 'markers':
+            ax.plot(*_closest_points(freqs, amps, modal_freq), 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=color)
+    ax.set_xlabel(_FREQ_LABEL, fontsize=11, labelpad=15, fontweight='bold')
+    ax.set_ylabel(_AMP_LABEL[data_type], fontsize=11, labelpad=10, fontweight='bold')
     return fig    # This can be shown on the Streamlit app using st.pyplot(fig) instead of plt.show()
 
 
@@ -92,48 +506,40 @@ def plot_amplitude_xyz_linear(
     - `marker_size` (Optional): Size of the markers used to mark the modal frequencies.
     """
     locate_modal_freq_with = locate_modal_freq_with.lower()
-    amplitude_key = {'velocity': 'Amplitude', 'deformation': 'Amplitude', 'acceleration': 'Amplitude_g'}[data_type]
+    amplitude_key = _AMP_KEY[data_type]
     
     data_x = data.x[dimm_number-1]  # DataFrame
     data_y = data.y[dimm_number-1]  # DataFrame
     data_z = data.z[dimm_number-1]  # DataFrame
 
-    min_amplitude = min(min(data_x[amplitude_key]), min(data_y[amplitude_key]), min(data_z[amplitude_key])) * 0.8
-    max_amplitude = max(max(data_x[amplitude_key]), max(data_y[amplitude_key]), max(data_z[amplitude_key])) * 1.1
+    # Frequency and amplitude arrays of the X, Y and Z data, extracted once up front
+    xyz_frequencies, xyz_amplitudes = zip(*(_plot_columns(df, 'Frequency', amplitude_key) for df in (data_x, data_y, data_z)))
+    xyz_amplitudes = np.stack(xyz_amplitudes)
 
-    fig, ax = plt.subplots(figsize=(12, 8))
-    fig.suptitle(f"DIMM {dimm_number} - {data_type.title()} Frequency Response (X,Y,Z)", fontweight='bold')
+    min_amplitude, max_amplitude = xyz_amplitudes.min() * 0.8, xyz_amplitudes.max() * 1.1
 
-    ax.plot(data_x['Frequency'], data_x[amplitude_key], label='X', color=BLUE, alpha=0.8)
-    ax.plot(data_y['Frequency'], data_y[amplitude_key], label='Y', color=ORANGE, alpha=0.8)
-    ax.plot(data_z['Frequency'], data_z[amplitude_key], label='Z', color=GREEN, alpha=0.8)
+    fig, ax = get_figure(1, 1, figsize=(12, 8))
+    fig.suptitle(f"DIMM {dimm_number} - {data_type.title()} Frequency Response (X,Y,Z)", fontweight='bold')
 
-    if markers:
-        ax.plot(data_x['Frequency'], data_x[amplitude_key], 'o', color=BLUE, markersize=marker_size, markerfacecolor=BLUE, markeredgewidth=0.5, markeredgecolor=BLUE)
-        ax.plot(data_y['Frequency'], data_y[amplitude_key], 'o', color=ORANGE, markersize=marker_size, markerfacecolor=ORANGE, markeredgewidth=0.5, markeredgecolor=ORANGE)
-        ax.plot(data_z['Frequency'], data_z[amplitude_key], 'o', color=GREEN, markersize=marker_size, markerfacecolor=GREEN, markeredgewidth=0.5, markeredgecolor=GREEN)
+    # Markers (if any) are drawn by the same Line2D as each line
+    for freqs, amps, label, color in zip(xyz_frequencies, xyz_amplitudes, ('X', 'Y', 'Z'), (BLUE, ORANGE, GREEN)):
+        ax.plot(
+            freqs, amps, '-o' if markers else '-', label=label, color=color, alpha=0.8,
+            markersize=marker_size, markerfacecolor=color, markeredgewidth=0.5, markeredgecolor=color, rasterized=len(freqs) > _RASTERIZE_ABOVE)
 
     ax.set_ylim(min_amplitude, max_amplitude)
-    ax.set_xlim(min(data_x['Frequency']), max(data_x['Frequency']))
+    ax.set_xlim(xyz_frequencies[0][0], xyz_frequencies[0][-1])     # Frequency sweeps are ascending, so their ends are their bounds
 
     if modal_freq is not None:
-        for freq in modal_freq:
-            if locate_modal_freq_with == 'lines':
-                ax.axvline(freq, color='black', linestyle='dotted', linewidth=1.3)
-            if not markers and locate_modal_freq_with == 'markers':
-                closest_index = (np.abs(data_x['Frequency'] - freq)).idxmin()
-                closest_amplitude = data_x[amplitude_key][closest_index]
-                ax.plot(freq, closest_amplitude, 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=BLUE)
-                closest_index = (np.abs(data_y['Frequency'] - freq)).idxmin()
-                closest_amplitude = data_y[amplitude_key][closest_index]
-                ax.plot(freq, closest_amplitude, 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=ORANGE)
-                closest_index = (np.abs(data_z['Frequency'] - freq)).idxmin()
-                closest_amplitude = data_z[amplitude_key][closest_index]
-                ax.plot(freq, closest_amplitude, 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=GREEN)
-
-    ax.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    amplitude_unit = {'velocity': 'm/s', 'deformation': 'mm', 'acceleration': 'g'}[data_type]
-    ax.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=11, labelpad=10, fontweight='bold')
+        if locate_modal_freq_with == 'lines':
+            _modal_lines(ax, modal_freq, 1.3)
+        if not markers and locate_modal_freq_with == 'markers':
+            # The three axes share a frequency sweep, so the closest frequencies are only searched for once
+            modal_freqs, modal_amplitudes = _modal_amplitudes((data_x, data_y, data_z), xyz_amplitudes, modal_freq)
+            _modal_rings(ax, modal_freqs, modal_amplitudes, (BLUE, ORANGE, GREEN))
+
+    ax.set_xlabel(_FREQ_LABEL, fontsize=11, labelpad=15, fontweight='bold')
+    ax.set_ylabel(_AMP_LABEL[data_type], fontsize=11, labelpad=10, fontweight='bold')
     ax.legend(loc='best', fontsize=10)
     return fig
 
@@ -164,52 +570,21 @@ def subplot_amplitudes(
     - `dpi` (Optional): DPI of the saved image. Only applies if `save_as` is given.
     - `show` (Optional): If True, the plot will be shown. Only applies if `save_as` is given, otherwise the plot will always be shown.
     """
-    color = {'x': BLUE, 'y': ORANGE, 'z': GREEN}[axis]
-    amplitude_key = {'velocity': 'Amplitude', 'deformation': 'Amplitude', 'acceleration': 'Amplitude_g'}[data_type]
-    df1, df2, df3, df4, df5, df6, df7, df8 = data
-    min_amplitude = min(min(df1[amplitude_key]), min(df2[amplitude_key]), min(df3[amplitude_key]), min(df4[amplitude_key]), min(df5[amplitude_key]), min(df6[amplitude_key]), min(df7[amplitude_key]), min(df8[amplitude_key])) * 0.8
-    max_amplitude = max(max(df1[amplitude_key]), max(df2[amplitude_key]), max(df3[amplitude_key]), max(df4[amplitude_key]), max(df5[amplitude_key]), max(df6[amplitude_key]), max(df7[amplitude_key]), max(df8[amplitude_key])) * 1.1
-    fig, ((ax1, ax2, ax3, ax4), (ax5, ax6, ax7, ax8)) = plt.subplots(2, 4, figsize=(18, 9))
+    color = _AXIS_COLOR[axis]
+    amplitude_key = _AMP_KEY[data_type]
+    dimm_amplitudes, peak_indices, dimm_min_amplitudes, dimm_max_amplitudes = _prepare_amplitude_arrays(data, amplitude_key)
+    min_amplitude = dimm_min_amplitudes.min() * 0.8
+    max_amplitude = dimm_max_amplitudes.max() * 1.1
+    fig, axes = get_figure(2, 4, figsize=(18, 9), **_DIMM_GRID_ADJUST)
     fig.suptitle(f"{data_type.title()} Frequency Response ({axis.title()})", fontweight='bold')
-    fig.subplots_adjust(hspace=0.185, wspace=0.155, top=0.910, bottom=0.090, left=0.055, right=0.980)
-    for ax, df in zip([ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8], [df1, df2, df3, df4, df5, df6, df7, df8]):
-        ax.set_yscale('log')
-        ax.plot(df['Frequency'], df[amplitude_key], color=color)
-        if markers:
-            # color = ax.get_lines()[0].get_color()
-            ax.plot(df['Frequency'], df[amplitude_key], 'o', color=color, markersize=marker_size, markerfacecolor=color, markeredgewidth=0.5, markeredgecolor=color)
-        ax.set_ylim(min_amplitude, max_amplitude)
-        ax.set_xlim(min(df['Frequency']), max(df['Frequency']))
-        if locate_peaks:
-            max_amplitude_index = df[amplitude_key].idxmax()
-            max_amplitude_frequency = df['Frequency'][max_amplitude_index]
-            max_amplitude_value = df[amplitude_key][max_amplitude_index]
-            ax.hlines(max_amplitude_value, min(df['Frequency']), max_amplitude_frequency, linestyles='dotted', colors='black', linewidth=0.5)
-            max_amplitude_index = df[amplitude_key].idxmax()
-            max_amplitude_frequency = df['Frequency'][max_amplitude_index]
-            max_amplitude_value = df[amplitude_key][max_amplitude_index]
-            ax.vlines(max_amplitude_frequency, min_amplitude, max_amplitude_value, linestyles='dotted', colors='black', linewidth=0.5)
-        if fill:
-            # color = ax.get_lines()[0].get_color()
-            ax.fill_between(df['Frequency'], df[amplitude_key], color=color, alpha=0.1)
-        if modal_freq is not None:
-            for freq in modal_freq:
-                if locate_modal_freq_with == 'lines':
-                    ax.axvline(freq, color='black', linestyle='dotted', linewidth=0.5)
-                if not markers and locate_modal_freq_with == 'markers':
-                    closest_index = (np.abs(df['Frequency'] - freq)).idxmin()
-                    closest_amplitude = df[amplitude_key][closest_index]
-                    ax.plot(freq, closest_amplitude, 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=color)
-    for i, ax in enumerate([ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8]):
-        ax.set_title(f"DIMM{i+1}", fontsize=10)
-    ax5.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax6.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax7.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax8.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    amplitude_unit = {'velocity': 'm/s', 'deformation': 'mm', 'acceleration': 'g'}[data_type]
-    # amplitude_unit = {'velocity': 'mm/s', 'deformation': 'mm', 'acceleration': 'mm/s²'}[data_type]
-    ax1.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=11, labelpad=10, fontweight='bold')
-    ax5.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=11, labelpad=10, fontweight='bold')
+    modal_freq, modal_amplitudes = _modal_amplitudes(data, dimm_amplitudes, modal_freq)
+    cfg = _DimmStyle(
+        color=color, markers=markers, marker_size=marker_size, linewidth=None, fill=fill, fill_alpha=0.1, ylim=(min_amplitude, max_amplitude),
+        log_scale=True, max_points=int(fig.get_figwidth() * fig.dpi * 2), locate_peaks=locate_peaks, modal_freq=modal_freq,
+        locate_modal_freq_with=locate_modal_freq_with, modal_linewidth=0.5)
+    for ax, df, dimm_amplitude, peak_index, modal_amps in zip(axes.flat, data, dimm_amplitudes, peak_indices, modal_amplitudes):
+        _draw_dimm(ax, _plot_columns(df, 'Frequency')[0], dimm_amplitude, peak_index, modal_amps, cfg)
+    _label_dimm_axes(axes, data_type)
     return fig
 
 
@@ -234,52 +609,21 @@ def subplot_amplitudes_linear(
     - `marker_size` (Optional): Size of the markers.
     """
     locate_modal_freq_with = locate_modal_freq_with.lower()
-    color = {'x': BLUE, 'y': ORANGE, 'z': GREEN}[axis]
-    amplitude_key = {'velocity': 'Amplitude', 'deformation': 'Amplitude', 'acceleration': 'Amplitude_g'}[data_type]
-    df1, df2, df3, df4, df5, df6, df7, df8 = data
+    color = _AXIS_COLOR[axis]
+    amplitude_key = _AMP_KEY[data_type]
+    dimm_amplitudes, peak_indices, _, dimm_max_amplitudes = _prepare_amplitude_arrays(data, amplitude_key, minima=False)
     min_amplitude = 0
-    max_amplitude = max(max(df1[amplitude_key]), max(df2[amplitude_key]), max(df3[amplitude_key]), max(df4[amplitude_key]), max(df5[amplitude_key]), max(df6[amplitude_key]), max(df7[amplitude_key]), max(df8[amplitude_key])) * 1.1
-    fig, ((ax1, ax2, ax3, ax4), (ax5, ax6, ax7, ax8)) = plt.subplots(2, 4, figsize=(18, 9))
+    max_amplitude = dimm_max_amplitudes.max() * 1.1
+    fig, axes = get_figure(2, 4, figsize=(18, 9), **_DIMM_GRID_ADJUST)
     fig.suptitle(f"{data_type.title()} Frequency Response ({axis.title()})", fontweight='bold')
-    fig.subplots_adjust(hspace=0.185, wspace=0.155, top=0.910, bottom=0.090, left=0.055, right=0.980)
-    for ax, df in zip([ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8], [df1, df2, df3, df4, df5, df6, df7, df8]):
-        ax.plot(df['Frequency'], df[amplitude_key], color=color)
-        if markers:
-            # color = ax.get_lines()[0].get_color()
-            ax.plot(df['Frequency'], df[amplitude_key], 'o', color=color, markersize=marker_size, markerfacecolor=color, markeredgewidth=0.5, markeredgecolor=color)
-        ax.set_ylim(min_amplitude, max_amplitude)
-        ax.set_xlim(min(df['Frequency']), max(df['Frequency']))
-        if locate_peaks:
-            max_amplitude_index = df[amplitude_key].idxmax()
-            max_amplitude_frequency = df['Frequency'][max_amplitude_index]
-            max_amplitude_value = df[amplitude_key][max_amplitude_index]
-            ax.hlines(max_amplitude_value, min(df['Frequency']), max_amplitude_frequency, linestyles='dotted', colors='black', linewidth=0.5)
-            max_amplitude_index = df[amplitude_key].idxmax()
-            max_amplitude_frequency = df['Frequency'][max_amplitude_index]
-            max_amplitude_value = df[amplitude_key][max_amplitude_index]
-            ax.vlines(max_amplitude_frequency, min_amplitude, max_amplitude_value, linestyles='dotted', colors='black', linewidth=0.5)
-        if fill:
-            # color = ax.get_lines()[0].get_color()
-            ax.fill_between(df['Frequency'], df[amplitude_key], color=color, alpha=0.15)
-        if modal_freq is not None:
-            # ax.text(0.5, 0.5, str(modal_freq), transform=ax.transAxes)
-            for freq in modal_freq:
-                if locate_modal_freq_with == 'lines':
-                    ax.axvline(freq, color='black', linestyle='dotted', linewidth=1.3)
-                if not markers and locate_modal_freq_with == 'markers':
-                    closest_index = (np.abs(df['Frequency'] - freq)).idxmin()
-                    closest_amplitude = df[amplitude_key][closest_index]
-                    ax.plot(freq, closest_amplitude, 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=color)
-    for i, ax in enumerate([ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8]):
-        ax.set_title(f"DIMM{i+1}", fontsize=10)
-    ax5.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax6.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax7.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax8.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    # amplitude_unit = {'velocity': 'm/s', 'deformation': 'mm', 'acceleration': 'm/s²'}[data_type]
-    amplitude_unit = {'velocity': 'm/s', 'deformation': 'mm', 'acceleration': 'g'}[data_type]
-    ax1.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=11, labelpad=10, fontweight='bold')
-    ax5.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=11, labelpad=10, fontweight='bold')
+    modal_freq, modal_amplitudes = _modal_amplitudes(data, dimm_amplitudes, modal_freq)
+    cfg = _DimmStyle(
+        color=color, markers=markers, marker_size=marker_size, linewidth=None, fill=fill, fill_alpha=0.15, ylim=(min_amplitude, max_amplitude),
+        log_scale=False, max_points=None, locate_peaks=locate_peaks, modal_freq=modal_freq,
+        locate_modal_freq_with=locate_modal_freq_with, modal_linewidth=1.3)
+    for ax, df, dimm_amplitude, peak_index, modal_amps in zip(axes.flat, data, dimm_amplitudes, peak_indices, modal_amplitudes):
+        _draw_dimm(ax, _plot_columns(df, 'Frequency')[0], dimm_amplitude, peak_index, modal_amps, cfg)
+    _label_dimm_axes(axes, data_type)
     return fig    # This can be shown on the Streamlit app using st.pyplot(fig) instead of plt.show()
 
 
@@ -289,7 +633,7 @@ def subplot_amplitudes_linear(
 
 def subplot_amplitudes_linear_with_phaseangle(
         data: NamedTuple, data_type: str, axis: str, markers: bool = False, fill: bool = False, save_as: str = None, 
-        modal_freq: list = None, locate_peaks: bool = False, locate_modal_freq_with: str = 'markers', marker_size: float = 3.) -> None:
+        modal_freq: list = None, locate_peaks: bool = False, locate_modal_freq_with: str = 'markers', marker_size: float = 3., dpi: int = 200) -> Figure:
     """
     Plots amplitude data for all DIMMs. (4x2 subplots), and their phase shift on a second y-axis.
 
@@ -304,76 +648,49 @@ def subplot_amplitudes_linear_with_phaseangle(
     - `locate_peaks` (Optional): If `True`, the peaks will be marked with dotted lines.
     - `locate_modal_freq_with` (Optional): If `markers`, the modal frequencies will be marked with markers. If `lines`, the modal frequencies will be marked with vertical lines.
     - `marker_size` (Optional): Size of the markers.
+    - `dpi` (Optional): DPI of the saved image. Only applies if `save_as` is given.
     """
     # fig, (ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8) = plt.subplots(2, 4, figsize=(18, 9), sharex=True, sharey=True)
-    color = {'x': BLUE, 'y': ORANGE, 'z': GREEN}[axis]
-    amplitude_key = {'velocity': 'Amplitude', 'deformation': 'Amplitude', 'acceleration': 'Amplitude_g'}[data_type]
+    color = _AXIS_COLOR[axis]
+    amplitude_key = _AMP_KEY[data_type]
     phaseshift_key = "Phase Angle"
-    df1, df2, df3, df4, df5, df6, df7, df8 = data
+    dimm_amplitudes, peak_indices, _, dimm_max_amplitudes = _prepare_amplitude_arrays(data, amplitude_key, minima=False)
     min_amplitude = 0
-    max_amplitude = max(max(df1[amplitude_key]), max(df2[amplitude_key]), max(df3[amplitude_key]), max(df4[amplitude_key]), max(df5[amplitude_key]), max(df6[amplitude_key]), max(df7[amplitude_key]), max(df8[amplitude_key])) * 1.1
+    max_amplitude = dimm_max_amplitudes.max() * 1.1
     min_phaseshift = -180
     max_phaseshift = 180
-    fig, ((ax1, ax2, ax3, ax4), (ax5, ax6, ax7, ax8)) = plt.subplots(2, 4, figsize=(18, 9))
+    # Not taken from the figure pool, since the twin axes added below would pile up on a reused figure
+    fig = Figure(figsize=(18, 9), layout='none')
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(2, 4)
     fig.suptitle(f"{data_type.title()} Frequency Response ({axis.title()})", fontweight='bold')
-    fig.subplots_adjust(hspace=0.185, wspace=0.155, top=0.910, bottom=0.090, left=0.055, right=0.980)
-    for ax, df in zip([ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8], [df1, df2, df3, df4, df5, df6, df7, df8]):
+    fig.subplots_adjust(**_DIMM_GRID_ADJUST)
+    modal_freq, modal_amplitudes = _modal_amplitudes(data, dimm_amplitudes, modal_freq)
+    cfg = _DimmStyle(
+        color=color, markers=markers, marker_size=marker_size, linewidth=1.5, fill=fill, fill_alpha=0.05, ylim=(min_amplitude, max_amplitude),
+        log_scale=False, max_points=None, locate_peaks=locate_peaks, modal_freq=modal_freq,
+        locate_modal_freq_with=locate_modal_freq_with, modal_linewidth=0.5)
+    for ax, df, amps, peak_index, modal_amps in zip(axes.flat, data, dimm_amplitudes, peak_indices, modal_amplitudes):
+        freqs, phaseshifts = _plot_columns(df, 'Frequency', phaseshift_key)
         # plot amplitude on left y-axis
-        ax.plot(df['Frequency'], df[amplitude_key], color=color, linewidth=1.5)
+        _draw_dimm(ax, freqs, amps, peak_index, modal_amps, cfg)
         # plot phase shift on right y-axis
-        ax2 = ax.twinx()
-        max_phaseshift_value = max(df[phaseshift_key])
-        max_phaseshift_scaled = max_phaseshift_value / 5
-        ax2.plot(df['Frequency'], df[phaseshift_key].apply(lambda x: x/5 + 175-max_phaseshift_scaled), color=RED, linewidth=1, alpha=0.75)
-        ax2.set_ylim(min_phaseshift, max_phaseshift)
+        phase_ax = ax.twinx()
+        max_phaseshift_scaled = phaseshifts.max() / 5
+        phase_ax.plot(freqs, phaseshifts / 5 + (175 - max_phaseshift_scaled), color=RED, linewidth=1, alpha=0.75, rasterized=len(freqs) > _RASTERIZE_ABOVE)
+        phase_ax.set_ylim(min_phaseshift, max_phaseshift)
         # ax2.set_ylabel(f'Phase Shift  ( $°$ )', fontsize=11, labelpad=10, fontweight='bold', color=RED)
         # set the ticks for the right y-axis to be only 0 and 180
-        ax2.set_yticks([-180, 180])
+        phase_ax.set_yticks([-180, 180])
         # disable the tick labels
-        ax2.set_yticklabels([])
-        ax2.set_xlim(min(df['Frequency']), max(df['Frequency']))
-
-        if markers:
-            # color = ax.get_lines()[0].get_color()
-            ax.plot(df['Frequency'], df[amplitude_key], 'o', color=color, markersize=marker_size, markerfacecolor=color, markeredgewidth=0.5, markeredgecolor=color)
-        ax.set_ylim(min_amplitude, max_amplitude)
-        ax.set_xlim(min(df['Frequency']), max(df['Frequency']))
-        if locate_peaks:
-            max_amplitude_index = df[amplitude_key].idxmax()
-            max_amplitude_frequency = df['Frequency'][max_amplitude_index]
-            max_amplitude_value = df[amplitude_key][max_amplitude_index]
-            ax.hlines(max_amplitude_value, min(df['Frequency']), max_amplitude_frequency, linestyles='dotted', colors='black', linewidth=0.5)
-            max_amplitude_index = df[amplitude_key].idxmax()
-            max_amplitude_frequency = df['Frequency'][max_amplitude_index]
-            max_amplitude_value = df[amplitude_key][max_amplitude_index]
-            ax.vlines(max_amplitude_frequency, min_amplitude, max_amplitude_value, linestyles='dotted', colors='black', linewidth=0.5)
-        if fill:
-            # color = ax.get_lines()[0].get_color()
-            ax.fill_between(df['Frequency'], df[amplitude_key], color=color, alpha=0.05)
-        if modal_freq is not None:
-            for freq in modal_freq:
-                if locate_modal_freq_with == 'lines':
-                    ax.axvline(freq, color='black', linestyle='dotted', linewidth=0.5)
-                if not markers and locate_modal_freq_with == 'markers':
-                    closest_index = (np.abs(df['Frequency'] - freq)).idxmin()
-                    closest_amplitude = df[amplitude_key][closest_index]
-                    ax.plot(freq, closest_amplitude, 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=color)
-    for i, ax in enumerate([ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8]):
-        ax.set_title(f"DIMM{i+1}", fontsize=10)
-    ax5.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax6.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax7.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax8.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    # amplitude_unit = {'velocity': 'm/s', 'deformation': 'mm', 'acceleration': 'm/s²'}[data_type]
-    amplitude_unit = {'velocity': 'm/s', 'deformation': 'mm', 'acceleration': 'g'}[data_type]
-    ax1.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=11, labelpad=10, fontweight='bold')
-    ax5.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=11, labelpad=10, fontweight='bold')
+        phase_ax.set_yticklabels([])
+        phase_ax.set_xlim(freqs[0], freqs[-1])     # Frequency sweeps are ascending, so their ends are their bounds
+    _label_dimm_axes(axes, data_type)
     if save_as is not None:
         if '.png' not in save_as:
             save_as = save_as + '.png'
-        plt.savefig(save_as, dpi=900)
-    plt.show()
-    plt.close()
+        fig.savefig(save_as, dpi=dpi)
+    return fig
     
 
 
@@ -383,7 +700,8 @@ def subplot_amplitudes_linear_with_phaseangle(
 
 def subplot_amplitudes_xyz(
         data: NamedTuple, data_type: str, markers: bool = False, fill: bool = False, save_as: str = None, modal_freq: list = None, 
-        locate_peaks: bool = False, locate_modal_freq_with: str = 'markers', marker_size: float = 3., dpi: int = 600, show: bool = False) -> None:
+        locate_peaks: bool = False, locate_modal_freq_with: str = 'markers', marker_size: float = 3., dpi: int = 600, show: bool = False,
+        rasterize_lines: bool = True) -> None:
     """
     Plots amplitude data for all DIMMs. (4x2 subplots).
 
@@ -397,83 +715,20 @@ def subplot_amplitudes_xyz(
     - `marker_size` (Optional): Size of the markers used to locate the modal frequencies.
     - `dpi` (Optional): DPI of the saved image. Only applies if `save_as` is given.
     - `show` (Optional): If True, the plot will be shown. Only applies if `save_as` is given, otherwise the plot will always be shown.
+    - `rasterize_lines` (Optional): If `True`, very long lines are rasterized when saving to a vector format. Pass `False` to keep them as vector paths.
     """
-    amplitude_key = {'velocity': 'Amplitude', 'deformation': 'Amplitude', 'acceleration': 'Amplitude_g'}[data_type]
-    df1x, df2x, df3x, df4x, df5x, df6x, df7x, df8x = data.x
-    df1y, df2y, df3y, df4y, df5y, df6y, df7y, df8y = data.y
-    df1z, df2z, df3z, df4z, df5z, df6z, df7z, df8z = data.z
-    min_amplitude = min(
-        min(df1x[amplitude_key]), min(df2x[amplitude_key]), min(df3x[amplitude_key]), min(df4x[amplitude_key]), min(df5x[amplitude_key]), min(df6x[amplitude_key]), min(df7x[amplitude_key]), min(df8x[amplitude_key]),
-        min(df1y[amplitude_key]), min(df2y[amplitude_key]), min(df3y[amplitude_key]), min(df4y[amplitude_key]), min(df5y[amplitude_key]), min(df6y[amplitude_key]), min(df7y[amplitude_key]), min(df8y[amplitude_key]),
-        min(df1z[amplitude_key]), min(df2z[amplitude_key]), min(df3z[amplitude_key]), min(df4z[amplitude_key]), min(df5z[amplitude_key]), min(df6z[amplitude_key]), min(df7z[amplitude_key]), min(df8z[amplitude_key]),
-    ) * 0.8
-    max_amplitude = max(
-        max(df1x[amplitude_key]), max(df2x[amplitude_key]), max(df3x[amplitude_key]), max(df4x[amplitude_key]), max(df5x[amplitude_key]), max(df6x[amplitude_key]), max(df7x[amplitude_key]), max(df8x[amplitude_key]),
-        max(df1y[amplitude_key]), max(df2y[amplitude_key]), max(df3y[amplitude_key]), max(df4y[amplitude_key]), max(df5y[amplitude_key]), max(df6y[amplitude_key]), max(df7y[amplitude_key]), max(df8y[amplitude_key]),
-        max(df1z[amplitude_key]), max(df2z[amplitude_key]), max(df3z[amplitude_key]), max(df4z[amplitude_key]), max(df5z[amplitude_key]), max(df6z[amplitude_key]), max(df7z[amplitude_key]), max(df8z[amplitude_key]),
-    ) * 1.2
-    fig, ((ax1, ax2, ax3, ax4), (ax5, ax6, ax7, ax8)) = plt.subplots(2, 4, figsize=(18, 9))
+    amplitude_key = _AMP_KEY[data_type]
+    show = show or save_as is None     # The plot is always shown if it isn't saved
+    fig, axes = _script_figure(2, 4, figsize=(18, 9), show=show, sharex=True, sharey=True, **_DIMM_GRID_ADJUST)
     fig.suptitle(f"{data_type.title()} Frequency Response", fontweight='bold')
-    fig.subplots_adjust(hspace=0.185, wspace=0.155, top=0.910, bottom=0.090, left=0.055, right=0.980)
-    for ax, df in zip([ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8], [df1x, df2x, df3x, df4x, df5x, df6x, df7x, df8x]):
-        ax.set_yscale('log')
-        ax.plot(df['Frequency'], df[amplitude_key], label='X', color=BLUE, alpha=0.8)
-        if markers:
-            ax.plot(df['Frequency'], df[amplitude_key], 'o', color=BLUE, markersize=marker_size, markerfacecolor=BLUE, markeredgewidth=0.5, markeredgecolor=BLUE)
-        if modal_freq is not None:
-            for freq in modal_freq:
-                if locate_modal_freq_with == 'lines':
-                    ax.axvline(freq, color='black', linestyle='dotted', linewidth=0.5)
-                if not markers and locate_modal_freq_with == 'markers':
-                    closest_index = (np.abs(df['Frequency'] - freq)).idxmin()
-                    closest_amplitude = df[amplitude_key][closest_index]
-                    ax.plot(freq, closest_amplitude, 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=BLUE)
-        ax.set_xlim(min(df['Frequency']), max(df['Frequency']))
-        ax.set_ylim(min_amplitude, max_amplitude)
-    for ax, df in zip([ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8], [df1y, df2y, df3y, df4y, df5y, df6y, df7y, df8y]):
-        ax.plot(df['Frequency'], df[amplitude_key], label='Y', color=ORANGE, alpha=0.8)
-        if markers:
-            ax.plot(df['Frequency'], df[amplitude_key], 'o', color=ORANGE, markersize=marker_size, markerfacecolor=ORANGE, markeredgewidth=0.5, markeredgecolor=ORANGE)
-        if modal_freq is not None:
-            for freq in modal_freq:
-                # if locate_modal_freq_with == 'lines':
-                #     ax.axvline(freq, color='black', linestyle='dotted', linewidth=0.5)
-                if not markers and locate_modal_freq_with == 'markers':
-                    closest_index = (np.abs(df['Frequency'] - freq)).idxmin()
-                    closest_amplitude = df[amplitude_key][closest_index]
-                    ax.plot(freq, closest_amplitude, 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=ORANGE)
-    for ax, df in zip([ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8], [df1z, df2z, df3z, df4z, df5z, df6z, df7z, df8z]):
-        ax.plot(df['Frequency'], df[amplitude_key], label='Z', color=GREEN, alpha=0.8)
-        if markers:
-            ax.plot(df['Frequency'], df[amplitude_key], 'o', color=GREEN, markersize=marker_size, markerfacecolor=GREEN, markeredgewidth=0.5, markeredgecolor=GREEN)
-        if modal_freq is not None:
-            for freq in modal_freq:
-                # if locate_modal_freq_with == 'lines':
-                #     ax.axvline(freq, color='black', linestyle='dotted', linewidth=0.5)
-                if not markers and locate_modal_freq_with == 'markers':
-                    closest_index = (np.abs(df['Frequency'] - freq)).idxmin()
-                    closest_amplitude = df[amplitude_key][closest_index]
-                    ax.plot(freq, closest_amplitude, 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=GREEN)
-    for i, ax in enumerate([ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8]):
-        ax.set_title(f"DIMM{i+1}", fontsize=10)
-    ax1.legend(loc='best', fontsize=10)
-    ax5.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax6.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax7.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax8.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    amplitude_unit = {'velocity': 'm/s', 'deformation': 'mm', 'acceleration': 'g'}[data_type]
-    # amplitude_unit = {'velocity': 'mm/s', 'deformation': 'mm', 'acceleration': 'mm/s²'}[data_type]
-    ax1.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=11, labelpad=10, fontweight='bold')
-    ax5.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=11, labelpad=10, fontweight='bold')
+    _draw_xyz_dimms(axes, data, amplitude_key, markers, modal_freq, locate_modal_freq_with, marker_size, log_scale=True, rasterize_lines=rasterize_lines)
+    _label_dimm_axes(axes, data_type, shared=True)
+    axes[0, 0].legend(handles=[Line2D([], [], color=color, alpha=0.8, label=label) for color, label in ((BLUE, 'X'), (ORANGE, 'Y'), (GREEN, 'Z'))], loc='best', fontsize=10)
     if save_as is not None:
         if '.png' not in save_as:
             save_as = save_as + '.png'
-        plt.savefig(save_as, dpi=dpi)
-    else:
-        show = True
-    if show:
-        plt.show()
-    plt.close()
+        fig.savefig(save_as, dpi=dpi)
+    _release_script_figure(fig, show)
 
 
 
@@ -481,7 +736,7 @@ def subplot_amplitudes_xyz(
 
 def subplot_amplitudes_xyz_linear(
         data: NamedTuple, data_type: str, markers: bool = False, fill: bool = False, modal_freq: list = None, 
-        locate_peaks: bool = False, locate_modal_freq_with: str = 'markers', marker_size: float = 3.) -> None:
+        locate_peaks: bool = False, locate_modal_freq_with: str = 'markers', marker_size: float = 3., rasterize_lines: bool = True) -> None:
     """
     Plots amplitude data for all DIMMs. (4x2 subplots).
 
@@ -492,73 +747,14 @@ def subplot_amplitudes_xyz_linear(
     - `locate_peaks` (Optional): If True, the plot will show the peaks of the amplitude data as vertical lines.
     - `locate_modal_freq_with` (Optional): If provided, the modal frequencies will be marked with the given method.
     - `marker_size` (Optional): Size of the markers used to mark the modal frequencies.
+    - `rasterize_lines` (Optional): If `True`, very long lines are rasterized when saving to a vector format. Pass `False` to keep them as vector paths.
     """
-    amplitude_key = {'velocity': 'Amplitude', 'deformation': 'Amplitude', 'acceleration': 'Amplitude_g'}[data_type]
-    df1x, df2x, df3x, df4x, df5x, df6x, df7x, df8x = data.x
-    df1y, df2y, df3y, df4y, df5y, df6y, df7y, df8y = data.y
-    df1z, df2z, df3z, df4z, df5z, df6z, df7z, df8z = data.z
-    min_amplitude = min(
-        min(df1x[amplitude_key]), min(df2x[amplitude_key]), min(df3x[amplitude_key]), min(df4x[amplitude_key]), min(df5x[amplitude_key]), min(df6x[amplitude_key]), min(df7x[amplitude_key]), min(df8x[amplitude_key]),
-        min(df1y[amplitude_key]), min(df2y[amplitude_key]), min(df3y[amplitude_key]), min(df4y[amplitude_key]), min(df5y[amplitude_key]), min(df6y[amplitude_key]), min(df7y[amplitude_key]), min(df8y[amplitude_key]),
-        min(df1z[amplitude_key]), min(df2z[amplitude_key]), min(df3z[amplitude_key]), min(df4z[amplitude_key]), min(df5z[amplitude_key]), min(df6z[amplitude_key]), min(df7z[amplitude_key]), min(df8z[amplitude_key]),
-    ) * 0.8
-    max_amplitude = max(
-        max(df1x[amplitude_key]), max(df2x[amplitude_key]), max(df3x[amplitude_key]), max(df4x[amplitude_key]), max(df5x[amplitude_key]), max(df6x[amplitude_key]), max(df7x[amplitude_key]), max(df8x[amplitude_key]),
-        max(df1y[amplitude_key]), max(df2y[amplitude_key]), max(df3y[amplitude_key]), max(df4y[amplitude_key]), max(df5y[amplitude_key]), max(df6y[amplitude_key]), max(df7y[amplitude_key]), max(df8y[amplitude_key]),
-        max(df1z[amplitude_key]), max(df2z[amplitude_key]), max(df3z[amplitude_key]), max(df4z[amplitude_key]), max(df5z[amplitude_key]), max(df6z[amplitude_key]), max(df7z[amplitude_key]), max(df8z[amplitude_key]),
-    ) * 1.2
-    fig, ((ax1, ax2, ax3, ax4), (ax5, ax6, ax7, ax8)) = plt.subplots(2, 4, figsize=(18, 9))
+    amplitude_key = _AMP_KEY[data_type]
+    fig, axes = get_figure(2, 4, figsize=(18, 9), sharex=True, sharey=True, **_DIMM_GRID_ADJUST)
     fig.suptitle(f"{data_type.title()} Frequency Response", fontweight='bold')
-    fig.subplots_adjust(hspace=0.185, wspace=0.155, top=0.910, bottom=0.090, left=0.055, right=0.980)
-    for ax, df in zip([ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8], [df1x, df2x, df3x, df4x, df5x, df6x, df7x, df8x]):
-        ax.plot(df['Frequency'], df[amplitude_key], label='X', color=BLUE, alpha=0.8)
-        if markers:
-            ax.plot(df['Frequency'], df[amplitude_key], 'o', color=BLUE, markersize=marker_size, markerfacecolor=BLUE, markeredgewidth=0.5, markeredgecolor=BLUE)
-        if modal_freq is not None:
-            for freq in modal_freq:
-                if locate_modal_freq_with == 'lines':
-                    ax.axvline(freq, color='black', linestyle='dotted', linewidth=0.5)
-                if not markers and locate_modal_freq_with == 'markers':
-                    closest_index = (np.abs(df['Frequency'] - freq)).idxmin()
-                    closest_amplitude = df[amplitude_key][closest_index]
-                    ax.plot(freq, closest_amplitude, 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=BLUE)
-        ax.set_xlim(min(df['Frequency']), max(df['Frequency']))
-        ax.set_ylim(min_amplitude, max_amplitude)
-    for ax, df in zip([ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8], [df1y, df2y, df3y, df4y, df5y, df6y, df7y, df8y]):
-        ax.plot(df['Frequency'], df[amplitude_key], label='Y', color=ORANGE, alpha=0.8)
-        if markers:
-            ax.plot(df['Frequency'], df[amplitude_key], 'o', color=ORANGE, markersize=marker_size, markerfacecolor=ORANGE, markeredgewidth=0.5, markeredgecolor=ORANGE)
-        if modal_freq is not None:
-            for freq in modal_freq:
-                # if locate_modal_freq_with == 'lines':
-                #     ax.axvline(freq, color='black', linestyle='dotted', linewidth=0.5)
-                if not markers and locate_modal_freq_with == 'markers':
-                    closest_index = (np.abs(df['Frequency'] - freq)).idxmin()
-                    closest_amplitude = df[amplitude_key][closest_index]
-                    ax.plot(freq, closest_amplitude, 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=ORANGE)
-    for ax, df in zip([ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8], [df1z, df2z, df3z, df4z, df5z, df6z, df7z, df8z]):
-        ax.plot(df['Frequency'], df[amplitude_key], label='Z', color=GREEN, alpha=0.8)
-        if markers:
-            ax.plot(df['Frequency'], df[amplitude_key], 'o', color=GREEN, markersize=marker_size, markerfacecolor=GREEN, markeredgewidth=0.5, markeredgecolor=GREEN)
-        if modal_freq is not None:
-            for freq in modal_freq:
-                # if locate_modal_freq_with == 'lines':
-                #     ax.axvline(freq, color='black', linestyle='dotted', linewidth=0.5)
-                if not markers and locate_modal_freq_with == 'markers':
-                    closest_index = (np.abs(df['Frequency'] - freq)).idxmin()
-                    closest_amplitude = df[amplitude_key][closest_index]
-                    ax.plot(freq, closest_amplitude, 'o', color='black', markersize=5, markerfacecolor=(1,1,1,0), markeredgewidth=1, markeredgecolor=GREEN)
-    for i, ax in enumerate([ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8]):
-        ax.set_title(f"DIMM{i+1}", fontsize=10)
-    ax1.legend(loc='best', fontsize=10)
-    ax5.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax6.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax7.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    ax8.set_xlabel('Frequency  ( $Hz$ )', fontsize=11, labelpad=15, fontweight='bold')
-    amplitude_unit = {'velocity': 'm/s', 'deformation': 'mm', 'acceleration': 'g'}[data_type]
-    # amplitude_unit = {'velocity': 'mm/s', 'deformation': 'mm', 'acceleration': 'mm/s²'}[data_type]
-    ax1.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=11, labelpad=10, fontweight='bold')
-    ax5.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=11, labelpad=10, fontweight='bold')
+    _draw_xyz_dimms(axes, data, amplitude_key, markers, modal_freq, locate_modal_freq_with, marker_size, log_scale=False, rasterize_lines=rasterize_lines)
+    _label_dimm_axes(axes, data_type, shared=True)
+    axes[0, 0].legend(handles=[Line2D([], [], color=color, alpha=0.8, label=label) for color, label in ((BLUE, 'X'), (ORANGE, 'Y'), (GREEN, 'Z'))], loc='best', fontsize=10)
     return fig
 
 
@@ -629,36 +825,31 @@ def plot_peak_amplitudes(data: NamedTuple, data_type: str, axis: str) -> None:
     - `data_type`: Type of data contained in the `data` NamedTuple (e.g. 'velocity', 'deformation', 'acceleration')
     - `axis`: Axis of the data contained in the `data` NamedTuple (e.g. 'x', 'y', 'z')
     """
-    amplitude_key = {'velocity': 'Amplitude', 'deformation': 'Amplitude', 'acceleration': 'Amplitude_g'}[data_type]
-    fig, ax = plt.subplots(figsize=(10, 8))
-    fig.subplots_adjust(top=0.890, bottom=0.130, left=0.115, right=0.930)
-    df1, df2, df3, df4, df5, df6, df7, df8 = data
+    amplitude_key = _AMP_KEY[data_type]
+    fig, ax = get_figure(1, 1, figsize=(10, 8), top=0.890, bottom=0.130, left=0.115, right=0.930)
+    peak_indices, peak_amplitudes = _peak_amplitudes(data, amplitude_key)
+    peak_frequencies = [df['Frequency'].to_numpy()[peak_index] for df, peak_index in zip(data, peak_indices)]
     ax.bar(
         [1, 2, 3, 4, 5, 6, 7, 8], 
-        [max(df1[amplitude_key]), max(df2[amplitude_key]), max(df3[amplitude_key]), max(df4[amplitude_key]), max(df5[amplitude_key]), max(df6[amplitude_key]), max(df7[amplitude_key]), max(df8[amplitude_key])],
+        peak_amplitudes,
         edgecolor='black', linewidth=1, alpha=0.75,
         )
-    ax.set_xticks([1, 2, 3, 4, 5, 6, 7, 8])
-    tick_labels = []
-    total_max_amplitude = max(
-        max(df1[amplitude_key]), max(df2[amplitude_key]), max(df3[amplitude_key]), max(df4[amplitude_key]), max(df5[amplitude_key]), max(df6[amplitude_key]), max(df7[amplitude_key]), max(df8[amplitude_key]),
-    )
-    for i, df in enumerate([df1, df2, df3, df4, df5, df6, df7, df8]):
-        tick_labels.append(f"DIMM{i+1}\n({df['Frequency'][df[amplitude_key].idxmax()]} $Hz$)")
+    total_max_amplitude = peak_amplitudes.max()
+    for i in range(8):
         ax.text(    # Add the peak amplitude as text above the bar.
             i+1, 
-            max(df[amplitude_key]) + (total_max_amplitude * 0.01),
+            peak_amplitudes[i] + (total_max_amplitude * 0.01),
             # f"{round(max(df[amplitude_key]),7)}", 
-            f"{max(df[amplitude_key]):.5f}", 
+            f"{peak_amplitudes[i]:.5f}", 
             ha='center', 
             va='bottom', 
             fontsize=9, 
             fontstyle='italic'
         )
-    ax.set_xticklabels(tick_labels, fontsize=10)
-    amplitude_unit = {'velocity': 'm/s', 'deformation': 'mm', 'acceleration': 'g'}[data_type]
+    # Ticks and their labels (with each DIMM's peak frequency) set in one go
+    ax.set_xticks([1, 2, 3, 4, 5, 6, 7, 8], labels=[f"DIMM{i+1}\n({peak_frequency} Hz)" for i, peak_frequency in enumerate(peak_frequencies)], fontsize=10)
     # amplitude_unit = {'velocity': 'mm/s', 'deformation': 'mm', 'acceleration': 'mm/s²'}[data_type]
-    ax.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=12, labelpad=15, fontweight='bold')
+    ax.set_ylabel(_AMP_LABEL[data_type], fontsize=12, labelpad=15, fontweight='bold')
     ax.set_xlabel('DIMM Number', fontsize=12, labelpad=20, fontweight='bold')
     ax.set_title(f'{data_type.title()} Frequency Response - Peak Amplitudes ({axis.title()})', fontsize=14, pad=20, fontweight='bold')
     return fig
@@ -679,21 +870,18 @@ def plot_peak_amplitudes_xyz(data: NamedTuple, data_type: str, save_as: str = No
     - `dpi` (Optional): DPI of the saved image. Only applies if `save_as` is given.
     - `show` (Optional): If True, the plot will be shown. Only applies if `save_as` is given, otherwise the plot will always be shown.
     """
-    amplitude_key = {'velocity': 'Amplitude', 'deformation': 'Amplitude', 'acceleration': 'Amplitude_g'}[data_type]
-    fig, ax = plt.subplots(figsize=(10, 8))
-    fig.subplots_adjust(top=0.890, bottom=0.130, left=0.115, right=0.930)
-    df1x, df2x, df3x, df4x, df5x, df6x, df7x, df8x = data.x
-    df1y, df2y, df3y, df4y, df5y, df6y, df7y, df8y = data.y
-    df1z, df2z, df3z, df4z, df5z, df6z, df7z, df8z = data.z
-    x_amplitudes = [max(df1x[amplitude_key]), max(df2x[amplitude_key]), max(df3x[amplitude_key]), max(df4x[amplitude_key]), max(df5x[amplitude_key]), max(df6x[amplitude_key]), max(df7x[amplitude_key]), max(df8x[amplitude_key])]
-    y_amplitudes = [max(df1y[amplitude_key]), max(df2y[amplitude_key]), max(df3y[amplitude_key]), max(df4y[amplitude_key]), max(df5y[amplitude_key]), max(df6y[amplitude_key]), max(df7y[amplitude_key]), max(df8y[amplitude_key])]
-    z_amplitudes = [max(df1z[amplitude_key]), max(df2z[amplitude_key]), max(df3z[amplitude_key]), max(df4z[amplitude_key]), max(df5z[amplitude_key]), max(df6z[amplitude_key]), max(df7z[amplitude_key]), max(df8z[amplitude_key])]
-    sorted_indices = np.argsort(x_amplitudes)[::-1]
-    x_amplitudes = np.array(x_amplitudes)[sorted_indices]
-    y_amplitudes = np.array(y_amplitudes)[sorted_indices]
-    z_amplitudes = np.array(z_amplitudes)[sorted_indices]
+    amplitude_key = _AMP_KEY[data_type]
+    show = show or save_as is None     # The plot is always shown if it isn't saved
+    fig, ax = _script_figure(1, 1, figsize=(10, 8), show=show, top=0.890, bottom=0.130, left=0.115, right=0.930)
+    # Peak amplitude of each DIMM, as a (3, 8) array of X, Y and Z rows, with one NumPy reduction per DataFrame
+    xyz_peaks = np.array([[df[amplitude_key].to_numpy().max() for df in dimms] for dimms in data])
+    x_amplitudes, y_amplitudes, z_amplitudes = xyz_peaks
+    sorted_indices = np.argsort(-x_amplitudes, kind='stable')    # Largest first, with ties kept in DIMM order
+    x_amplitudes, y_amplitudes, z_amplitudes = xyz_peaks[:, sorted_indices]
     dimm_numbers = np.array([1, 2, 3, 4, 5, 6, 7, 8])[sorted_indices]
-    sum_amplitudes = [sum(x) for x in zip(x_amplitudes, y_amplitudes, z_amplitudes)]    # This is
+    # Running totals up the stack of each DIMM's bar: row k is the top of its X (k=0), Y (k=1) and Z (k=2) segment
+    xyz_tops = np.cumsum(xyz_peaks, axis=0)
+    sum_amplitudes = xyz_tops[2, sorted_indices]    # This is
     # sum_bars = ax.bar(
     #     dimm_numbers,
     #     sum_amplitudes,
@@ -710,34 +898,24 @@ def plot_peak_amplitudes_xyz(data: NamedTuple, data_type: str, save_as: str = No
     y_bars = ax.bar(
         dimm_numbers,
         y_amplitudes,
-        bottom=x_amplitudes,
+        bottom=xyz_tops[0, sorted_indices],
         edgecolor='black', linewidth=0.5, alpha=0.75,
     )
     z_bars = ax.bar(
         dimm_numbers,
         z_amplitudes,
-        bottom=x_amplitudes + y_amplitudes,
+        bottom=xyz_tops[1, sorted_indices],
         edgecolor='black', linewidth=0.5, alpha=0.75,
     )
     
-    ax.set_xticks([1, 2, 3, 4, 5, 6, 7, 8])
-    tick_labels = []
-    total_max_amplitude = max(
-        max(x_amplitudes), max(y_amplitudes), max(z_amplitudes),
-    )
-    dfs = {
-        'x': [df1x, df2x, df3x, df4x, df5x, df6x, df7x, df8x],
-        'y': [df1y, df2y, df3y, df4y, df5y, df6y, df7y, df8y],
-        'z': [df1z, df2z, df3z, df4z, df5z, df6z, df7z, df8z],
-    }
-    for i, df in enumerate([df1z, df2z, df3z, df4z, df5z, df6z, df7z, df8z]):
-        tick_labels.append(f"DIMM{i+1}")
+    total_max_amplitude = xyz_peaks.max()
+    for i in range(8):
         ax.text(
             i+1, 
-            max(dfs['z'][i][amplitude_key]) + max(dfs['y'][i][amplitude_key]) + max(dfs['x'][i][amplitude_key]) + ( (max(z_amplitudes)) * 0.002),
+            xyz_tops[2, i] + (z_amplitudes.max() * 0.002),
             # f"{round(max(df[amplitude_key]),7)}", 
             # f"{max(df[amplitude_key]):.5f}", 
-            f"{sum([max(dfs['z'][i][amplitude_key]), max(dfs['y'][i][amplitude_key]), max(dfs['x'][i][amplitude_key])]):.5f}",
+            f"{xyz_tops[2, i]:.5f}",
             ha='center', 
             va='bottom', 
             fontsize=9, 
@@ -751,21 +929,16 @@ def plot_peak_amplitudes_xyz(data: NamedTuple, data_type: str, save_as: str = No
         loc='upper right', 
         framealpha=0.8,
     )
-    ax.set_xticklabels(tick_labels, fontsize=10)
-    amplitude_unit = {'velocity': 'm/s', 'deformation': 'mm', 'acceleration': 'g'}[data_type]
+    ax.set_xticks([1, 2, 3, 4, 5, 6, 7, 8], labels=[f"DIMM{i+1}" for i in range(8)], fontsize=10)
     # amplitude_unit = {'velocity': 'mm/s', 'deformation': 'mm', 'acceleration': 'mm/s²'}[data_type]
-    ax.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=12, labelpad=15, fontweight='bold')
+    ax.set_ylabel(_AMP_LABEL[data_type], fontsize=12, labelpad=15, fontweight='bold')
     ax.set_xlabel('DIMM Number', fontsize=12, labelpad=20, fontweight='bold')
     ax.set_title(f'{data_type.title()} Frequency Response - Peak Amplitudes (XYZ)', fontsize=14, pad=20, fontweight='bold')
     if save_as is not None:
         if '.png' not in save_as:
             save_as = save_as + '.png'
-        plt.savefig(save_as, dpi=dpi)
-    else:
-        show = True
-    if show:
-        plt.show()
-    plt.close()
+        fig.savefig(save_as, dpi=dpi)
+    _release_script_figure(fig, show)
 
 
 
@@ -782,21 +955,18 @@ def plot_peak_amplitudes_xyz_alllabels(data: NamedTuple, data_type: str, save_as
     - `axis`: Axis of the data contained in the `data` NamedTuple (e.g. 'x', 'y', 'z')
     - `save_as` (Optional): If provided, the plot will be saved as a file with the given name.
     """
-    amplitude_key = {'velocity': 'Amplitude', 'deformation': 'Amplitude', 'acceleration': 'Amplitude_g'}[data_type]
+    amplitude_key = _AMP_KEY[data_type]
     fig, ax = plt.subplots(figsize=(10, 8))
     fig.subplots_adjust(top=0.890, bottom=0.130, left=0.115, right=0.930)
-    df1x, df2x, df3x, df4x, df5x, df6x, df7x, df8x = data.x
-    df1y, df2y, df3y, df4y, df5y, df6y, df7y, df8y = data.y
-    df1z, df2z, df3z, df4z, df5z, df6z, df7z, df8z = data.z
-    x_amplitudes = [max(df1x[amplitude_key]), max(df2x[amplitude_key]), max(df3x[amplitude_key]), max(df4x[amplitude_key]), max(df5x[amplitude_key]), max(df6x[amplitude_key]), max(df7x[amplitude_key]), max(df8x[amplitude_key])]
-    y_amplitudes = [max(df1y[amplitude_key]), max(df2y[amplitude_key]), max(df3y[amplitude_key]), max(df4y[amplitude_key]), max(df5y[amplitude_key]), max(df6y[amplitude_key]), max(df7y[amplitude_key]), max(df8y[amplitude_key])]
-    z_amplitudes = [max(df1z[amplitude_key]), max(df2z[amplitude_key]), max(df3z[amplitude_key]), max(df4z[amplitude_key]), max(df5z[amplitude_key]), max(df6z[amplitude_key]), max(df7z[amplitude_key]), max(df8z[amplitude_key])]
-    sorted_indices = np.argsort(x_amplitudes)[::-1]
-    x_amplitudes = np.array(x_amplitudes)[sorted_indices]
-    y_amplitudes = np.array(y_amplitudes)[sorted_indices]
-    z_amplitudes = np.array(z_amplitudes)[sorted_indices]
+    # Peak amplitude of each DIMM, as a (3, 8) array of X, Y and Z rows, with one NumPy reduction per DataFrame
+    xyz_peaks = np.array([[df[amplitude_key].to_numpy().max() for df in dimms] for dimms in data])
+    x_amplitudes, y_amplitudes, z_amplitudes = xyz_peaks
+    sorted_indices = np.argsort(-x_amplitudes, kind='stable')    # Largest first, with ties kept in DIMM order
+    x_amplitudes, y_amplitudes, z_amplitudes = xyz_peaks[:, sorted_indices]
     dimm_numbers = np.array([1, 2, 3, 4, 5, 6, 7, 8])[sorted_indices]
-    sum_amplitudes = [sum(x) for x in zip(x_amplitudes, y_amplitudes, z_amplitudes)]    # This is
+    # Running totals up the stack of each DIMM's bar: row k is the top of its X (k=0), Y (k=1) and Z (k=2) segment
+    xyz_tops = np.cumsum(xyz_peaks, axis=0)
+    sum_amplitudes = xyz_tops[2, sorted_indices]    # This is
     # sum_bars = ax.bar(
     #     dimm_numbers,
     #     sum_amplitudes,
@@ -813,58 +983,48 @@ def plot_peak_amplitudes_xyz_alllabels(data: NamedTuple, data_type: str, save_as
     y_bars = ax.bar(
         dimm_numbers,
         y_amplitudes,
-        bottom=x_amplitudes,
+        bottom=xyz_tops[0, sorted_indices],
         edgecolor='black', linewidth=0.5, alpha=0.75,
     )
     z_bars = ax.bar(
         dimm_numbers,
         z_amplitudes,
-        bottom=x_amplitudes + y_amplitudes,
+        bottom=xyz_tops[1, sorted_indices],
         edgecolor='black', linewidth=0.5, alpha=0.75,
     )
     
-    ax.set_xticks([1, 2, 3, 4, 5, 6, 7, 8])
-    tick_labels = []
-    total_max_amplitude = max(
-        max(x_amplitudes), max(y_amplitudes), max(z_amplitudes),
-    )
+    total_max_amplitude = xyz_peaks.max()
     # Add the peak amplitude as text above each bar (X, Y, Z)
-    for i, df in enumerate([df1x, df2x, df3x, df4x, df5x, df6x, df7x, df8x]):
-        tick_labels.append(f"DIMM{i+1}")
+    for i in range(8):
         ax.text(
             i+1, 
-            max(df[amplitude_key]) + (max(x_amplitudes) * 0.002),
+            xyz_tops[0, i] + (x_amplitudes.max() * 0.002),
             # f"{round(max(df[amplitude_key]),7)}", 
-            f"{max(df[amplitude_key]):.5f}", 
+            f"{xyz_peaks[0, i]:.5f}", 
             ha='center', 
             va='bottom', 
             fontsize=9, 
             fontstyle='italic'
         )
-    dfs = {
-        'x': [df1x, df2x, df3x, df4x, df5x, df6x, df7x, df8x],
-        'y': [df1y, df2y, df3y, df4y, df5y, df6y, df7y, df8y],
-        'z': [df1z, df2z, df3z, df4z, df5z, df6z, df7z, df8z],
-    }
-    for i, df in enumerate([df1y, df2y, df3y, df4y, df5y, df6y, df7y, df8y]):
+    for i in range(8):
         # tick_labels.append(f'{i+1}')
         ax.text(
             i+1, 
-            max(dfs['x'][i][amplitude_key]) + max(dfs['y'][i][amplitude_key]) + ( (max(y_amplitudes)) * 0.002),
+            xyz_tops[1, i] + (y_amplitudes.max() * 0.002),
             # f"{round(max(df[amplitude_key]),7)}", 
-            f"{max(df[amplitude_key]):.5f}", 
+            f"{xyz_peaks[1, i]:.5f}", 
             ha='center', 
             va='bottom', 
             fontsize=9, 
             fontstyle='italic'
         )
-    for i, df in enumerate([df1z, df2z, df3z, df4z, df5z, df6z, df7z, df8z]):
+    for i in range(8):
         # tick_labels.append(f'{i+1}')
         ax.text(
             i+1, 
-            max(dfs['z'][i][amplitude_key]) + max(dfs['y'][i][amplitude_key]) + max(dfs['x'][i][amplitude_key]) + ( (max(z_amplitudes)) * 0.002),
+            xyz_tops[2, i] + (z_amplitudes.max() * 0.002),
             # f"{round(max(df[amplitude_key]),7)}", 
-            f"{max(df[amplitude_key]):.5f}", 
+            f"{xyz_peaks[2, i]:.5f}", 
             ha='center', 
             va='bottom', 
             fontsize=9, 
@@ -878,15 +1038,185 @@ def plot_peak_amplitudes_xyz_alllabels(data: NamedTuple, data_type: str, save_as
         loc='upper right', 
         framealpha=0.8,
     )
-    ax.set_xticklabels(tick_labels, fontsize=10)
-    amplitude_unit = {'velocity': 'm/s', 'deformation': 'mm', 'acceleration': 'g'}[data_type]
+    ax.set_xticks([1, 2, 3, 4, 5, 6, 7, 8], labels=[f"DIMM{i+1}" for i in range(8)], fontsize=10)
     # amplitude_unit = {'velocity': 'mm/s', 'deformation': 'mm', 'acceleration': 'mm/s²'}[data_type]
-    ax.set_ylabel(f'Amplitude  ( ${amplitude_unit}$ )', fontsize=12, labelpad=15, fontweight='bold')
+    ax.set_ylabel(_AMP_LABEL[data_type], fontsize=12, labelpad=15, fontweight='bold')
     ax.set_xlabel('DIMM Number', fontsize=12, labelpad=20, fontweight='bold')
     ax.set_title(f'{data_type.title()} Frequency Response - Peak Amplitudes (XYZ)', fontsize=14, pad=20, fontweight='bold')
     if save_as is not None:
         if '.png' not in save_as:
             save_as = save_as + '.png'
-        plt.savefig(save_as, dpi=900)
+        fig.savefig(save_as, dpi=900)
     plt.show()
-    plt.close()
+    plt.close(fig)
+
+
+
+
+
+
+
+@lru_cache(maxsize=32)
+def _font(style: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Loads (once) one of the DejaVu Sans fonts that ship with matplotlib, so text drawn with Pillow matches the matplotlib plots.
+
+    ## Parameters
+    - `style`: Suffix of the font file (e.g. '', '-Bold', '-Oblique').
+    - `size`: Size of the font in pixels.
+    """
+    return ImageFont.truetype(os.path.join(mpl.get_data_path(), 'fonts', 'ttf', f'DejaVuSans{style}.ttf'), size)
+
+
+
+
+
+def render_peak_bars(data: NamedTuple, data_type: str, axis: str, dpi: int = 72) -> Image.Image:
+    """
+    Draws the same bar chart as `plot_peak_amplitudes` directly with Pillow, skipping matplotlib's figure and axes setup entirely.
+    Used when exporting plots, where that setup costs far more than drawing eight bars.
+
+    ## Parameters
+    - `data`: NamedTuple containing data for all eight DIMMs.
+    - `data_type`: Type of data contained in the `data` NamedTuple (e.g. 'velocity', 'deformation', 'acceleration')
+    - `axis`: Axis of the data contained in the `data` NamedTuple (e.g. 'x', 'y', 'z')
+    - `dpi` (Optional): Resolution of the image. It's 10x8 inches, like the matplotlib version.
+    """
+    amplitude_key = _AMP_KEY[data_type]
+    peak_indices, peak_amplitudes = _peak_amplitudes(data, amplitude_key)
+    pt = dpi / 72    # Pixels per point
+    width, height = 10 * dpi, 8 * dpi
+    image = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(image)
+
+    # Same axes placement and data limits as matplotlib would use
+    left, right, top, bottom = 0.115 * width, 0.930 * width, (1 - 0.890) * height, (1 - 0.130) * height
+    x_min, x_max = 0.6 - 0.39, 8.4 + 0.39
+    y_max = peak_amplitudes.max() * 1.05
+    to_x = lambda x: left + (x - x_min) / (x_max - x_min) * (right - left)
+    to_y = lambda y: bottom - y / y_max * (bottom - top)
+
+    bar_colour = tuple(round(255 * (0.75 * c + 0.25)) for c in mpl.colors.to_rgb(BLUE))    # 75% opaque over white
+    label_font, value_font = _font('', round(10 * pt)), _font('-Oblique', round(9 * pt))
+    tick_font, bold_font, title_font = _font('', round(10 * pt)), _font('-Bold', round(12 * pt)), _font('-Bold', round(14 * pt))
+    tick_length = 3.5 * pt
+    for i, df in enumerate(data):
+        x0, x1, y = to_x(i + 1 - 0.4), to_x(i + 1 + 0.4), to_y(peak_amplitudes[i])
+        draw.rectangle((x0, y, x1, bottom), fill=bar_colour, outline='black', width=max(1, round(pt)))
+        draw.text(((x0 + x1) / 2, to_y(peak_amplitudes[i] * 1.01)), f"{peak_amplitudes[i]:.5f}", fill='black', font=value_font, anchor='md')
+        draw.line((to_x(i + 1), bottom, to_x(i + 1), bottom + tick_length), fill='black', width=max(1, round(0.8 * pt)))
+        draw.multiline_text(
+            (to_x(i + 1), bottom + tick_length + 3.5 * pt), f"DIMM{i+1}\n({df['Frequency'].iloc[peak_indices[i]]} Hz)",
+            fill='black', font=label_font, anchor='ma', align='center',
+        )
+    for tick in mpl.ticker.MaxNLocator(nbins=8, steps=[1, 2, 2.5, 5, 10]).tick_values(0, y_max):
+        if 0 <= tick <= y_max:
+            y = to_y(tick)
+            draw.line((left - tick_length, y, left, y), fill='black', width=max(1, round(0.8 * pt)))
+            draw.text((left - tick_length - 3.5 * pt, y), f"{tick:.6g}", fill='black', font=tick_font, anchor='rm')
+    draw.rectangle((left, top, right, bottom), outline='black', width=max(1, round(0.8 * pt)))
+
+    # Axis labels and title
+    draw.text(((left + right) / 2, height - 0.02 * height), 'DIMM Number', fill='black', font=bold_font, anchor='md')
+    draw.text(((left + right) / 2, top - 20 * pt), f'{data_type.title()} Frequency Response - Peak Amplitudes ({axis.title()})', fill='black', font=title_font, anchor='md')
+    ylabel = _AMP_LABEL[data_type]
+    ylabel_box = draw.textbbox((0, 0), ylabel, font=bold_font)
+    ylabel_image = Image.new('L', (ylabel_box[2], ylabel_box[3]), 255)
+    ImageDraw.Draw(ylabel_image).text((0, 0), ylabel, fill=0, font=bold_font)
+    ylabel_image = ylabel_image.rotate(90, expand=True)
+    image.paste((0, 0, 0), (round(0.015 * width), round((top + bottom - ylabel_image.height) / 2)), Image.eval(ylabel_image, lambda v: 255 - v))
+    return image
+
+
+
+
+
+def render_png(spec: tuple, paletted: bool = False, compress_level: int = 1) -> tuple[str, bytes]:
+    """
+    Renders a single plot and returns it encoded as a PNG. Takes and returns only picklable values, so it can be run in a process pool.
+
+    ## Parameters
+    - `spec`: A tuple of `(filename, plot_function, args, kwargs, dpi)`, where `plot_function(*args, **kwargs)` returns the figure to render (or an already rendered `PIL.Image`).
+    - `paletted` (Optional): If `True`, the PNG is reduced to an 8-bit (64 colour) palette, which is much smaller and faster to encode than RGBA.
+    - `compress_level` (Optional): zlib compression level of the PNG. Defaults to the fastest level; `0` leaves it uncompressed, for when it's compressed again afterwards anyway.
+    """
+    filename, plot_function, args, kwargs, dpi = spec
+    fig = plot_function(*args, **kwargs)
+    buffer = BytesIO()
+    if isinstance(fig, Image.Image):    # Already rasterized, e.g. by `render_peak_bars`
+        if paletted:
+            fig = fig.convert('P', palette=Image.Palette.ADAPTIVE, colors=64)
+        fig.save(buffer, 'PNG', compress_level=compress_level, optimize=False)
+        return filename, buffer.getvalue()
+    fig.set_dpi(dpi)
+    if paletted:
+        fig.canvas.draw()
+        image = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert('RGB')
+        image.convert('P', palette=Image.Palette.ADAPTIVE, colors=64).save(buffer, 'PNG', compress_level=compress_level, optimize=False)
+    else:
+        fig.canvas.print_png(buffer, pil_kwargs={'compress_level': compress_level, 'optimize': False})
+    return_figure(fig)
+    return filename, buffer.getvalue()
+
+
+
+
+
+def render_svg(spec: tuple) -> tuple[str, bytes]:
+    """
+    Renders a single plot as an SVG, which skips rasterization of everything but very long traces. Text is left as text referencing the font by name,
+    rather than converted to paths, which keeps the files small. Takes and returns only picklable values, so it can be run in a process pool.
+
+    ## Parameters
+    - `spec`: A tuple of `(filename, plot_function, args, kwargs, dpi)`, as for `render_png`. `dpi` only applies to rasterized traces.
+    """
+    filename, plot_function, args, kwargs, dpi = spec
+    fig = plot_function(*args, **kwargs)
+    buffer = BytesIO()
+    with mpl.rc_context({'svg.fonttype': 'none'}):
+        fig.savefig(buffer, format='svg', dpi=dpi, metadata={'Date': None})
+    return_figure(fig)
+    return filename, buffer.getvalue()
+
+
+
+
+
+def render_file(spec: tuple, **png_kwargs) -> tuple[str, bytes]:
+    """
+    Renders a single plot with `render_svg` or `render_png`, depending on the extension of its filename.
+
+    ## Parameters
+    - `spec`: A tuple of `(filename, plot_function, args, kwargs, dpi)`, as for `render_png`.
+    - `png_kwargs` (Optional): Keyword arguments passed on to `render_png`.
+    """
+    if spec[0].endswith('.svg'):
+        return render_svg(spec)
+    return render_png(spec, **png_kwargs)
+
+
+
+
+
+def save_all(specs: Iterable[tuple], out_dir: str, max_workers: int = None, **png_kwargs) -> list[str]:
+    """
+    Renders a batch of plots in parallel worker processes and saves them under `out_dir`, returning the paths they were saved to.
+    Every plot is independent of the others, so a batch scales with the number of cores.
+
+    ## Parameters
+    - `specs`: Tuples of `(filename, plot_function, args, kwargs, dpi)`, as for `render_png`. Filenames may include subfolders.
+        The data in `args` has to be picklable: the `util.get_*_data` results are, otherwise build it with `XYZ_Data` / `DIMM_Data`
+        (e.g. `XYZ_Data._make(map(DIMM_Data._make, data))`).
+    - `out_dir`: Folder to save the plots in.
+    - `max_workers` (Optional): Number of worker processes. Defaults to the number of CPUs.
+    - `png_kwargs` (Optional): Keyword arguments passed on to `render_png`.
+    """
+    paths = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for filename, contents in executor.map(partial(render_file, **png_kwargs), specs):
+            path = os.path.join(out_dir, filename)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as file:
+                file.write(contents)
+            paths.append(path)
+    return paths
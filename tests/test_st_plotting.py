@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import st_plotting
+import util
+
+
+SIMS = sorted(str(path) for path in Path(__file__).resolve().parent.parent.glob('sim*') if path.is_dir())
+DATA_TYPES = ('velocity', 'deformation', 'acceleration')
+
+
+
+@pytest.fixture(scope='module', params=SIMS, ids=lambda path: Path(path).name)
+def sim(request):
+    return request.param, {data_type: getattr(util, f"get_{data_type}_data")(request.param) for data_type in DATA_TYPES}
+
+
+
+@pytest.mark.parametrize('data_type', DATA_TYPES)
+@pytest.mark.parametrize('axis', 'xyz')
+def test_peak_labels_match_column_maxima(sim, data_type, axis):
+    _, xyz = sim
+    data = getattr(xyz[data_type], axis)
+    key = st_plotting._AMP_KEY[data_type]
+    expected = [f"{df[key].max():.5f}" for df in data]
+
+    fig = st_plotting.plot_peak_amplitudes(data, data_type, axis)
+    try:
+        assert [text.get_text() for text in fig.axes[0].texts] == expected
+    finally:
+        st_plotting.return_figure(fig)
+
+    # render_peak_bars labels from the same helper
+    _, peak_amplitudes = st_plotting._peak_amplitudes(data, key)
+    assert [f"{amplitude:.5f}" for amplitude in peak_amplitudes] == expected
+
+
+
+FREQUENCIES = np.array([1.0, 2.0, 4.0, 8.0, 16.0])
+
+
+@pytest.mark.parametrize('target, expected', [
+    (0.5, 0),       # below the first sample
+    (20.0, 4),      # above the last sample
+    (1.0, 0),       # exactly on the first sample
+    (4.0, 2),       # exactly on a sample
+    (16.0, 4),      # exactly on the last sample
+    (5.0, 2),       # between samples, nearer the lower one
+    (7.0, 3),       # between samples, nearer the upper one
+    (3.0, 1),       # exact midpoint: the tie goes to the lower index
+    (12.0, 3),      # exact midpoint: the tie goes to the lower index
+])
+def test_closest_indices_matches_argmin(target, expected):
+    assert np.abs(FREQUENCIES - target).argmin() == expected
+    assert st_plotting._closest_indices(FREQUENCIES, np.array([target])).tolist() == [expected]
+
+
+
+@pytest.mark.parametrize('n', [1, 500, 1000])
+def test_decimate_leaves_short_lines_unchanged(n):
+    x, y = np.arange(n, dtype=float), np.sin(np.arange(n))
+    decimated_x, decimated_y = st_plotting._decimate(x, y, 1000)
+    assert decimated_x is x and decimated_y is y
+
+
+def test_decimate_keeps_extremes_and_ends():
+    rng = np.random.default_rng(0)
+    x = np.linspace(10.0, 2000.0, 100_003)
+    y = rng.standard_normal(len(x))
+    decimated_x, decimated_y = st_plotting._decimate(x, y, 1000)
+    assert len(decimated_x) == len(decimated_y) <= 1002
+    assert decimated_y.max() == y.max() and decimated_y.min() == y.min()
+    assert decimated_x[0] == x[0] and decimated_x[-1] == x[-1]
+    assert np.all(np.diff(decimated_x) > 0)
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import util
+
+
+SIM = str(Path(__file__).resolve().parent.parent / 'sim12')
+
+
+
+@pytest.mark.parametrize('data_type', ['velocity', 'deformation', 'acceleration'])
+def test_axis_describe_matches_pandas(data_type):
+    data = getattr(util, f"get_{data_type}_data")(SIM).x
+    assert isinstance(data, util._AxisData)
+    for described, dimm in zip(data.describe(), data.array):
+        pd.testing.assert_frame_equal(described, pd.DataFrame(dimm, columns=data.columns).describe(), rtol=1e-9)
+
+
+
+def test_read_description_parses_all_dimms():
+    df = util._read_description(f"{SIM}/data/velocity_x_description.txt", util._DESCRIPTION_COLUMNS)
+    assert df.shape == (56, 1 + len(util._DESCRIPTION_COLUMNS))
+    assert df['DIMM'].tolist() == [dimm for dimm in range(1, 9) for _ in range(7)]
+
+
+def test_description_formatting(tmp_path):
+    text = Path(f"{SIM}/data/velocity_x_description.txt").read_text()
+    # Give DIMM1 a mean phase angle that rounds to -0.000, and a 75th percentile that's only just negative
+    text = text.replace('42.869158', '-0.000400', 1).replace('120.735140', '-0.012345', 1)
+    (tmp_path / 'velocity_x_description.txt').write_text(text)
+
+    descriptions = util.load_dfs_from_description__velocity_deformation(str(tmp_path / 'velocity_x_description.txt'))
+    assert len(descriptions) == 8
+    dimm1 = descriptions.DIMM1
+    assert dimm1.shape == (7, 3)
+    assert dimm1['Frequency'].tolist()[-1] == '100.0'
+    assert dimm1['Amplitude'].tolist()[0] == '0.033074'
+    assert dimm1['Phase_Angle'].tolist() == ['-0.00', '121.1', '-174.1', '-113.4', '109.5', '-0.012', '177.1']
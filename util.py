@@ -25,17 +25,107 @@ sim1/
 ```
 """
 
+import io
 import re
 import os
+import time
+import threading
 import numpy as np
 import pandas as pd
 from typing import NamedTuple
-from collections import namedtuple
+from functools import lru_cache, wraps
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 
+_LISTING_TTL = 30.0     # Seconds a memoized folder listing stays valid for
+_LISTING_CACHE = {}     # (getter name, parent folder, pattern) -> (time listed, result)
+_PARSED_CACHE_SIZE = 72                # Parsed data files kept at once (all three data types of one simulation)
+_PARSED_CACHE = OrderedDict()          # Data file path -> (modification time, parsed array), least recently used first
+_PARSED_CACHE_LOCK = threading.Lock()  # Files are read from a thread pool
 
+# Module-level (so built once, and picklable) containers returned by the getters and loaders
+Data_Files = namedtuple("Data_Files", ["velocity", "deformation", "acceleration"])
+XYZ_Files = namedtuple("XYZ_Files", ["x", "y", "z"])
+XYZ_Axes = namedtuple("XYZ_Axes", ["x", "y", "z"])
+DIMM_Descriptions = namedtuple("DIMM_Descriptions", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
 
 
+
+
+
+@lru_cache(maxsize=32)
+def _compile(pattern: str) -> re.Pattern:
+    """
+    Returns the compiled regex for a filename pattern, compiled only the first time it's used.
+    """
+    return re.compile(pattern)
+
+
+
+
+
+def _list(path: str, search) -> list[str]:
+    """
+    Returns the names of the entries in a folder that match a pattern, given the `search` method of its compiled regex.
+    """
+    with os.scandir(path) as entries:
+        return [entry.name for entry in entries if search(entry.name)]
+
+
+
+
+
+def _split_axes(files: list[str]) -> tuple[list[str], list[str], list[str]]:
+    """
+    Splits a list of data files into the X, Y and Z files, by the axis at the end of their names.
+    """
+    files_x, files_y, files_z = [], [], []
+    for file in files:
+        if file.endswith('x.txt'):
+            files_x.append(file)
+        elif file.endswith('y.txt'):
+            files_y.append(file)
+        elif file.endswith('z.txt'):
+            files_z.append(file)
+    return files_x, files_y, files_z
+
+
+
+
+
+def _memoize_listing(function):
+    """
+    Memoizes a data file getter on its arguments for `_LISTING_TTL` seconds, so reloading a simulation doesn't list its folders again.
+    Call `clear_cache` after adding or removing data files, to see them straight away.
+    """
+    @wraps(function)
+    def wrapper(parent_folder: str, pattern: str = '.*\.txt') -> NamedTuple:
+        key = (function.__name__, parent_folder, pattern)
+        now = time.monotonic()
+        cached = _LISTING_CACHE.get(key)
+        if cached is not None and now - cached[0] < _LISTING_TTL:
+            return cached[1]
+        result = function(parent_folder, pattern)
+        _LISTING_CACHE[key] = (now, result)
+        return result
+    return wrapper
+
+
+
+
+
+def clear_cache() -> None:
+    """
+    Forgets all memoized folder listings, e.g. after writing new data files into a simulation folder.
+    """
+    _LISTING_CACHE.clear()
+
+
+
+
+
+@_memoize_listing
 def get_data_files(parent_folder: str, pattern: str = '.*\.txt') -> NamedTuple:
     """
     Return a list of simulation data files from a parent folder.
@@ -52,99 +142,51 @@ def get_data_files(parent_folder: str, pattern: str = '.*\.txt') -> NamedTuple:
         ['DIMM1.txt', 'DIMM2.txt', 'DIMM3.txt', ...]
     ```
     """
-    velocity_files = []
-    deformation_files = []
-    acceleration_files = []
-    velocity_path = f"{parent_folder}/data/velocity/"
-    deformation_path = f"{parent_folder}/data/deformation/"
-    acceleration_path = f"{parent_folder}/data/acceleration/"
-    for file in os.listdir(velocity_path):
-        if re.search(pattern, file):
-            velocity_files.append(file)
-    for file in os.listdir(deformation_path):
-        if re.search(pattern, file):
-            deformation_files.append(file)
-    for file in os.listdir(acceleration_path):
-        if re.search(pattern, file):
-            acceleration_files.append(file)
-    data_files = namedtuple("data_files", ["velocity", "deformation", "acceleration"])
-    return data_files(velocity_files, deformation_files, acceleration_files)
+    search = _compile(pattern).search
+    velocity_files = _list(f"{parent_folder}/data/velocity/", search)
+    deformation_files = _list(f"{parent_folder}/data/deformation/", search)
+    acceleration_files = _list(f"{parent_folder}/data/acceleration/", search)
+    return Data_Files(velocity_files, deformation_files, acceleration_files)
 
 
 
 
 
+@_memoize_listing
 def get_deformation_data_files(parent_folder: str, pattern: str = '.*\.txt') -> NamedTuple:
     """
     Return a list of deformation simulation data files from a parent folder.
 
     ## Example
     """
-    deformation_files_x = []
-    deformation_files_y = []
-    deformation_files_z = []
-    deformation_path = f"{parent_folder}/data/deformation/"
-    for file in os.listdir(deformation_path):
-        if re.search(pattern, file):
-            if 'x.txt' in file:
-                deformation_files_x.append(file)
-            elif 'y.txt' in file:
-                deformation_files_y.append(file)
-            elif 'z.txt' in file:
-                deformation_files_z.append(file)
-    deformation_data_files = namedtuple("deformation_data_files", ["x", "y", "z"])
-    return deformation_data_files(deformation_files_x, deformation_files_y, deformation_files_z)
+    return XYZ_Files(*_split_axes(_list(f"{parent_folder}/data/deformation/", _compile(pattern).search)))
 
 
 
 
 
+@_memoize_listing
 def get_acceleration_data_files(parent_folder: str, pattern: str = '.*\.txt') -> NamedTuple:
     """
     Return a list of acceleration simulation data files from a parent folder.
 
     ## Example
     """
-    acceleration_files_x = []
-    acceleration_files_y = []
-    acceleration_files_z = []
-    acceleration_path = f"{parent_folder}/data/acceleration/"
-    for file in os.listdir(acceleration_path):
-        if re.search(pattern, file):
-            if 'x.txt' in file:
-                acceleration_files_x.append(file)
-            elif 'y.txt' in file:
-                acceleration_files_y.append(file)
-            elif 'z.txt' in file:
-                acceleration_files_z.append(file)
-    acceleration_data_files = namedtuple("acceleration_data_files", ["x", "y", "z"])
-    return acceleration_data_files(acceleration_files_x, acceleration_files_y, acceleration_files_z)
+    return XYZ_Files(*_split_axes(_list(f"{parent_folder}/data/acceleration/", _compile(pattern).search)))
 
 
 
 
 
 
+@_memoize_listing
 def get_velocity_data_files(parent_folder: str, pattern: str = '.*\.txt') -> NamedTuple:
     """
     Return a list of velocity simulation data files from a parent folder.
 
     ## Example
     """
-    velocity_files_x = []
-    velocity_files_y = []
-    velocity_files_z = []
-    velocity_path = f"{parent_folder}/data/velocity/"
-    for file in os.listdir(velocity_path):
-        if re.search(pattern, file):
-            if 'x.txt' in file:
-                velocity_files_x.append(file)
-            elif 'y.txt' in file:
-                velocity_files_y.append(file)
-            elif 'z.txt' in file:
-                velocity_files_z.append(file)
-    velocity_data_files = namedtuple("velocity_data_files", ["x", "y", "z"])
-    return velocity_data_files(velocity_files_x, velocity_files_y, velocity_files_z)
+    return XYZ_Files(*_split_axes(_list(f"{parent_folder}/data/velocity/", _compile(pattern).search)))
 
 
 
@@ -196,6 +238,176 @@ def get_velocity_data_files(parent_folder: str, pattern: str = '.*\.txt') -> Nam
 
 
 
+_DATA_COLUMNS = ['Frequency', 'Amplitude', 'Phase Angle']
+_ACCELERATION_COLUMNS = ['Frequency', 'Amplitude_g', 'Amplitude', 'Phase Angle']
+# Columns of the description DataFrames, which are also the header rows of their blocks in Google Sheets
+_DESCRIPTION_COLUMNS = ('Frequency', 'Amplitude', 'Phase_Angle')
+_ACCELERATION_DESCRIPTION_COLUMNS = ('Frequency', 'Amplitude', 'Amplitude_g', 'Phase_Angle')
+
+
+
+
+
+def _read_data_file(path: str) -> np.ndarray:
+    """
+    Reads the frequency, amplitude and phase angle columns of a data file (skipping its header line) into an (N, 3) array.
+    The files are purely numeric, so they're parsed by `np.loadtxt`, which is about 3x faster than `pd.read_csv` for files this size.
+
+    The most recently read `_PARSED_CACHE_SIZE` files are kept in `_PARSED_CACHE` along with their modification time,
+    so reloading a simulation only re-parses the files that have changed since. The returned array is the cached one
+    (shared with every caller and with the cache), so it's read-only.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    with _PARSED_CACHE_LOCK:
+        cached = _PARSED_CACHE.get(path)
+        if cached is not None and cached[0] == mtime:
+            _PARSED_CACHE.move_to_end(path)
+            return cached[1]
+    # One read of the whole file into memory; letting np.loadtxt open the path itself is about twice as slow for files this size
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        buffer = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    data = np.loadtxt(io.BytesIO(buffer), skiprows=1, ndmin=2)
+    data.setflags(write=False)
+    with _PARSED_CACHE_LOCK:
+        _PARSED_CACHE[path] = (mtime, data)
+        _PARSED_CACHE.move_to_end(path)
+        while len(_PARSED_CACHE) > _PARSED_CACHE_SIZE:
+            _PARSED_CACHE.popitem(last=False)
+    return data
+
+
+
+
+
+class _AxisData:
+    """
+    The data of all eight DIMMs along one axis, stored as a single stacked (8, N, C) array rather than eight DataFrames.
+    Behaves like the namedtuple of DataFrames it stands in for (`data.DIMM1`, `data[0]`, iteration and unpacking, `_fields`),
+    but only builds each DIMM's DataFrame the first time it's accessed. Axis-wide calculations can use `array` directly.
+    """
+    _fields = ("DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8")
+
+    def __init__(self, array: np.ndarray, columns: list[str]) -> None:
+        self.array = array
+        self.columns = columns
+        self._frames = {}
+
+    def __getitem__(self, index: int) -> pd.DataFrame:
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(len(self))[index])
+        index = range(len(self))[index]     # Handles negative indices, and raises an IndexError when out of range
+        if index not in self._frames:
+            self._frames[index] = pd.DataFrame(self.array[index], columns=self.columns)
+        return self._frames[index]
+
+    def __getattr__(self, name: str) -> pd.DataFrame:
+        if name in _AxisData._fields:
+            return self[_AxisData._fields.index(name)]
+        raise AttributeError(f"'_AxisData' object has no attribute '{name}'")
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"_AxisData({len(self)} DIMMs x {self.array.shape[1]} rows, columns={self.columns})"
+
+    def describe(self) -> list[pd.DataFrame]:
+        """
+        Returns what `DataFrame.describe()` would for each DIMM, with the statistics of all eight DIMMs
+        calculated in one pass over `array` instead of building and describing eight DataFrames.
+        """
+        array = self.array
+        stats = np.stack([
+            np.full((len(array), array.shape[2]), array.shape[1], dtype=float),
+            array.mean(axis=1),
+            array.std(axis=1, ddof=1),
+            array.min(axis=1),
+            *np.percentile(array, [25, 50, 75], axis=1),
+            array.max(axis=1),
+        ], axis=1)
+        index = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+        return [pd.DataFrame(dimm_stats, index=index, columns=self.columns) for dimm_stats in stats]
+
+
+
+
+
+def _read_axes(folder: str, data_files: NamedTuple) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reads the X, Y and Z data files of a data type, and returns each axis' files stacked into one (8, N, 3) array.
+    Each file is read independently, so they're all read on a pool of threads.
+
+    ## Parameters
+    - `folder`: The folder the data files are in, e.g. `"sim1/data/velocity"`.
+    - `data_files`: The X, Y and Z data files, as returned by the `get_*_data_files` functions.
+    """
+    prefix = os.path.join(folder, '')     # The folder with its trailing separator, joined to each file name by concatenation
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pending = [executor.map(_read_data_file, [prefix + file for file in files]) for files in data_files]
+        return tuple(np.stack(list(results)) for results in pending)
+
+
+
+
+
+def _scale_deformation(arrays: np.ndarray) -> np.ndarray:
+    """
+    Scales all eight DIMMs' deformation amplitudes of an axis from m to mm, with one multiply.
+    """
+    arrays[..., 1] *= 1e3
+    return arrays
+
+
+
+
+
+def _add_amplitude_g(arrays: np.ndarray) -> np.ndarray:
+    """
+    Adds an 'Amplitude_g' column after the frequencies of an axis' acceleration data, multiplying by the
+    (constant-folded) reciprocal of g rather than dividing.
+    """
+    return np.insert(arrays, 1, arrays[..., 1] * (1 / 9.81), axis=2)
+
+
+
+
+
+# Data type -> (data file getter, column names, post-processing of each axis' stacked array)
+_DATA_TYPES = {
+    'deformation': (get_deformation_data_files, _DATA_COLUMNS, _scale_deformation),
+    'acceleration': (get_acceleration_data_files, _ACCELERATION_COLUMNS, _add_amplitude_g),
+    'velocity': (get_velocity_data_files, _DATA_COLUMNS, None),
+}
+
+
+
+
+
+def _load_data(parent_folder: str, data_type: str) -> NamedTuple:
+    """
+    Loads the X, Y and Z data of one data type in a simulation, as described by its `_DATA_TYPES` entry.
+    All the `get_*_data` functions are this, for their data type.
+
+    ## Parameters
+    - `parent_folder`: The simulation folder, e.g. `"sim1"`.
+    - `data_type`: One of `["velocity", "acceleration", "deformation"]`.
+    """
+    get_files, columns, post = _DATA_TYPES[data_type]
+    axes = _read_axes(f"{parent_folder}/data/{data_type}", get_files(parent_folder))
+    if post is not None:
+        axes = [post(arrays) for arrays in axes]
+    return XYZ_Axes(*(_AxisData(arrays, columns) for arrays in axes))
+
+
+
+
+
 def get_deformation_data(parent_folder: str) -> NamedTuple:
     """
     Return a namedtuple of Pandas `DataFrame`s for deformation data of each DIMM in a simulation.
@@ -221,54 +433,7 @@ def get_deformation_data(parent_folder: str) -> NamedTuple:
         2   3.0        3.0        3.0
     ```
     """
-    deformation_data_files = get_deformation_data_files(parent_folder)
-    deformation_dataframes_x = []
-    for file in deformation_data_files.x:
-        with open(f"{parent_folder}/data/deformation/{file}", 'r') as f:
-            lines = f.readlines()
-        with open(f"{parent_folder}/data/deformation/{file}", 'w') as f:
-            for line in lines:
-                if 'Angle' in line:
-                    f.write(line[:line.find('Angle')+5] + ' [deg]\n')
-                else:
-                    f.write(line)
-        df = pd.read_csv(f"{parent_folder}/data/deformation/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-        # df = pd.read_csv(f"{parent_folder}/data/deformation/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'], index_col=0)
-        df['Amplitude'] *= 1e3
-        deformation_dataframes_x.append(df)
-    deformation_dataframes_y = []
-    for file in deformation_data_files.y:
-        with open(f"{parent_folder}/data/deformation/{file}", 'r') as f:
-            lines = f.readlines()
-        with open(f"{parent_folder}/data/deformation/{file}", 'w') as f:
-            for line in lines:
-                if 'Angle' in line:
-                    f.write(line[:line.find('Angle')+5] + ' [deg]\n')
-                else:
-                    f.write(line)
-        df = pd.read_csv(f"{parent_folder}/data/deformation/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-        # df = pd.read_csv(f"{parent_folder}/data/deformation/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'], index_col=0)
-        df['Amplitude'] *= 1e3
-        deformation_dataframes_y.append(df)
-    deformation_dataframes_z = []
-    for file in deformation_data_files.z:
-        with open(f"{parent_folder}/data/deformation/{file}", 'r') as f:
-            lines = f.readlines()
-        with open(f"{parent_folder}/data/deformation/{file}", 'w') as f:
-            for line in lines:
-                if 'Angle' in line:
-                    f.write(line[:line.find('Angle')+5] + ' [deg]\n')
-                else:
-                    f.write(line)
-        df = pd.read_csv(f"{parent_folder}/data/deformation/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-        # df = pd.read_csv(f"{parent_folder}/data/deformation/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'], index_col=0)
-        df['Amplitude'] *= 1e3
-        deformation_dataframes_z.append(df)
-    deformation_data = namedtuple("deformation_data", ["x", "y", "z"])
-    deformation_data_x = namedtuple("deformation_data_x", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-    deformation_data_y = namedtuple("deformation_data_y", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-    deformation_data_z = namedtuple("deformation_data_z", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-    return deformation_data(deformation_data_x(*deformation_dataframes_x), deformation_data_y(*deformation_dataframes_y), deformation_data_z(*deformation_dataframes_z))
+    return _load_data(parent_folder, 'deformation')
     # return deformation_data_x(*deformation_dataframes_x), deformation_data_y(*deformation_dataframes_y), deformation_data_z(*deformation_dataframes_z)
 
 
@@ -302,69 +467,7 @@ def get_acceleration_data(parent_folder: str) -> NamedTuple:
         2   3.0        3.0        3.0
     ```
     """
-    acceleration_data_files = get_acceleration_data_files(parent_folder)
-    acceleration_dataframes_x = []
-    for file in acceleration_data_files.x:
-        with open(f"{parent_folder}/data/acceleration/{file}", 'r') as f:
-            lines = f.readlines()
-        with open(f"{parent_folder}/data/acceleration/{file}", 'w') as f:
-            for line in lines:
-                if line == lines[0]:
-                    f.write("\tFrequency [Hz]\tAmplitude [m/s2]\tPhase Angle [deg]\n")
-                else:
-                    f.write(line)
-                # if 'Angle' in line and 'deg' not in line:
-                #     f.write(line[:line.find('Amplitude')+9] + ' [m/s2]' + line[line.find('Amplitude')+18:line.find('Angle')+5] + ' [deg]\n')
-                # else:
-                #     f.write(line)
-        df = pd.read_csv(f"{parent_folder}/data/acceleration/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-        # df = pd.read_csv(f"{parent_folder}/data/acceleration/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'], index_col=0)
-        # add a new 'Amplitude_g' column to the dataframe
-        df.insert(1, 'Amplitude_g', df['Amplitude'] / 9.81)
-        acceleration_dataframes_x.append(df)
-    acceleration_dataframes_y = []
-    for file in acceleration_data_files.y:
-        with open(f"{parent_folder}/data/acceleration/{file}", 'r') as f:
-            lines = f.readlines()
-        with open(f"{parent_folder}/data/acceleration/{file}", 'w') as f:
-            for line in lines:
-                if line == lines[0]:
-                    f.write("\tFrequency [Hz]\tAmplitude [m/s2]\tPhase Angle [deg]\n")
-                else:
-                    f.write(line)
-                # if 'Angle' in line and 'deg' not in line:
-                #     f.write(line[:line.find('Amplitude')+9] + ' [m/s2]' + line[line.find('Amplitude')+18:line.find('Angle')+5] + ' [deg]\n')
-                # else:
-                #     f.write(line)
-        df = pd.read_csv(f"{parent_folder}/data/acceleration/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-        # df = pd.read_csv(f"{parent_folder}/data/acceleration/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'], index_col=0)
-        # df['Amplitude_g'] = df['Amplitude_g'] / 9.81
-        df.insert(1, 'Amplitude_g', df['Amplitude'] / 9.81)
-        acceleration_dataframes_y.append(df)
-    acceleration_dataframes_z = []
-    for file in acceleration_data_files.z:
-        with open(f"{parent_folder}/data/acceleration/{file}", 'r') as f:
-            lines = f.readlines()
-        with open(f"{parent_folder}/data/acceleration/{file}", 'w') as f:
-            for line in lines:
-                if line == lines[0]:
-                    f.write("\tFrequency [Hz]\tAmplitude [m/s2]\tPhase Angle [deg]\n")
-                else:
-                    f.write(line)
-                # if 'Angle' in line and 'deg' not in line:
-                #     f.write(line[:line.find('Amplitude')+9] + ' [m/s2]' + line[line.find('Amplitude')+18:line.find('Angle')+5] + ' [deg]\n')
-                # else:
-                #     f.write(line)
-        df = pd.read_csv(f"{parent_folder}/data/acceleration/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-        # df = pd.read_csv(f"{parent_folder}/data/acceleration/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'], index_col=0)
-        # df['Amplitude_g'] = df['Amplitude_g'] / 9.81
-        df.insert(1, 'Amplitude_g', df['Amplitude'] / 9.81)
-        acceleration_dataframes_z.append(df)
-    acceleration_data = namedtuple("acceleration_data", ["x", "y", "z"])
-    acceleration_data_x = namedtuple("acceleration_data_x", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-    acceleration_data_y = namedtuple("acceleration_data_y", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-    acceleration_data_z = namedtuple("acceleration_data_z", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-    return acceleration_data(acceleration_data_x(*acceleration_dataframes_x), acceleration_data_y(*acceleration_dataframes_y), acceleration_data_z(*acceleration_dataframes_z))
+    return _load_data(parent_folder, 'acceleration')
 
 
 
@@ -397,63 +500,7 @@ def get_velocity_data(parent_folder: str) -> NamedTuple:
         2   3.0        3.0        3.0
     ```
     """
-    velocity_data_files = get_velocity_data_files(parent_folder)
-    velocity_dataframes_x = []
-    for file in velocity_data_files.x:
-        with open(f"{parent_folder}/data/velocity/{file}", 'r') as f:
-            lines = f.readlines()
-        with open(f"{parent_folder}/data/velocity/{file}", 'w') as f:
-            for line in lines:
-                if line == lines[0]:
-                    f.write("\tFrequency [Hz]\tAmplitude [m/s]\tPhase Angle [deg]\n")
-                else:
-                    f.write(line)
-                # if 'Angle' in line:
-                #     f.write(line[:line.find('Angle')+5] + ' [deg]\n')
-                # else:
-                #     f.write(line)
-        df = pd.read_csv(f"{parent_folder}/data/velocity/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-        # df = pd.read_csv(f"{parent_folder}/data/velocity/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'], index_col=0)
-        velocity_dataframes_x.append(df)
-    velocity_dataframes_y = []
-    for file in velocity_data_files.y:
-        with open(f"{parent_folder}/data/velocity/{file}", 'r') as f:
-            lines = f.readlines()
-        with open(f"{parent_folder}/data/velocity/{file}", 'w') as f:
-            for line in lines:
-                if line == lines[0]:
-                    f.write("\tFrequency [Hz]\tAmplitude [m/s]\tPhase Angle [deg]\n")
-                else:
-                    f.write(line)
-                # if 'Angle' in line:
-                #     f.write(line[:line.find('Angle')+5] + ' [deg]\n')
-                # else:
-                #     f.write(line)
-        df = pd.read_csv(f"{parent_folder}/data/velocity/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-        # df = pd.read_csv(f"{parent_folder}/data/velocity/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'], index_col=0)
-        velocity_dataframes_y.append(df)
-    velocity_dataframes_z = []
-    for file in velocity_data_files.z:
-        with open(f"{parent_folder}/data/velocity/{file}", 'r') as f:
-            lines = f.readlines()
-        with open(f"{parent_folder}/data/velocity/{file}", 'w') as f:
-            for line in lines:
-                if line == lines[0]:
-                    f.write("\tFrequency [Hz]\tAmplitude [m/s]\tPhase Angle [deg]\n")
-                else:
-                    f.write(line)
-                # if 'Angle' in line:
-                #     f.write(line[:line.find('Angle')+5] + ' [deg]\n')
-                # else:
-                #     f.write(line)
-        df = pd.read_csv(f"{parent_folder}/data/velocity/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'])
-        # df = pd.read_csv(f"{parent_folder}/data/velocity/{file}", sep=r'\s+', skiprows=1, names=['Frequency', 'Amplitude', 'Phase Angle'], index_col=0)
-        velocity_dataframes_z.append(df)
-    velocity_data = namedtuple("velocity_data", ["x", "y", "z"])
-    velocity_data_x = namedtuple("velocity_data_x", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-    velocity_data_y = namedtuple("velocity_data_y", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-    velocity_data_z = namedtuple("velocity_data_z", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-    return velocity_data(velocity_data_x(*velocity_dataframes_x), velocity_data_y(*velocity_dataframes_y), velocity_data_z(*velocity_dataframes_z))
+    return _load_data(parent_folder, 'velocity')
 
 
 
@@ -521,20 +568,21 @@ def describe(data: NamedTuple, data_type: str, axis: str, save_as: str = None) -
     - `axis`: The axis of the data. Must be one of `["x", "y", "z"]`.
     - `save_as` (Optional): If provided, the descriptive data will be saved as a file with the given name.
     """
+    descriptions = data.describe() if isinstance(data, _AxisData) else [d.describe() for d in data]
     if not save_as:
         print("\n")
-        for i, d in enumerate(data):
+        for i, d in enumerate(descriptions):
             print(f"DIMM{i+1}")
-            print(d.describe())
+            print(d)
             print("\n")
     if save_as:
         if '.txt' not in save_as:
             save_as += '.txt'
         print(f"{data_type.title()} ({axis.title()}) Description\n" + ('-'*(len(data_type) + 16)) + '\n\n', file=open(save_as, 'w'))
         with open(save_as, 'a') as f:
-            for i, d in enumerate(data):
+            for i, d in enumerate(descriptions):
                 print(f"DIMM{i+1}\n" + ('-'*5), file=f)
-                print(d.describe(), file=f)
+                print(d, file=f)
                 if i != 7: print("\n\n", file=f)
 
 
@@ -543,103 +591,74 @@ def describe(data: NamedTuple, data_type: str, axis: str, save_as: str = None) -
 
 
 
+def _read_description(filepath: str, columns: list[str]) -> pd.DataFrame:
+    """
+    Reads the statistics (mean to max) of each DIMM from a description file written by `describe`.
+    The rows of all 8 DIMMs are parsed in one go, into one DataFrame with a 'DIMM' column saying which DIMM each row is from.
+
+    ## Parameters
+    - `filepath`: The path of the description file.
+    - `columns`: The names of the data columns, in the order they appear in the file.
+    """
+    # From line 6 on, each DIMM block is 14 lines: the column names and the count, then the 7 statistics, and the spacing
+    # and the next DIMM's name. Only the statistics are parsed, straight from the file by the C parser.
+    df = pd.read_csv(filepath, sep=r'\s+', header=None, usecols=range(1, len(columns) + 1), names=['Statistic', *columns],
+                     skiprows=lambda line: not (line >= 6 and 2 <= (line - 6) % 14 <= 8))
+    df.insert(0, 'DIMM', np.arange(len(df)) // 7 + 1)
+    return df
+
+
+
+
+
+
+
+def _split_dimms(df: pd.DataFrame) -> list[pd.DataFrame]:
+    """
+    Splits a DataFrame read by `_read_description` back up into one DataFrame per DIMM, in DIMM order.
+    """
+    return [dimm.drop(columns='DIMM').reset_index(drop=True) for _, dimm in df.groupby('DIMM', sort=False)]
+
+
+
+
+
+
+
+def _format_description(df: pd.DataFrame, formats: dict) -> pd.DataFrame:
+    """
+    Formats the statistics read by `_read_description` as the fixed-width strings they're shown and written to Google Sheets as.
+    Every column is formatted in one vectorized pass, as declared by `formats`, with no Python call per value.
+
+    ## Parameters
+    - `df`: The statistics of all 8 DIMMs, as returned by `_read_description`.
+    - `formats`: Column name -> (printf-style format, width) of the numeric columns. The 'Phase_Angle' column is always formatted
+        to 3 decimals, keeping 6 characters when negative and 5 otherwise.
+    """
+    # Casting to a fixed-width string dtype cuts each formatted value to that width in the same pass
+    df = df.assign(**{column: np.char.mod(fmt, df[column].to_numpy()).astype(f'U{width}') for column, (fmt, width) in formats.items()})
+    # Negative phase angles keep one more character, for the sign. Both widths are cut for every value, and picked between
+    # by a mask from the float values, rather than parsing the strings back (values that round to '-0.000' don't count as negative)
+    phase_angles = df['Phase_Angle'].to_numpy()
+    phase = np.char.mod('%.3f', phase_angles)
+    df['Phase_Angle'] = np.where((phase_angles < 0) & (phase != '-0.000'), phase.astype('U6'), phase.astype('U5'))
+    return df
+
+
+
+
+
+
+
 def load_dfs_from_description__acceleration(filepath: str) -> NamedTuple:
     """
     Loads the acceleration DIMM data from a description file.
     """
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
-    lines = [line.strip() for line in lines]
-    lines = lines[6:]
-    DIMM1_lines = lines[:9]
-    DIMM2_lines = lines[14:23]
-    DIMM3_lines = lines[28:37]
-    DIMM4_lines = lines[42:51]
-    DIMM5_lines = lines[56:65]
-    DIMM6_lines = lines[70:79]
-    DIMM7_lines = lines[84:93]
-    DIMM8_lines = lines[98:107]
-
-    def d(lines):
-        lines[0] = '\t' + lines[0]
-        lines = lines[:1] + lines[2:]
-        return lines
-    
-    DIMM1_lines = d(DIMM1_lines)
-    DIMM2_lines = d(DIMM2_lines)
-    DIMM3_lines = d(DIMM3_lines)
-    DIMM4_lines = d(DIMM4_lines)
-    DIMM5_lines = d(DIMM5_lines)
-    DIMM6_lines = d(DIMM6_lines)
-    DIMM7_lines = d(DIMM7_lines)
-    DIMM8_lines = d(DIMM8_lines)
-
-    def to_df(lines):
-        """
-        Structure of lines:
-        lines[0] = '\t' + "Frequency" + '\t' + "Amplitude_g" + '\t' + "Amplitude" + '\t' + "Phase Angle"
-        lines[1] = "mean" + '\t' + str(mean) + '\t' + str(mean) + '\t' + str(mean) + '\t' + str(mean)
-        lines[2] = "std" + '\t' + str(std) + '\t' + str(std) + '\t' + str(std) + '\t' + str(std)
-        lines[3] = "min" + '\t' + str(min) + '\t' + str(min) + '\t' + str(min) + '\t' + str(min)
-        lines[4] = "25%" + '\t' + str(25%) + '\t' + str(25%) + '\t' + str(25%) + '\t' + str(25%)
-        lines[5] = "50%" + '\t' + str(50%) + '\t' + str(50%) + '\t' + str(50%) + '\t' + str(50%)
-        lines[6] = "75%" + '\t' + str(75%) + '\t' + str(75%) + '\t' + str(75%) + '\t' + str(75%)
-        lines[7] = "max" + '\t' + str(max) + '\t' + str(max) + '\t' + str(max) + '\t' + str(max)
-        """
-        rows = [line.split(r'\s+') for line in lines]
-        rows = [r[0] for r in rows]
-        columns = rows[0].split('\t')
-        columns = [c.split(' ') for c in columns[1:]][0]
-        columns = columns[:-1]
-        columns[-1] = columns[-1] + "_Angle"
-        newcolumns = []
-        for c in columns:
-            if len(c) > 1:
-                newcolumns.append(c)
-        columns = newcolumns
-        rows = rows[1:]
-        rows = [r.split(' ') for r in rows]
-        rows = [r[1:] for r in rows]
-        newrows = []
-        for r in rows:
-            r3 = []
-            for r2 in r:
-                if len(r2) > 1:
-                    r3.append(r2)
-            newrows.append(r3)
-        rows = newrows
-        df = pd.DataFrame(rows, columns=columns)
-        columns = list(df.columns)
-        columns[1], columns[2] = columns[2], columns[1]
-        rows = df.values.tolist()
-        for r in rows:
-            r[1], r[2] = r[2], r[1]
-        df2 = pd.DataFrame(rows, columns=columns)
-        df2['Frequency'] = df2['Frequency'].astype(float).map(lambda x: '{:.4f}'.format(x))
-        df2['Frequency'] = df2['Frequency'].astype(str)
-        df2['Frequency'] = df2['Frequency'].map(lambda x: x[:5])
-        df2['Amplitude'] = df2['Amplitude'].astype(float).map(lambda x: '{:.4f}'.format(round(x, 4)))
-        df2['Amplitude'] = df2['Amplitude'].astype(str)
-        df2['Amplitude'] = df2['Amplitude'].map(lambda x: x[:6])
-        df2['Amplitude_g'] = df2['Amplitude_g'].astype(float).map(lambda x: '{:.4f}'.format(round(x, 4)))
-        df2['Amplitude_g'] = df2['Amplitude_g'].astype(str)
-        df2['Amplitude_g'] = df2['Amplitude_g'].map(lambda x: x[:6])
-        df2['Phase_Angle'] = df2['Phase_Angle'].astype(float).map(lambda x: '{:.4f}'.format(round(x, 3)))
-        df2['Phase_Angle'] = df2['Phase_Angle'].astype(str)
-        df2['Phase_Angle'] = df2['Phase_Angle'].map(lambda x: x[:6] if float(x) < 0 else x[:5])
-        return df2
-    
-    DIMM1_df = to_df(DIMM1_lines)
-    DIMM2_df = to_df(DIMM2_lines)
-    DIMM3_df = to_df(DIMM3_lines)
-    DIMM4_df = to_df(DIMM4_lines)
-    DIMM5_df = to_df(DIMM5_lines)
-    DIMM6_df = to_df(DIMM6_lines)
-    DIMM7_df = to_df(DIMM7_lines)
-    DIMM8_df = to_df(DIMM8_lines)
-
-    acceleration_data = namedtuple("acceleration_data", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-    return acceleration_data(DIMM1_df, DIMM2_df, DIMM3_df, DIMM4_df, DIMM5_df, DIMM6_df, DIMM7_df, DIMM8_df)
+    df = _read_description(filepath, ['Frequency', 'Amplitude_g', 'Amplitude', 'Phase_Angle'])
+    # All 8 DIMMs are formatted together, with the amplitude columns swapped back into order, and only split up at the end
+    df = _format_description(df[['DIMM', *_ACCELERATION_DESCRIPTION_COLUMNS]],
+                             {'Frequency': ('%.4f', 5), 'Amplitude': ('%.4f', 6), 'Amplitude_g': ('%.4f', 6)})
+    return DIMM_Descriptions(*_split_dimms(df))
 
 
 
@@ -652,99 +671,11 @@ def load_dfs_from_description__velocity_deformation(filepath: str) -> NamedTuple
     """
     Loads the velocity DIMM data from a description file.
     """
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
-    lines = [line.strip() for line in lines]
-    lines = lines[6:]
-    DIMM1_lines = lines[:9]
-    DIMM2_lines = lines[14:23]
-    DIMM3_lines = lines[28:37]
-    DIMM4_lines = lines[42:51]
-    DIMM5_lines = lines[56:65]
-    DIMM6_lines = lines[70:79]
-    DIMM7_lines = lines[84:93]
-    DIMM8_lines = lines[98:107]
-
-    def d(lines):
-        lines[0] = '\t' + lines[0]
-        lines = lines[:1] + lines[2:]
-        return lines
-    
-    DIMM1_lines = d(DIMM1_lines)
-    DIMM2_lines = d(DIMM2_lines)
-    DIMM3_lines = d(DIMM3_lines)
-    DIMM4_lines = d(DIMM4_lines)
-    DIMM5_lines = d(DIMM5_lines)
-    DIMM6_lines = d(DIMM6_lines)
-    DIMM7_lines = d(DIMM7_lines)
-    DIMM8_lines = d(DIMM8_lines)
-
-    def to_df(lines):
-        """
-        Structure of lines:
-        lines[0] = '\t' + "Frequency" + '\t' + "Amplitude" + '\t' + "Phase Angle"
-        lines[1] = "mean" + '\t' + str(mean) + '\t' + str(mean) + '\t' + str(mean)
-        lines[2] = "std" + '\t' + str(std) + '\t' + str(std) + '\t' + str(std)
-        lines[3] = "min" + '\t' + str(min) + '\t' + str(min) + '\t' + str(min)
-        lines[4] = "25%" + '\t' + str(25%) + '\t' + str(25%) + '\t' + str(25%)
-        lines[5] = "50%" + '\t' + str(50%) + '\t' + str(50%) + '\t' + str(50%)
-        lines[6] = "75%" + '\t' + str(75%) + '\t' + str(75%) + '\t' + str(75%)
-        lines[7] = "max" + '\t' + str(max) + '\t' + str(max) + '\t' + str(max)
-        """
-        rows = [line.split(r'\s+') for line in lines]
-        rows = [r[0] for r in rows]
-        columns = rows[0].split('\t')
-        columns = [c.split(' ') for c in columns[1:]][0]
-        columns = columns[:-1]
-        columns[-1] = columns[-1] + "_Angle"
-        newcolumns = []
-        for c in columns:
-            if len(c) > 1:
-                newcolumns.append(c)
-        columns = newcolumns
-        rows = rows[1:]
-        rows = [r.split(' ') for r in rows]
-        rows = [r[1:] for r in rows]
-        newrows = []
-        for r in rows:
-            r3 = []
-            for r2 in r:
-                if len(r2) > 1:
-                    r3.append(r2)
-            newrows.append(r3)
-        rows = newrows
-        df = pd.DataFrame(rows, columns=columns)
-        # columns = list(df.columns)
-        # columns[1], columns[2] = columns[2], columns[1]
-        # rows = df.values.tolist()
-        # for r in rows:
-        #     r[1], r[2] = r[2], r[1]
-        df2 = pd.DataFrame(rows, columns=columns)
-        df2['Frequency'] = df2['Frequency'].astype(float).map(lambda x: '{:.4f}'.format(x))
-        df2['Frequency'] = df2['Frequency'].astype(str)
-        df2['Frequency'] = df2['Frequency'].map(lambda x: x[:5])
-        df2['Amplitude'] = df2['Amplitude'].astype(float).map(lambda x: '{:.6f}'.format(round(x, 6)))
-        df2['Amplitude'] = df2['Amplitude'].astype(str)
-        df2['Amplitude'] = df2['Amplitude'].map(lambda x: x[:8])
-        # df2['Amplitude_g'] = df2['Amplitude_g'].astype(float).map(lambda x: '{:.4f}'.format(round(x, 4)))
-        # df2['Amplitude_g'] = df2['Amplitude_g'].astype(str)
-        # df2['Amplitude_g'] = df2['Amplitude_g'].map(lambda x: x[:6])
-        df2['Phase_Angle'] = df2['Phase_Angle'].astype(float).map(lambda x: '{:.4f}'.format(round(x, 3)))
-        df2['Phase_Angle'] = df2['Phase_Angle'].astype(str)
-        df2['Phase_Angle'] = df2['Phase_Angle'].map(lambda x: x[:6] if float(x) < 0 else x[:5])
-        return df2
-    
-    DIMM1_df = to_df(DIMM1_lines)
-    DIMM2_df = to_df(DIMM2_lines)
-    DIMM3_df = to_df(DIMM3_lines)
-    DIMM4_df = to_df(DIMM4_lines)
-    DIMM5_df = to_df(DIMM5_lines)
-    DIMM6_df = to_df(DIMM6_lines)
-    DIMM7_df = to_df(DIMM7_lines)
-    DIMM8_df = to_df(DIMM8_lines)
+    df = _read_description(filepath, _DESCRIPTION_COLUMNS)
+    # All 8 DIMMs are formatted together, and only split up at the end
+    df = _format_description(df, {'Frequency': ('%.4f', 5), 'Amplitude': ('%.6f', 8)})
+    return DIMM_Descriptions(*_split_dimms(df))
 
-    acceleration_data = namedtuple("acceleration_data", ["DIMM1", "DIMM2", "DIMM3", "DIMM4", "DIMM5", "DIMM6", "DIMM7", "DIMM8"])
-    return acceleration_data(DIMM1_df, DIMM2_df, DIMM3_df, DIMM4_df, DIMM5_df, DIMM6_df, DIMM7_df, DIMM8_df)
 
 
 
@@ -753,176 +684,112 @@ def load_dfs_from_description__velocity_deformation(filepath: str) -> NamedTuple
 
 
 
+def load_descriptions(sim_folder_name: str) -> dict:
+    """
+    Loads all nine description files of a simulation (velocity, deformation and acceleration, for X, Y and Z), keyed by
+    `(data_type, axis)`. Parsing them is bound by pandas' Python-side overhead rather than I/O, so a pool of threads
+    doesn't load them any faster than this loop does.
 
-def write_dfs_to_google_sheets__acceleration(df_namedtuple: NamedTuple) -> None:
+    ## Parameters
+    - `sim_folder_name`: The name of the simulation folder (e.g. "sim1", "sim2", etc.).
     """
-    Writes the acceleration data to Google Sheets.
+    loaders = {
+        'velocity': load_dfs_from_description__velocity_deformation,
+        'deformation': load_dfs_from_description__velocity_deformation,
+        'acceleration': load_dfs_from_description__acceleration,
+    }
+    return {
+        (data_type, axis): load(f"{sim_folder_name}/data/{data_type}_{axis}_description.txt")
+        for data_type, load in loaders.items() for axis in "xyz"
+    }
+
+
+
+
+
+
+
+
+
+def _sheet_block(df: pd.DataFrame, columns: tuple[str, ...]) -> list[list[str]]:
+    """
+    Returns the rows of a DIMM's block in a description sheet: the column names, then its 7 statistics (as formatted by the loaders).
+    The rows are taken out of the DataFrame in one go, rather than looking up each cell.
+    """
+    return [list(columns)] + df.loc[:6, list(columns)].values.tolist()
+
+
+
+
+
+
+
+def _write_description_sheet(df_namedtuple: NamedTuple, columns: tuple[str, ...], sheet) -> None:
+    """
+    Clears a Google Sheet and writes the 8 DIMM descriptions to it, as blocks of the column names and the 7 statistics
+    starting at B1, B12, ... B78. Both `write_dfs_to_google_sheets__*` functions are this, for their columns.
+
+    ## Parameters
+    - `df_namedtuple`: The 8 DIMM descriptions.
+    - `columns`: The columns to write, which are also each block's header row.
+    - `sheet`: The `GoogleSheets` sheet to write to.
     """
-    from stuff import GoogleSheets
-    sheet = GoogleSheets("PythonTest")
     sheet.clear_worksheet()
-    d1, d2, d3, d4, d5, d6, d7, d8 = df_namedtuple
-    sheet.set_acell_contents_range("B1:E8", 
-            [["Frequency", "Amplitude", "Amplitude_g", "Phase_Angle"],
-            [f"{d1['Frequency'][0]}", f"{d1['Amplitude'][0]}", f"{d1['Amplitude_g'][0]}", f"{d1['Phase_Angle'][0]}"],
-            [f"{d1['Frequency'][1]}", f"{d1['Amplitude'][1]}", f"{d1['Amplitude_g'][1]}", f"{d1['Phase_Angle'][1]}"],
-            [f"{d1['Frequency'][2]}", f"{d1['Amplitude'][2]}", f"{d1['Amplitude_g'][2]}", f"{d1['Phase_Angle'][2]}"],
-            [f"{d1['Frequency'][3]}", f"{d1['Amplitude'][3]}", f"{d1['Amplitude_g'][3]}", f"{d1['Phase_Angle'][3]}"],
-            [f"{d1['Frequency'][4]}", f"{d1['Amplitude'][4]}", f"{d1['Amplitude_g'][4]}", f"{d1['Phase_Angle'][4]}"],
-            [f"{d1['Frequency'][5]}", f"{d1['Amplitude'][5]}", f"{d1['Amplitude_g'][5]}", f"{d1['Phase_Angle'][5]}"],
-            [f"{d1['Frequency'][6]}", f"{d1['Amplitude'][6]}", f"{d1['Amplitude_g'][6]}", f"{d1['Phase_Angle'][6]}"]])
-    sheet.set_acell_contents_range("B12:E19", 
-            [["Frequency", "Amplitude", "Amplitude_g", "Phase_Angle"],
-            [f"{d2['Frequency'][0]}", f"{d2['Amplitude'][0]}", f"{d2['Amplitude_g'][0]}", f"{d2['Phase_Angle'][0]}"],
-            [f"{d2['Frequency'][1]}", f"{d2['Amplitude'][1]}", f"{d2['Amplitude_g'][1]}", f"{d2['Phase_Angle'][1]}"],
-            [f"{d2['Frequency'][2]}", f"{d2['Amplitude'][2]}", f"{d2['Amplitude_g'][2]}", f"{d2['Phase_Angle'][2]}"],
-            [f"{d2['Frequency'][3]}", f"{d2['Amplitude'][3]}", f"{d2['Amplitude_g'][3]}", f"{d2['Phase_Angle'][3]}"],
-            [f"{d2['Frequency'][4]}", f"{d2['Amplitude'][4]}", f"{d2['Amplitude_g'][4]}", f"{d2['Phase_Angle'][4]}"],
-            [f"{d2['Frequency'][5]}", f"{d2['Amplitude'][5]}", f"{d2['Amplitude_g'][5]}", f"{d2['Phase_Angle'][5]}"],
-            [f"{d2['Frequency'][6]}", f"{d2['Amplitude'][6]}", f"{d2['Amplitude_g'][6]}", f"{d2['Phase_Angle'][6]}"]])
-    sheet.set_acell_contents_range("B23:E30", 
-            [["Frequency", "Amplitude", "Amplitude_g", "Phase_Angle"],
-            [f"{d3['Frequency'][0]}", f"{d3['Amplitude'][0]}", f"{d3['Amplitude_g'][0]}", f"{d3['Phase_Angle'][0]}"],
-            [f"{d3['Frequency'][1]}", f"{d3['Amplitude'][1]}", f"{d3['Amplitude_g'][1]}", f"{d3['Phase_Angle'][1]}"],
-            [f"{d3['Frequency'][2]}", f"{d3['Amplitude'][2]}", f"{d3['Amplitude_g'][2]}", f"{d3['Phase_Angle'][2]}"],
-            [f"{d3['Frequency'][3]}", f"{d3['Amplitude'][3]}", f"{d3['Amplitude_g'][3]}", f"{d3['Phase_Angle'][3]}"],
-            [f"{d3['Frequency'][4]}", f"{d3['Amplitude'][4]}", f"{d3['Amplitude_g'][4]}", f"{d3['Phase_Angle'][4]}"],
-            [f"{d3['Frequency'][5]}", f"{d3['Amplitude'][5]}", f"{d3['Amplitude_g'][5]}", f"{d3['Phase_Angle'][5]}"],
-            [f"{d3['Frequency'][6]}", f"{d3['Amplitude'][6]}", f"{d3['Amplitude_g'][6]}", f"{d3['Phase_Angle'][6]}"]])
-    sheet.set_acell_contents_range("B34:E41", 
-            [["Frequency", "Amplitude", "Amplitude_g", "Phase_Angle"],
-            [f"{d4['Frequency'][0]}", f"{d4['Amplitude'][0]}", f"{d4['Amplitude_g'][0]}", f"{d4['Phase_Angle'][0]}"],
-            [f"{d4['Frequency'][1]}", f"{d4['Amplitude'][1]}", f"{d4['Amplitude_g'][1]}", f"{d4['Phase_Angle'][1]}"],
-            [f"{d4['Frequency'][2]}", f"{d4['Amplitude'][2]}", f"{d4['Amplitude_g'][2]}", f"{d4['Phase_Angle'][2]}"],
-            [f"{d4['Frequency'][3]}", f"{d4['Amplitude'][3]}", f"{d4['Amplitude_g'][3]}", f"{d4['Phase_Angle'][3]}"],
-            [f"{d4['Frequency'][4]}", f"{d4['Amplitude'][4]}", f"{d4['Amplitude_g'][4]}", f"{d4['Phase_Angle'][4]}"],
-            [f"{d4['Frequency'][5]}", f"{d4['Amplitude'][5]}", f"{d4['Amplitude_g'][5]}", f"{d4['Phase_Angle'][5]}"],
-            [f"{d4['Frequency'][6]}", f"{d4['Amplitude'][6]}", f"{d4['Amplitude_g'][6]}", f"{d4['Phase_Angle'][6]}"]])
-    sheet.set_acell_contents_range("B45:E52", 
-            [["Frequency", "Amplitude", "Amplitude_g", "Phase_Angle"],
-            [f"{d5['Frequency'][0]}", f"{d5['Amplitude'][0]}", f"{d5['Amplitude_g'][0]}", f"{d5['Phase_Angle'][0]}"],
-            [f"{d5['Frequency'][1]}", f"{d5['Amplitude'][1]}", f"{d5['Amplitude_g'][1]}", f"{d5['Phase_Angle'][1]}"],
-            [f"{d5['Frequency'][2]}", f"{d5['Amplitude'][2]}", f"{d5['Amplitude_g'][2]}", f"{d5['Phase_Angle'][2]}"],
-            [f"{d5['Frequency'][3]}", f"{d5['Amplitude'][3]}", f"{d5['Amplitude_g'][3]}", f"{d5['Phase_Angle'][3]}"],
-            [f"{d5['Frequency'][4]}", f"{d5['Amplitude'][4]}", f"{d5['Amplitude_g'][4]}", f"{d5['Phase_Angle'][4]}"],
-            [f"{d5['Frequency'][5]}", f"{d5['Amplitude'][5]}", f"{d5['Amplitude_g'][5]}", f"{d5['Phase_Angle'][5]}"],
-            [f"{d5['Frequency'][6]}", f"{d5['Amplitude'][6]}", f"{d5['Amplitude_g'][6]}", f"{d5['Phase_Angle'][6]}"]])
-    sheet.set_acell_contents_range("B56:E63", 
-            [["Frequency", "Amplitude", "Amplitude_g", "Phase_Angle"],
-            [f"{d6['Frequency'][0]}", f"{d6['Amplitude'][0]}", f"{d6['Amplitude_g'][0]}", f"{d6['Phase_Angle'][0]}"],
-            [f"{d6['Frequency'][1]}", f"{d6['Amplitude'][1]}", f"{d6['Amplitude_g'][1]}", f"{d6['Phase_Angle'][1]}"],
-            [f"{d6['Frequency'][2]}", f"{d6['Amplitude'][2]}", f"{d6['Amplitude_g'][2]}", f"{d6['Phase_Angle'][2]}"],
-            [f"{d6['Frequency'][3]}", f"{d6['Amplitude'][3]}", f"{d6['Amplitude_g'][3]}", f"{d6['Phase_Angle'][3]}"],
-            [f"{d6['Frequency'][4]}", f"{d6['Amplitude'][4]}", f"{d6['Amplitude_g'][4]}", f"{d6['Phase_Angle'][4]}"],
-            [f"{d6['Frequency'][5]}", f"{d6['Amplitude'][5]}", f"{d6['Amplitude_g'][5]}", f"{d6['Phase_Angle'][5]}"],
-            [f"{d6['Frequency'][6]}", f"{d6['Amplitude'][6]}", f"{d6['Amplitude_g'][6]}", f"{d6['Phase_Angle'][6]}"]])
-    sheet.set_acell_contents_range("B67:E74", 
-            [["Frequency", "Amplitude", "Amplitude_g", "Phase_Angle"],
-            [f"{d7['Frequency'][0]}", f"{d7['Amplitude'][0]}", f"{d7['Amplitude_g'][0]}", f"{d7['Phase_Angle'][0]}"],
-            [f"{d7['Frequency'][1]}", f"{d7['Amplitude'][1]}", f"{d7['Amplitude_g'][1]}", f"{d7['Phase_Angle'][1]}"],
-            [f"{d7['Frequency'][2]}", f"{d7['Amplitude'][2]}", f"{d7['Amplitude_g'][2]}", f"{d7['Phase_Angle'][2]}"],
-            [f"{d7['Frequency'][3]}", f"{d7['Amplitude'][3]}", f"{d7['Amplitude_g'][3]}", f"{d7['Phase_Angle'][3]}"],
-            [f"{d7['Frequency'][4]}", f"{d7['Amplitude'][4]}", f"{d7['Amplitude_g'][4]}", f"{d7['Phase_Angle'][4]}"],
-            [f"{d7['Frequency'][5]}", f"{d7['Amplitude'][5]}", f"{d7['Amplitude_g'][5]}", f"{d7['Phase_Angle'][5]}"],
-            [f"{d7['Frequency'][6]}", f"{d7['Amplitude'][6]}", f"{d7['Amplitude_g'][6]}", f"{d7['Phase_Angle'][6]}"]])
-    sheet.set_acell_contents_range("B78:E85", 
-            [["Frequency", "Amplitude", "Amplitude_g", "Phase_Angle"],
-            [f"{d8['Frequency'][0]}", f"{d8['Amplitude'][0]}", f"{d8['Amplitude_g'][0]}", f"{d8['Phase_Angle'][0]}"],
-            [f"{d8['Frequency'][1]}", f"{d8['Amplitude'][1]}", f"{d8['Amplitude_g'][1]}", f"{d8['Phase_Angle'][1]}"],
-            [f"{d8['Frequency'][2]}", f"{d8['Amplitude'][2]}", f"{d8['Amplitude_g'][2]}", f"{d8['Phase_Angle'][2]}"],
-            [f"{d8['Frequency'][3]}", f"{d8['Amplitude'][3]}", f"{d8['Amplitude_g'][3]}", f"{d8['Phase_Angle'][3]}"],
-            [f"{d8['Frequency'][4]}", f"{d8['Amplitude'][4]}", f"{d8['Amplitude_g'][4]}", f"{d8['Phase_Angle'][4]}"],
-            [f"{d8['Frequency'][5]}", f"{d8['Amplitude'][5]}", f"{d8['Amplitude_g'][5]}", f"{d8['Phase_Angle'][5]}"],
-            [f"{d8['Frequency'][6]}", f"{d8['Amplitude'][6]}", f"{d8['Amplitude_g'][6]}", f"{d8['Phase_Angle'][6]}"]])
-
-
-
-
-
-
-
-
-
-def write_dfs_to_google_sheets__velocity_deformation(df_namedtuple: NamedTuple) -> None:
+    # The blocks are 11 rows apart, so rather than one request per block they're written as a single range,
+    # with 3 blank rows between them (the sheet was just cleared, so nothing is overwritten)
+    blank_rows = [[""] * len(columns)] * 3
+    rows = [row for d in df_namedtuple for row in _sheet_block(d, columns) + blank_rows][:-len(blank_rows)]
+    last_column = chr(ord("B") + len(columns) - 1)
+    sheet.set_acell_contents_range(f"B1:{last_column}{len(rows)}", rows)
+
+
+
+
+
+
+
+@lru_cache(maxsize=1)
+def _default_sheet():
     """
-    Writes the velocity and deformation data to Google Sheets.
+    Returns the "PythonTest" Google Sheet the descriptions are written to, connecting to it only the first time it's needed.
+    `stuff` is only imported then too, so the rest of this module works without it.
     """
     from stuff import GoogleSheets
-    sheet = GoogleSheets("PythonTest")
-    sheet.clear_worksheet()
-    d1, d2, d3, d4, d5, d6, d7, d8 = df_namedtuple
-    sheet.set_acell_contents_range("B1:D8", 
-            [["Frequency", "Amplitude", "Phase_Angle"],
-            [f"{d1['Frequency'][0]}", f"{d1['Amplitude'][0]}", f"{d1['Phase_Angle'][0]}"],
-            [f"{d1['Frequency'][1]}", f"{d1['Amplitude'][1]}", f"{d1['Phase_Angle'][1]}"],
-            [f"{d1['Frequency'][2]}", f"{d1['Amplitude'][2]}", f"{d1['Phase_Angle'][2]}"],
-            [f"{d1['Frequency'][3]}", f"{d1['Amplitude'][3]}", f"{d1['Phase_Angle'][3]}"],
-            [f"{d1['Frequency'][4]}", f"{d1['Amplitude'][4]}", f"{d1['Phase_Angle'][4]}"],
-            [f"{d1['Frequency'][5]}", f"{d1['Amplitude'][5]}", f"{d1['Phase_Angle'][5]}"],
-            [f"{d1['Frequency'][6]}", f"{d1['Amplitude'][6]}", f"{d1['Phase_Angle'][6]}"]])
-    sheet.set_acell_contents_range("B12:D19", 
-            [["Frequency", "Amplitude", "Phase_Angle"],
-            [f"{d2['Frequency'][0]}", f"{d2['Amplitude'][0]}", f"{d2['Phase_Angle'][0]}"],
-            [f"{d2['Frequency'][1]}", f"{d2['Amplitude'][1]}", f"{d2['Phase_Angle'][1]}"],
-            [f"{d2['Frequency'][2]}", f"{d2['Amplitude'][2]}", f"{d2['Phase_Angle'][2]}"],
-            [f"{d2['Frequency'][3]}", f"{d2['Amplitude'][3]}", f"{d2['Phase_Angle'][3]}"],
-            [f"{d2['Frequency'][4]}", f"{d2['Amplitude'][4]}", f"{d2['Phase_Angle'][4]}"],
-            [f"{d2['Frequency'][5]}", f"{d2['Amplitude'][5]}", f"{d2['Phase_Angle'][5]}"],
-            [f"{d2['Frequency'][6]}", f"{d2['Amplitude'][6]}", f"{d2['Phase_Angle'][6]}"]])
-    sheet.set_acell_contents_range("B23:D30", 
-            [["Frequency", "Amplitude", "Phase_Angle"],
-            [f"{d3['Frequency'][0]}", f"{d3['Amplitude'][0]}", f"{d3['Phase_Angle'][0]}"],
-            [f"{d3['Frequency'][1]}", f"{d3['Amplitude'][1]}", f"{d3['Phase_Angle'][1]}"],
-            [f"{d3['Frequency'][2]}", f"{d3['Amplitude'][2]}", f"{d3['Phase_Angle'][2]}"],
-            [f"{d3['Frequency'][3]}", f"{d3['Amplitude'][3]}", f"{d3['Phase_Angle'][3]}"],
-            [f"{d3['Frequency'][4]}", f"{d3['Amplitude'][4]}", f"{d3['Phase_Angle'][4]}"],
-            [f"{d3['Frequency'][5]}", f"{d3['Amplitude'][5]}", f"{d3['Phase_Angle'][5]}"],
-            [f"{d3['Frequency'][6]}", f"{d3['Amplitude'][6]}", f"{d3['Phase_Angle'][6]}"]])
-    sheet.set_acell_contents_range("B34:D41", 
-            [["Frequency", "Amplitude", "Phase_Angle"],
-            [f"{d4['Frequency'][0]}", f"{d4['Amplitude'][0]}", f"{d4['Phase_Angle'][0]}"],
-            [f"{d4['Frequency'][1]}", f"{d4['Amplitude'][1]}", f"{d4['Phase_Angle'][1]}"],
-            [f"{d4['Frequency'][2]}", f"{d4['Amplitude'][2]}", f"{d4['Phase_Angle'][2]}"],
-            [f"{d4['Frequency'][3]}", f"{d4['Amplitude'][3]}", f"{d4['Phase_Angle'][3]}"],
-            [f"{d4['Frequency'][4]}", f"{d4['Amplitude'][4]}", f"{d4['Phase_Angle'][4]}"],
-            [f"{d4['Frequency'][5]}", f"{d4['Amplitude'][5]}", f"{d4['Phase_Angle'][5]}"],
-            [f"{d4['Frequency'][6]}", f"{d4['Amplitude'][6]}", f"{d4['Phase_Angle'][6]}"]])
-    sheet.set_acell_contents_range("B45:D52", 
-            [["Frequency", "Amplitude", "Phase_Angle"],
-            [f"{d5['Frequency'][0]}", f"{d5['Amplitude'][0]}", f"{d5['Phase_Angle'][0]}"],
-            [f"{d5['Frequency'][1]}", f"{d5['Amplitude'][1]}", f"{d5['Phase_Angle'][1]}"],
-            [f"{d5['Frequency'][2]}", f"{d5['Amplitude'][2]}", f"{d5['Phase_Angle'][2]}"],
-            [f"{d5['Frequency'][3]}", f"{d5['Amplitude'][3]}", f"{d5['Phase_Angle'][3]}"],
-            [f"{d5['Frequency'][4]}", f"{d5['Amplitude'][4]}", f"{d5['Phase_Angle'][4]}"],
-            [f"{d5['Frequency'][5]}", f"{d5['Amplitude'][5]}", f"{d5['Phase_Angle'][5]}"],
-            [f"{d5['Frequency'][6]}", f"{d5['Amplitude'][6]}", f"{d5['Phase_Angle'][6]}"]])
-    sheet.set_acell_contents_range("B56:D63", 
-            [["Frequency", "Amplitude", "Phase_Angle"],
-            [f"{d6['Frequency'][0]}", f"{d6['Amplitude'][0]}", f"{d6['Phase_Angle'][0]}"],
-            [f"{d6['Frequency'][1]}", f"{d6['Amplitude'][1]}", f"{d6['Phase_Angle'][1]}"],
-            [f"{d6['Frequency'][2]}", f"{d6['Amplitude'][2]}", f"{d6['Phase_Angle'][2]}"],
-            [f"{d6['Frequency'][3]}", f"{d6['Amplitude'][3]}", f"{d6['Phase_Angle'][3]}"],
-            [f"{d6['Frequency'][4]}", f"{d6['Amplitude'][4]}", f"{d6['Phase_Angle'][4]}"],
-            [f"{d6['Frequency'][5]}", f"{d6['Amplitude'][5]}", f"{d6['Phase_Angle'][5]}"],
-            [f"{d6['Frequency'][6]}", f"{d6['Amplitude'][6]}", f"{d6['Phase_Angle'][6]}"]])
-    sheet.set_acell_contents_range("B67:D74", 
-            [["Frequency", "Amplitude", "Phase_Angle"],
-            [f"{d7['Frequency'][0]}", f"{d7['Amplitude'][0]}", f"{d7['Phase_Angle'][0]}"],
-            [f"{d7['Frequency'][1]}", f"{d7['Amplitude'][1]}", f"{d7['Phase_Angle'][1]}"],
-            [f"{d7['Frequency'][2]}", f"{d7['Amplitude'][2]}", f"{d7['Phase_Angle'][2]}"],
-            [f"{d7['Frequency'][3]}", f"{d7['Amplitude'][3]}", f"{d7['Phase_Angle'][3]}"],
-            [f"{d7['Frequency'][4]}", f"{d7['Amplitude'][4]}", f"{d7['Phase_Angle'][4]}"],
-            [f"{d7['Frequency'][5]}", f"{d7['Amplitude'][5]}", f"{d7['Phase_Angle'][5]}"],
-            [f"{d7['Frequency'][6]}", f"{d7['Amplitude'][6]}", f"{d7['Phase_Angle'][6]}"]])
-    sheet.set_acell_contents_range("B78:D85", 
-            [["Frequency", "Amplitude", "Phase_Angle"],
-            [f"{d8['Frequency'][0]}", f"{d8['Amplitude'][0]}", f"{d8['Phase_Angle'][0]}"],
-            [f"{d8['Frequency'][1]}", f"{d8['Amplitude'][1]}", f"{d8['Phase_Angle'][1]}"],
-            [f"{d8['Frequency'][2]}", f"{d8['Amplitude'][2]}", f"{d8['Phase_Angle'][2]}"],
-            [f"{d8['Frequency'][3]}", f"{d8['Amplitude'][3]}", f"{d8['Phase_Angle'][3]}"],
-            [f"{d8['Frequency'][4]}", f"{d8['Amplitude'][4]}", f"{d8['Phase_Angle'][4]}"],
-            [f"{d8['Frequency'][5]}", f"{d8['Amplitude'][5]}", f"{d8['Phase_Angle'][5]}"],
-            [f"{d8['Frequency'][6]}", f"{d8['Amplitude'][6]}", f"{d8['Phase_Angle'][6]}"]])
+    return GoogleSheets("PythonTest")
+
+
+
+
+
+
+
+def write_dfs_to_google_sheets__acceleration(df_namedtuple: NamedTuple, sheet=None) -> None:
+    """
+    Writes the acceleration data to Google Sheets.
+
+    ## Parameters
+    - `df_namedtuple`: The 8 DIMM descriptions, as loaded by `load_dfs_from_description__acceleration`.
+    - `sheet` (Optional): The `GoogleSheets` sheet to write to. Defaults to the "PythonTest" sheet, which is only connected to once.
+    """
+    _write_description_sheet(df_namedtuple, _ACCELERATION_DESCRIPTION_COLUMNS, sheet or _default_sheet())
+
+
+
+
+
+
+
+
+
+def write_dfs_to_google_sheets__velocity_deformation(df_namedtuple: NamedTuple, sheet=None) -> None:
+    """
+    Writes the velocity and deformation data to Google Sheets.
+
+    ## Parameters
+    - `df_namedtuple`: The 8 DIMM descriptions, as loaded by `load_dfs_from_description__velocity_deformation`.
+    - `sheet` (Optional): The `GoogleSheets` sheet to write to. Defaults to the "PythonTest" sheet, which is only connected to once.
+    """
+    _write_description_sheet(df_namedtuple, _DESCRIPTION_COLUMNS, sheet or _default_sheet())
 
 
 
@@ -1021,11 +888,10 @@ def get_modal_frequencies(sim_folder_name: str) -> list[float]:
     with open(f"{sim_folder_name}/modes.txt") as f:
         lines = f.readlines()
     lines = [line.strip() for line in lines]
-    col_names = lines[0].split('\t')
-    rows = [line.split('\t') for line in lines[1:]]
-    df = pd.DataFrame(rows, columns=col_names)
-    modes = [float(mode) for mode in df['Frequency'].tolist()]
-    return modes
+    frequency_column = lines[0].split('\t').index('Frequency')
+    rows = lines[1:]
+    modes = np.fromiter((row.split('\t')[frequency_column] for row in rows), dtype=np.float64, count=len(rows))
+    return modes.tolist()
 
 
 
@@ -1036,17 +902,13 @@ def get_modal_frequencies(sim_folder_name: str) -> list[float]:
 if __name__ == "__main__":
     SIM_FOLDER_NAME = "sim5"
 
-    # data_files = load_dfs_from_description__acceleration("sim5/data/acceleration_z_description.txt")
-    # write_dfs_to_google_sheets__acceleration(data_files)
-    # data_files = load_dfs_from_description__velocity_deformation("sim5/data/velocity_x_description.txt")
-    # write_dfs_to_google_sheets__velocity_deformation(data_files)
-    # data_files = load_dfs_from_description__velocity_deformation("sim5/data/velocity_y_description.txt")
-    # write_dfs_to_google_sheets__velocity_deformation(data_files)
-    # data_files = load_dfs_from_description__velocity_deformation("sim5/data/velocity_z_description.txt")
-    # write_dfs_to_google_sheets__velocity_deformation(data_files)
-    # data_files = load_dfs_from_description__velocity_deformation("sim5/data/deformation_x_description.txt")
-    # write_dfs_to_google_sheets__velocity_deformation(data_files)
-    # data_files = load_dfs_from_description__velocity_deformation("sim5/data/deformation_y_description.txt")
-    # write_dfs_to_google_sheets__velocity_deformation(data_files)
-    # data_files = load_dfs_from_description__velocity_deformation("sim5/data/deformation_z_description.txt")
-    # write_dfs_to_google_sheets__velocity_deformation(data_files)
+    # Every write clears and fills the same "PythonTest" worksheet, so the descriptions have to be written one at a time,
+    # copying each sheet's contents out before writing the next
+    # descriptions = load_descriptions(SIM_FOLDER_NAME)
+    # write_dfs_to_google_sheets__acceleration(descriptions['acceleration', 'z'])
+    # write_dfs_to_google_sheets__velocity_deformation(descriptions['velocity', 'x'])
+    # write_dfs_to_google_sheets__velocity_deformation(descriptions['velocity', 'y'])
+    # write_dfs_to_google_sheets__velocity_deformation(descriptions['velocity', 'z'])
+    # write_dfs_to_google_sheets__velocity_deformation(descriptions['deformation', 'x'])
+    # write_dfs_to_google_sheets__velocity_deformation(descriptions['deformation', 'y'])
+    # write_dfs_to_google_sheets__velocity_deformation(descriptions['deformation', 'z'])